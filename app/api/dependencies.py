@@ -1,12 +1,15 @@
+from typing import AsyncIterator
+
 from fastapi import Depends, HTTPException, Request
 from fastapi.security import OAuth2PasswordBearer
 
 from app.api.schemas.user import UserResponse
+from app.core.config import settings
 from app.db.models import UserRole
 from app.errors.exceptions import ForbiddenError, UnauthorizedError, UserNotFoundError
 from app.services.auth_service import AuthService
 from app.services.user_service import UserService
-from app.utils.unitofwork import IUnitOfWork, UnitOfWork
+from app.utils.unitofwork import IUnitOfWork, create_unit_of_work
 
 oauth2_scheme = OAuth2PasswordBearer(tokenUrl="auth/login")
 
@@ -18,11 +21,21 @@ async def get_token_optional(request: Request) -> str | None:
         return None
 
 
-async def get_user_service(uow: IUnitOfWork = Depends(UnitOfWork)) -> UserService:
+async def get_unit_of_work(
+    uow: IUnitOfWork = Depends(create_unit_of_work),
+) -> AsyncIterator[IUnitOfWork]:
+    uow.request_scoped = settings.UOW_REQUEST_SCOPED
+    try:
+        yield uow
+    finally:
+        await uow.close()
+
+
+async def get_user_service(uow: IUnitOfWork = Depends(get_unit_of_work)) -> UserService:
     return UserService(uow)
 
 
-async def get_auth_service(uow: IUnitOfWork = Depends(UnitOfWork)) -> AuthService:
+async def get_auth_service(uow: IUnitOfWork = Depends(get_unit_of_work)) -> AuthService:
     return AuthService(uow)
 
 
@@ -34,6 +47,11 @@ async def get_current_user(
     if token is None:
         return None
 
+    if settings.ACCESS_TOKEN_CLAIMS_MODE:
+        principal = auth_service.get_principal_from_token(token)
+        if principal is not None:
+            return principal
+
     sub = auth_service.verify_access_token(token)
 
     try:
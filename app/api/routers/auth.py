@@ -1,7 +1,7 @@
-from fastapi import APIRouter, Depends
+from fastapi import APIRouter, BackgroundTasks, Depends, Request, Response, status
 
 from app.api.dependencies import get_auth_service
-from app.api.schemas.auth import AccessTokenResponse, RefreshTokenRequest, TokenPair
+from app.api.schemas.auth import RefreshTokenRequest, TokenPair
 from app.api.schemas.user import UserCreate, UserLogin, UserResponse
 from app.services.auth_service import AuthService
 
@@ -17,14 +17,27 @@ async def register(
 
 @auth_router.post("/login")
 async def login(
-    credentials: UserLogin, auth_service: AuthService = Depends(get_auth_service)
+    credentials: UserLogin,
+    request: Request,
+    background_tasks: BackgroundTasks,
+    auth_service: AuthService = Depends(get_auth_service),
 ) -> TokenPair:
-    return await auth_service.login(credentials)
+    client_ip = request.client.host if request.client else None
+    return await auth_service.login(credentials, client_ip, background_tasks)
 
 
 @auth_router.post("/refresh")
 async def refresh_access_token(
     refresh_token: RefreshTokenRequest,
     auth_service: AuthService = Depends(get_auth_service),
-) -> AccessTokenResponse:
+) -> TokenPair:
     return await auth_service.refresh(refresh_token)
+
+
+@auth_router.post("/logout", status_code=status.HTTP_204_NO_CONTENT)
+async def logout(
+    refresh_token: RefreshTokenRequest,
+    auth_service: AuthService = Depends(get_auth_service),
+) -> Response:
+    await auth_service.logout(refresh_token)
+    return Response(status_code=status.HTTP_204_NO_CONTENT)
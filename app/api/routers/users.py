@@ -1,29 +1,110 @@
-from fastapi import APIRouter, Depends
+from typing import Literal
 
-from app.api.dependencies import get_current_user, require_admin, require_user
-from app.api.schemas.user import UserResponse
+from fastapi import APIRouter, Depends, Query, Request, Response
+
+from app.api.dependencies import (
+    get_current_user,
+    get_user_service,
+    require_admin,
+    require_user,
+)
+from app.api.schemas.user import BulkImportResult, UserPage, UserResponse
+from app.errors.exceptions import ValidationError
+from app.services.user_service import UserService
+from app.utils.http_cache import NO_STORE, cache_control, conditional_json, weak_etag
 
 user_router = APIRouter(prefix="/api/users", tags=["User"])
 
+USER_FIELDS = frozenset(UserResponse.model_fields)
+
+# Версии представлений входят в ETag: при смене формата ответа поднимаются,
+# чтобы закэшированные клиентами ETag перестали совпадать.
+ME_REPRESENTATION = "me:1"
+ADMIN_REPRESENTATION = "admin:1"
+PUBLIC_REPRESENTATION = "public:1"
+
+
+def principal_etag(user: UserResponse | None, representation: str) -> str:
+    if user is None:
+        return weak_etag(representation)
+    return weak_etag(representation, user.id, user.email, user.role)
+
+
+def parse_fields(
+    fields: str | None = Query(None, description="Поля через запятую: id,email,role"),
+) -> tuple[str, ...] | None:
+    if fields is None:
+        return None
+
+    requested = tuple(dict.fromkeys(f.strip() for f in fields.split(",") if f.strip()))
+    unknown = set(requested) - USER_FIELDS
+    if not requested or unknown:
+        raise ValidationError(detail=f"Unknown fields: {', '.join(sorted(unknown))}")
+    return requested
+
+
+@user_router.get(
+    "", response_model_exclude_unset=True, dependencies=[cache_control(NO_STORE)]
+)
+async def list_users(
+    limit: int = Query(50, ge=1, le=500),
+    cursor: str | None = None,
+    order_by: Literal["id", "email"] = "id",
+    fields: tuple[str, ...] | None = Depends(parse_fields),
+    _: UserResponse = Depends(require_admin),
+    user_service: UserService = Depends(get_user_service),
+) -> UserPage:
+    return await user_service.list_users(
+        limit, cursor=cursor, order_by=order_by, fields=fields
+    )
+
+
+@user_router.post("/import", dependencies=[cache_control(NO_STORE)])
+async def import_users(
+    request: Request,
+    _: UserResponse = Depends(require_admin),
+    user_service: UserService = Depends(get_user_service),
+) -> BulkImportResult:
+    return await user_service.import_users(request.stream())
+
 
 @user_router.get("/me")
-async def get_me(current_user: UserResponse = Depends(require_user)):
-    return {
-        "message": f"Hi, id={current_user.id}, email={current_user.email}, role={current_user.role}"
-    }
+async def get_me(
+    request: Request, current_user: UserResponse = Depends(require_user)
+) -> Response:
+    return conditional_json(
+        request,
+        principal_etag(current_user, ME_REPRESENTATION),
+        lambda: {
+            "message": f"Hi, id={current_user.id}, email={current_user.email}, role={current_user.role}"
+        },
+    )
 
 
 @user_router.get("/admin")
-async def get_me_admin(current_user: UserResponse = Depends(require_admin)):
-    return {
-        "message": f"Hi, admin! id={current_user.id}, email={current_user.email}, role={current_user.role}"
-    }
+async def get_me_admin(
+    request: Request, current_user: UserResponse = Depends(require_admin)
+) -> Response:
+    return conditional_json(
+        request,
+        principal_etag(current_user, ADMIN_REPRESENTATION),
+        lambda: {
+            "message": f"Hi, admin! id={current_user.id}, email={current_user.email}, role={current_user.role}"
+        },
+    )
 
 
 @user_router.get("/public")
-async def get_me(current_user: UserResponse | None = Depends(get_current_user)):
-    if current_user is None:
-        return {"message": "no user"}
-    return {
-        "message": f"Hi, id={current_user.id}, email={current_user.email}, role={current_user.role}"
-    }
+async def get_me(
+    request: Request, current_user: UserResponse | None = Depends(get_current_user)
+) -> Response:
+    def render():
+        if current_user is None:
+            return {"message": "no user"}
+        return {
+            "message": f"Hi, id={current_user.id}, email={current_user.email}, role={current_user.role}"
+        }
+
+    return conditional_json(
+        request, principal_etag(current_user, PUBLIC_REPRESENTATION), render
+    )
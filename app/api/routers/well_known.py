@@ -0,0 +1,18 @@
+from fastapi import APIRouter, Response
+
+from app.core import security
+
+well_known_router = APIRouter(prefix="/.well-known", tags=["Well-known"])
+
+EMPTY_JWKS = b'{"keys":[]}'
+
+
+@well_known_router.get("/jwks.json")
+async def jwks() -> Response:
+    """Публичные ключи для локальной проверки токенов другими сервисами."""
+    keyring = security.get_keyring()
+    return Response(
+        content=keyring.jwks_json if keyring is not None else EMPTY_JWKS,
+        media_type="application/json",
+        headers={"Cache-Control": "public, max-age=300"},
+    )
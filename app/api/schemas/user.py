@@ -39,6 +39,35 @@ class UserLogin(UserBase):
     password: str = Field(..., min_length=8, max_length=64)
 
 
+class UserImport(UserCreate):
+    role: UserRole = UserRole.USER
+
+
 class UserResponse(UserBase):
     id: UUID
     role: UserRole
+
+
+class UserPartialResponse(BaseModel):
+    id: UUID | None = None
+    email: str | None = None
+    role: UserRole | None = None
+
+    model_config = ConfigDict(from_attributes=True)
+
+
+class UserPage(BaseModel):
+    items: list[UserPartialResponse]
+    next_cursor: str | None = None
+
+
+class BulkImportRowError(BaseModel):
+    line: int
+    email: str | None = None
+    error: str
+
+
+class BulkImportResult(BaseModel):
+    created: int = 0
+    conflicts: list[BulkImportRowError] = []
+    errors: list[BulkImportRowError] = []
@@ -0,0 +1,6 @@
+from app.core.config import settings
+from app.utils.cache import TTLCache
+
+principal_cache = TTLCache(
+    maxsize=settings.PRINCIPAL_CACHE_MAX_SIZE if settings.PRINCIPAL_CACHE_ENABLED else 0
+)
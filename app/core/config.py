@@ -1,6 +1,8 @@
 import logging
 import os
 import sys
+from typing import Literal
+
 from pydantic_settings import BaseSettings, SettingsConfigDict
 
 
@@ -11,12 +13,93 @@ class Settings(BaseSettings):
     DB_PASS: str
     DB_NAME: str
 
+    DB_POOL_SIZE: int = 5
+    DB_MAX_OVERFLOW: int = 10
+    DB_POOL_TIMEOUT: float = 30
+    DB_POOL_RECYCLE: int = -1
+    DB_POOL_PRE_PING: bool = False
+    DB_STATEMENT_CACHE_SIZE: int = 100
+    DB_COMPILED_CACHE_SIZE: int = 500
+    DB_POOL_METRICS_ENABLED: bool = True
+    DB_POOL_ADAPTIVE: bool = False
+    DB_POOL_ADAPTIVE_MIN_OVERFLOW: int = 0
+    DB_POOL_ADAPTIVE_MAX_OVERFLOW: int = 20
+    DB_POOL_ADAPTIVE_TARGET_WAIT_MS: float = 5
+
+    DB_POOL_WARMUP_CONNECTIONS: int = 2
+    DB_MAX_CONNECTIONS: int = 100
+    DB_RESERVED_CONNECTIONS: int = 10
+
+    DB_INSTRUMENTATION_ENABLED: bool = True
+    DB_SLOW_OPERATION_MS: float = 200
+
+    DB_REPLICA_URLS: list[str] = []
+    DB_REPLICA_STRATEGY: Literal["round_robin", "least_connections"] = "round_robin"
+    DB_READ_YOUR_WRITES_SECONDS: float = 5
+
     SECRET_KEY: str
     ALGORITHM: str
+    JWT_KEYS: dict[str, str] = {}
+    JWT_ACTIVE_KID: str | None = None
     ACCESS_TOKEN_EXPIRE_MINUTES: int
     REFRESH_TOKEN_EXPIRE_DAYS: int
+    ACCESS_TOKEN_CLAIMS_MODE: bool = False
+    TOKEN_CACHE_MAX_SIZE: int = 10_000
+    REVOCATION_FILTER_CAPACITY: int = 100_000
+    REVOCATION_FILTER_ERROR_RATE: float = 0.001
+    REVOCATION_MAINTENANCE_INTERVAL_SECONDS: float = 3600
+
+    PRINCIPAL_CACHE_ENABLED: bool = True
+    PRINCIPAL_CACHE_TTL_SECONDS: float = 30
+    PRINCIPAL_CACHE_MAX_SIZE: int = 10_000
+
+    LOGIN_THROTTLE_ENABLED: bool = True
+    LOGIN_THROTTLE_EMAIL_BURST: int = 5
+    LOGIN_THROTTLE_EMAIL_PER_MINUTE: float = 5
+    LOGIN_THROTTLE_IP_BURST: int = 30
+    LOGIN_THROTTLE_IP_PER_MINUTE: float = 60
+    LOGIN_THROTTLE_MAX_KEYS: int = 100_000
+
+    SERVER_HOST: str = "0.0.0.0"
+    SERVER_PORT: int = 8000
+    SERVER_WORKERS: int = 0
+    SERVER_LOOP: Literal["uvloop", "asyncio", "auto"] = "uvloop"
+    SERVER_HTTP: Literal["httptools", "h11", "auto"] = "httptools"
+    SERVER_BACKLOG: int = 2048
+    SERVER_KEEPALIVE_SECONDS: int = 5
+    SERVER_LIMIT_CONCURRENCY: int = 0
+    SERVER_MAX_REQUESTS: int = 0
+    SERVER_MAX_REQUESTS_JITTER: int = 0
+    SERVER_ACCESS_LOG: bool = False
+
+    STARTUP_WARMUP_ENABLED: bool = True
+    SERVER_TIMING_ENABLED: bool = False
 
     LOG_LEVEL: str = "ERROR"
+    LOG_FORMAT: Literal["color", "json"] = "color"
+    LOG_QUEUE_ENABLED: bool = False
+    LOG_QUEUE_MAX_SIZE: int = 10_000
+    CLIENT_ERROR_LOG_BURST: int = 10
+    CLIENT_ERROR_LOG_INTERVAL_SECONDS: float = 60
+
+    UOW_REQUEST_SCOPED: bool = True
+    UOW_BACKEND: Literal["sqlalchemy", "memory"] = "sqlalchemy"
+
+    BULK_IMPORT_BATCH_SIZE: int = 1000
+    BULK_IMPORT_MAX_LINE_BYTES: int = 4096
+
+    PASSWORD_SCHEME: Literal["bcrypt", "argon2"] = "bcrypt"
+    BCRYPT_ROUNDS: int = 12
+    PASSWORD_HASH_TARGET_MS: float = 150
+    ARGON2_MEMORY_COST: int = 65536
+    ARGON2_TIME_COST: int = 3
+    ARGON2_PARALLELISM: int = 4
+    PASSWORD_REHASH_ON_LOGIN: bool = True
+
+    PASSWORD_HASHER_EXECUTOR: Literal["thread", "process"] = "thread"
+    PASSWORD_HASHER_WORKERS: int = 0
+    PASSWORD_HASHER_MAX_QUEUE: int = 128
+    PASSWORD_HASHER_RETRY_AFTER_SECONDS: int = 1
 
     @property
     def ASYNC_DATABASE_URL(self) -> str:
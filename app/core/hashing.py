@@ -0,0 +1,147 @@
+import asyncio
+import logging
+import os
+import time
+from concurrent.futures import Executor, ProcessPoolExecutor, ThreadPoolExecutor
+from typing import Any, Callable
+
+from app.core.config import settings
+from app.errors.exceptions import PasswordHasherBusyError
+from app.utils.metrics import LatencyHistogram
+
+logger = logging.getLogger(__name__)
+
+
+class PasswordHasherPool:
+    """Пул для bcrypt-операций, вынесенных из event loop.
+
+    Одновременно выполняется не больше ``max_workers`` задач, ещё
+    ``max_queue`` ждут своей очереди; всё сверх этого отклоняется
+    с ``PasswordHasherBusyError`` (503), а не копится в памяти.
+    """
+
+    def __init__(
+        self,
+        executor_type: str = "thread",
+        max_workers: int = 0,
+        max_queue: int = 128,
+    ):
+        self.executor_type = executor_type
+        self.max_workers = max_workers or os.cpu_count() or 1
+        self.max_queue = max_queue
+        self._executor: Executor | None = None
+
+        self.pending = 0
+        self.max_pending = 0
+        self.submitted = 0
+        self.rejected = 0
+        self.failed = 0
+        self.latency = LatencyHistogram()
+
+    @property
+    def capacity(self) -> int:
+        return self.max_workers + self.max_queue
+
+    def _get_executor(self) -> Executor:
+        if self._executor is None:
+            if self.executor_type == "process":
+                self._executor = ProcessPoolExecutor(max_workers=self.max_workers)
+            else:
+                self._executor = ThreadPoolExecutor(
+                    max_workers=self.max_workers, thread_name_prefix="password-hasher"
+                )
+            logger.debug(
+                "Запущен пул хеширования паролей: executor=%s, workers=%s, queue=%s",
+                self.executor_type,
+                self.max_workers,
+                self.max_queue,
+            )
+        return self._executor
+
+    async def run(self, func: Callable[..., Any], *args: Any) -> Any:
+        if self.pending >= self.capacity:
+            self.rejected += 1
+            # Отказ попадает в лог обработчика ошибок с ограничением частоты.
+            logger.debug(
+                "Пул хеширования паролей переполнен: pending=%s, capacity=%s",
+                self.pending,
+                self.capacity,
+            )
+            raise PasswordHasherBusyError(
+                retry_after=settings.PASSWORD_HASHER_RETRY_AFTER_SECONDS
+            )
+
+        self.pending += 1
+        self.submitted += 1
+        self.max_pending = max(self.max_pending, self.pending)
+
+        loop = asyncio.get_running_loop()
+        start = time.perf_counter()
+        try:
+            return await loop.run_in_executor(self._get_executor(), func, *args)
+        except Exception:
+            self.failed += 1
+            raise
+        finally:
+            self.pending -= 1
+            self.latency.observe((time.perf_counter() - start) * 1000)
+
+    async def map(
+        self, func: Callable[[Any], Any], items: list, concurrency: int | None = None
+    ) -> list:
+        """Прогоняет ``func`` по всем элементам, занимая не больше ``concurrency`` воркеров.
+
+        В отличие от ``run`` не отклоняет задачи при переполнении, а ждёт:
+        используется для массовых операций, которые не должны вытеснять
+        интерактивные логины.
+        """
+        semaphore = asyncio.Semaphore(concurrency or max(self.max_workers // 2, 1))
+        loop = asyncio.get_running_loop()
+        executor = self._get_executor()
+
+        async def call(item):
+            async with semaphore:
+                self.pending += 1
+                self.submitted += 1
+                start = time.perf_counter()
+                try:
+                    return await loop.run_in_executor(executor, func, item)
+                finally:
+                    self.pending -= 1
+                    self.latency.observe((time.perf_counter() - start) * 1000)
+
+        return await asyncio.gather(*(call(item) for item in items))
+
+    async def warm_up(self, func: Callable[..., Any], *args: Any) -> None:
+        """Поднимает все воркеры пула и выполняет в каждом ``func``."""
+        loop = asyncio.get_running_loop()
+        executor = self._get_executor()
+        await asyncio.gather(
+            *(loop.run_in_executor(executor, func, *args) for _ in range(self.max_workers))
+        )
+
+    def stats(self) -> dict:
+        return {
+            "executor": self.executor_type,
+            "workers": self.max_workers,
+            "max_queue": self.max_queue,
+            "in_flight": min(self.pending, self.max_workers),
+            "queue_depth": max(self.pending - self.max_workers, 0),
+            "max_pending": self.max_pending,
+            "submitted": self.submitted,
+            "rejected": self.rejected,
+            "failed": self.failed,
+            "latency": self.latency.snapshot(),
+        }
+
+    def shutdown(self, wait: bool = True) -> None:
+        if self._executor is not None:
+            self._executor.shutdown(wait=wait)
+            self._executor = None
+
+
+password_hasher = PasswordHasherPool(
+    executor_type=settings.PASSWORD_HASHER_EXECUTOR,
+    max_workers=settings.PASSWORD_HASHER_WORKERS,
+    max_queue=settings.PASSWORD_HASHER_MAX_QUEUE,
+)
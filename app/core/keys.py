@@ -0,0 +1,106 @@
+import argparse
+import json
+from pathlib import Path
+
+from cryptography.hazmat.primitives import serialization
+from cryptography.hazmat.primitives.asymmetric import ec, ed25519
+from jwt.algorithms import ECAlgorithm, OKPAlgorithm
+
+from app.errors.exceptions import InvalidTokenError
+
+SUPPORTED_ALGORITHMS = ("EdDSA", "ES256")
+
+
+class SigningKey:
+    """Разобранная один раз пара ключей; приватной части нет у ключей только для проверки."""
+
+    def __init__(self, kid: str, private_key=None, public_key=None):
+        self.kid = kid
+        self.private_key = private_key
+        self.public_key = public_key or private_key.public_key()
+
+        if isinstance(self.public_key, ed25519.Ed25519PublicKey):
+            self.algorithm = "EdDSA"
+            jwk = OKPAlgorithm.to_jwk(self.public_key, as_dict=True)
+        elif isinstance(self.public_key, ec.EllipticCurvePublicKey) and isinstance(
+            self.public_key.curve, ec.SECP256R1
+        ):
+            self.algorithm = "ES256"
+            jwk = ECAlgorithm.to_jwk(self.public_key, as_dict=True)
+        else:
+            raise ValueError(
+                f"Ключ '{kid}': поддерживаются только Ed25519 (EdDSA) и P-256 (ES256)"
+            )
+
+        self.jwk = {**jwk, "kid": kid, "alg": self.algorithm, "use": "sig"}
+
+    @classmethod
+    def from_pem(cls, kid: str, pem: bytes) -> "SigningKey":
+        if b"PRIVATE KEY" in pem:
+            return cls(kid, private_key=serialization.load_pem_private_key(pem, None))
+        return cls(kid, public_key=serialization.load_pem_public_key(pem))
+
+
+class KeyRing:
+    """Ключи подписи по ``kid``: подписывает активный, проверяет любой.
+
+    Ротация без простоя: новый ключ сначала добавляется в набор (и
+    попадает в JWKS), затем становится активным, а старый убирается,
+    когда истекут подписанные им токены.
+    """
+
+    def __init__(self, keys: list[SigningKey], active_kid: str | None = None):
+        if not keys:
+            raise ValueError("Набор ключей пуст")
+
+        self.keys = {key.kid: key for key in keys}
+        self.active_kid = active_kid or keys[-1].kid
+        if self.active_kid not in self.keys:
+            raise ValueError(f"Активный ключ '{self.active_kid}' не найден")
+        if self.signing_key.private_key is None:
+            raise ValueError(f"У активного ключа '{self.active_kid}' нет приватной части")
+
+        self.jwks = {"keys": [key.jwk for key in self.keys.values()]}
+        self.jwks_json = json.dumps(self.jwks, separators=(",", ":")).encode()
+
+    @property
+    def signing_key(self) -> SigningKey:
+        return self.keys[self.active_kid]
+
+    def get(self, kid: str | None) -> SigningKey:
+        key = self.keys.get(kid)
+        if key is None:
+            raise InvalidTokenError(detail="Unknown signing key")
+        return key
+
+    @classmethod
+    def from_files(cls, paths: dict[str, str], active_kid: str | None = None) -> "KeyRing":
+        return cls(
+            [SigningKey.from_pem(kid, Path(path).read_bytes()) for kid, path in paths.items()],
+            active_kid,
+        )
+
+
+def generate_private_key_pem(algorithm: str) -> bytes:
+    if algorithm == "EdDSA":
+        private_key = ed25519.Ed25519PrivateKey.generate()
+    elif algorithm == "ES256":
+        private_key = ec.generate_private_key(ec.SECP256R1())
+    else:
+        raise ValueError(f"Алгоритм {algorithm} не поддерживается")
+
+    return private_key.private_bytes(
+        serialization.Encoding.PEM,
+        serialization.PrivateFormat.PKCS8,
+        serialization.NoEncryption(),
+    )
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Генерация ключа подписи JWT в PEM")
+    parser.add_argument("--algorithm", choices=SUPPORTED_ALGORITHMS, default="EdDSA")
+    parser.add_argument("output", type=Path)
+    args = parser.parse_args()
+
+    args.output.write_bytes(generate_private_key_pem(args.algorithm))
+    args.output.chmod(0o600)
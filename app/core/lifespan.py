@@ -0,0 +1,154 @@
+import asyncio
+import logging
+import time
+from contextlib import asynccontextmanager, suppress
+from datetime import datetime
+from uuid import UUID
+
+from fastapi import FastAPI
+from sqlalchemy.exc import SQLAlchemyError
+from sqlalchemy.ext.asyncio import AsyncEngine, AsyncSession
+
+from app.core.config import settings
+from app.core.hashing import password_hasher
+from app.core.logger import stop_logger
+from app.core.revocation import revocation_list
+from app.core.security import get_keyring, get_password_context, prime_password_hashing
+from app.db.database import engine, replica_engines
+from app.errors.exceptions import DatabaseError
+from app.repositories.revoked_token_repository import RevokedTokenRepository
+from app.repositories.user_repository import UserRepository
+from app.utils.unitofwork import create_unit_of_work
+
+logger = logging.getLogger(__name__)
+
+_WARMUP_ID = UUID(int=0)
+
+
+async def _prepare_statements(connection) -> None:
+    """Выполняет горячие запросы: asyncpg готовит их и кэширует на соединении."""
+    async with AsyncSession(bind=connection) as session:
+        users = UserRepository(session)
+        await users.find_by_email("warmup@invalid", columns=users.credentials_columns)
+        await users.find_by_id(_WARMUP_ID, columns=users.principal_columns)
+        await RevokedTokenRepository(session).is_revoked(_WARMUP_ID)
+
+
+async def warm_up_pool(engine: AsyncEngine, size: int) -> None:
+    """Открывает ``size`` соединений одновременно, чтобы пул оставил их себе.
+
+    Больше ``DB_POOL_SIZE`` не открываем: соединения сверх него пул
+    закрывает сразу после возврата.
+    """
+    connections = [engine.connect() for _ in range(min(size, settings.DB_POOL_SIZE))]
+    try:
+        await asyncio.gather(*(connection.start() for connection in connections))
+        await asyncio.gather(*(_prepare_statements(c) for c in connections))
+    finally:
+        for connection in connections:
+            if connection.sync_connection is not None:
+                await connection.close()
+
+
+async def _warm_up_database() -> None:
+    if settings.UOW_BACKEND != "sqlalchemy":
+        return
+    await asyncio.gather(
+        *(
+            warm_up_pool(db_engine, settings.DB_POOL_WARMUP_CONNECTIONS)
+            for db_engine in [engine, *replica_engines]
+        )
+    )
+
+
+async def _warm_up_hashing() -> None:
+    # Контекст строится в этом процессе до воркеров пула — см. _ready_hasher.
+    get_password_context()
+    await password_hasher.warm_up(prime_password_hashing)
+
+
+async def _hydrate_revocation_list() -> None:
+    async with create_unit_of_work() as uow:
+        await revocation_list.hydrate(uow.revoked_token_repo)
+
+
+async def maintain_revocation_list() -> None:
+    """Удаляет истёкшие отзывы и перестраивает фильтр из оставшихся."""
+    async with create_unit_of_work() as uow:
+        purged = await uow.revoked_token_repo.purge_expired(datetime.utcnow())
+        await uow.commit()
+        await revocation_list.rebuild(uow.revoked_token_repo)
+    logger.info("Удалено истёкших отзывов токенов: %s", purged)
+
+
+async def _revocation_maintenance_loop(interval: float) -> None:
+    while True:
+        await asyncio.sleep(interval)
+        try:
+            await maintain_revocation_list()
+        except (OSError, SQLAlchemyError, DatabaseError) as e:
+            logger.warning("Обслуживание списка отзывов не удалось: %s", e)
+
+
+async def warm_up(app: FastAPI) -> dict[str, float]:
+    """Делает до первого запроса то, за что иначе заплатил бы он: возвращает время фаз в мс.
+
+    Недоступная база не мешает старту — фаза пропускается с
+    предупреждением, соединения откроются по первому запросу.
+    """
+    phases = {
+        "keyring": get_keyring,
+        "hashing": _warm_up_hashing,
+        "pool": _warm_up_database,
+        "revocation": _hydrate_revocation_list,
+        "openapi": app.openapi,
+    }
+
+    timings = {}
+    for name, phase in phases.items():
+        start = time.perf_counter()
+        try:
+            result = phase()
+            if asyncio.iscoroutine(result):
+                await result
+        except (OSError, SQLAlchemyError, DatabaseError) as e:
+            logger.warning("Прогрев '%s' не удался: %s", name, e)
+        timings[name] = round((time.perf_counter() - start) * 1000, 1)
+
+    return timings
+
+
+async def shutdown() -> None:
+    await asyncio.gather(
+        engine.dispose(), *(db_engine.dispose() for db_engine in replica_engines)
+    )
+    password_hasher.shutdown()
+    stop_logger()
+
+
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    if settings.STARTUP_WARMUP_ENABLED:
+        start = time.perf_counter()
+        timings = await warm_up(app)
+        startup_ms = round((time.perf_counter() - start) * 1000, 1)
+        logger.info(
+            "Прогрев завершён за %s мс: %s",
+            startup_ms,
+            timings,
+            extra={"startup_ms": startup_ms, "phases": timings},
+        )
+
+    maintenance = None
+    if settings.REVOCATION_MAINTENANCE_INTERVAL_SECONDS > 0:
+        maintenance = asyncio.create_task(
+            _revocation_maintenance_loop(settings.REVOCATION_MAINTENANCE_INTERVAL_SECONDS)
+        )
+
+    yield
+
+    if maintenance is not None:
+        maintenance.cancel()
+        with suppress(asyncio.CancelledError):
+            await maintenance
+    await shutdown()
@@ -1,17 +1,89 @@
+import atexit
+import json
 import logging
+import queue
+from logging.handlers import QueueHandler, QueueListener
 
 from app.core.config import settings
 
+LOG_FORMAT = "[%(asctime)s.%(msecs)03d] %(module)20s:%(lineno)-3d %(levelname)8s - %(message)s"
+LOG_DATE_FORMAT = "%Y-%m-%d %H:%M:%S"
+
+_RECORD_ATTRS = frozenset(vars(logging.makeLogRecord({}))) | {"message", "asctime"}
+_exception_formatter = logging.Formatter()
+_queue_handler: "BoundedQueueHandler | None" = None
+_listener: "BoundedQueueListener | None" = None
+
+
+class JsonFormatter(logging.Formatter):
+    """Одна запись — одна JSON-строка; поля из ``extra`` попадают в неё как есть."""
+
+    def format(self, record: logging.LogRecord) -> str:
+        data = {
+            "ts": record.created,
+            "level": record.levelname,
+            "logger": record.name,
+            "message": record.getMessage(),
+        }
+        for key, value in record.__dict__.items():
+            if key not in _RECORD_ATTRS:
+                data[key] = value
+
+        if record.exc_info:
+            data["exc_info"] = self.formatException(record.exc_info)
+        elif record.exc_text:
+            data["exc_info"] = record.exc_text
+
+        return json.dumps(data, ensure_ascii=False, default=str)
+
+
+class BoundedQueueHandler(QueueHandler):
+    """Кладёт записи в ограниченную очередь и отбрасывает их, если она заполнена.
+
+    Вызывающий поток не ждёт ни записи в поток вывода, ни форматирования:
+    этим занимается ``QueueListener`` в отдельном потоке.
+    """
+
+    def __init__(self, maxsize: int):
+        super().__init__(queue.Queue(maxsize))
+        self.dropped = 0
+
+    def prepare(self, record: logging.LogRecord) -> logging.LogRecord:
+        record.msg = record.getMessage()
+        record.args = None
+        if record.exc_info:
+            record.exc_text = _exception_formatter.formatException(record.exc_info)
+            record.exc_info = None
+        return record
+
+    def enqueue(self, record: logging.LogRecord) -> None:
+        try:
+            self.queue.put_nowait(record)
+        except queue.Full:
+            self.dropped += 1
+
+
+class BoundedQueueListener(QueueListener):
+    def enqueue_sentinel(self) -> None:
+        # Очередь может быть заполнена: ждём место, а не теряем сигнал остановки.
+        self.queue.put(self._sentinel)
+
+
+def _build_handler() -> logging.Handler:
+    handler = logging.StreamHandler()
+
+    if settings.LOG_FORMAT == "json":
+        handler.setFormatter(JsonFormatter())
+        return handler
 
-def configure_logger():
     try:
         import colorlog
 
         handler = colorlog.StreamHandler()
         handler.setFormatter(
             colorlog.ColoredFormatter(
-                fmt="%(log_color)s[%(asctime)s.%(msecs)03d] %(module)20s:%(lineno)-3d %(levelname)8s - %(message)s",
-                datefmt="%Y-%m-%d %H:%M:%S",
+                fmt="%(log_color)s" + LOG_FORMAT,
+                datefmt=LOG_DATE_FORMAT,
                 log_colors={
                     "DEBUG": "cyan",
                     "INFO": "green",
@@ -21,15 +93,66 @@ def configure_logger():
                 },
             )
         )
+    except ImportError:
+        handler.setFormatter(logging.Formatter(LOG_FORMAT, datefmt=LOG_DATE_FORMAT))
 
-        logger = logging.getLogger()
-        logger.setLevel(settings.log_level)
-        logger.handlers.clear()
+    return handler
+
+
+def configure_logger():
+    global _queue_handler, _listener
+
+    stop_logger()
+    _queue_handler = None
+    handler = _build_handler()
+
+    logger = logging.getLogger()
+    logger.setLevel(settings.log_level)
+    logger.handlers.clear()
+
+    if not settings.LOG_QUEUE_ENABLED:
         logger.addHandler(handler)
+        return
 
-    except ImportError:
-        logging.basicConfig(
-            level=settings.log_level,
-            datefmt="%Y-%m-%d %H:%M:%S",
-            format="[%(asctime)s.%(msecs)03d] %(module)20s:%(lineno)-3d %(levelname)8s - %(message)s",
-        )
+    _queue_handler = BoundedQueueHandler(settings.LOG_QUEUE_MAX_SIZE)
+    _listener = BoundedQueueListener(
+        _queue_handler.queue, handler, respect_handler_level=True
+    )
+    _listener.start()
+    logger.addHandler(_queue_handler)
+
+
+def stop_logger():
+    """Дописывает накопившиеся в очереди записи и останавливает поток логирования.
+
+    Корневой логгер возвращается к прямой записи, так что сообщения после
+    остановки (например, завершение uvicorn) не теряются в очереди.
+    """
+    global _listener
+
+    if _listener is None:
+        return
+
+    root = logging.getLogger()
+    if _queue_handler in root.handlers:
+        root.removeHandler(_queue_handler)
+        for handler in _listener.handlers:
+            root.addHandler(handler)
+
+    _listener.stop()
+    _listener = None
+
+
+atexit.register(stop_logger)
+
+
+def logger_stats() -> dict:
+    if _queue_handler is None:
+        return {"queue_enabled": False}
+
+    return {
+        "queue_enabled": True,
+        "queue_size": _queue_handler.queue.qsize(),
+        "queue_max_size": _queue_handler.queue.maxsize,
+        "dropped": _queue_handler.dropped,
+    }
@@ -0,0 +1,98 @@
+import argparse
+import logging
+import os
+import time
+
+from passlib.context import CryptContext
+
+from app.core.config import settings
+
+logger = logging.getLogger(__name__)
+
+BCRYPT_MIN_ROUNDS = 10
+BCRYPT_MAX_ROUNDS = 16
+CALIBRATION_ROUNDS = 8
+
+
+def _measure_ms(context: CryptContext, samples: int = 3) -> float:
+    hashed = context.hash("calibration-password")
+    timings = []
+    for _ in range(samples):
+        start = time.perf_counter()
+        context.verify("calibration-password", hashed)
+        timings.append((time.perf_counter() - start) * 1000)
+    return min(timings)
+
+
+def calibrate_bcrypt_rounds(target_ms: float) -> int:
+    """Максимальный cost bcrypt, при котором verify укладывается в ``target_ms`` на этой машине.
+
+    Время bcrypt удваивается с каждым раундом, поэтому достаточно
+    одного замера на дешёвом cost и экстраполяции. Ниже
+    ``BCRYPT_MIN_ROUNDS`` не опускаемся, даже если машина медленная.
+    """
+    base_ms = _measure_ms(
+        CryptContext(schemes=["bcrypt"], bcrypt__rounds=CALIBRATION_ROUNDS)
+    )
+    rounds = BCRYPT_MIN_ROUNDS
+    while (
+        rounds < BCRYPT_MAX_ROUNDS
+        and base_ms * 2 ** (rounds + 1 - CALIBRATION_ROUNDS) <= target_ms
+    ):
+        rounds += 1
+    return rounds
+
+
+def resolve_bcrypt_rounds() -> int:
+    if settings.BCRYPT_ROUNDS:
+        return settings.BCRYPT_ROUNDS
+
+    rounds = calibrate_bcrypt_rounds(settings.PASSWORD_HASH_TARGET_MS)
+    # Процессы пула хеширования читают настройки заново: без этого каждый
+    # откалибровался бы сам и мог бы выбрать другой cost.
+    os.environ["BCRYPT_ROUNDS"] = str(rounds)
+    settings.BCRYPT_ROUNDS = rounds
+    logger.info(
+        "bcrypt откалиброван: rounds=%s для цели %s мс",
+        rounds,
+        settings.PASSWORD_HASH_TARGET_MS,
+    )
+    return rounds
+
+
+def build_password_context() -> CryptContext:
+    """Контекст хеширования: новые хеши — выбранной схемой, старые проверяются и помечаются к перехешированию."""
+    rounds = resolve_bcrypt_rounds()
+    options = {
+        "bcrypt__default_rounds": rounds,
+        "bcrypt__min_rounds": rounds,
+    }
+
+    if settings.PASSWORD_SCHEME == "argon2":
+        try:
+            import argon2  # noqa: F401
+        except ImportError:
+            raise RuntimeError(
+                "PASSWORD_SCHEME=argon2 требует пакет argon2-cffi "
+                "(pip install 'fastapi-template[argon2]')"
+            )
+        return CryptContext(
+            schemes=["argon2", "bcrypt"],
+            deprecated="auto",
+            argon2__memory_cost=settings.ARGON2_MEMORY_COST,
+            argon2__time_cost=settings.ARGON2_TIME_COST,
+            argon2__parallelism=settings.ARGON2_PARALLELISM,
+            **options,
+        )
+
+    return CryptContext(schemes=["bcrypt"], deprecated="auto", **options)
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Подбор cost bcrypt под целевое время проверки")
+    parser.add_argument("--target-ms", type=float, default=settings.PASSWORD_HASH_TARGET_MS)
+    args = parser.parse_args()
+
+    rounds = calibrate_bcrypt_rounds(args.target_ms)
+    context = CryptContext(schemes=["bcrypt"], bcrypt__rounds=rounds)
+    print(f"BCRYPT_ROUNDS={rounds}  # verify ~{_measure_ms(context):.0f} мс")
@@ -0,0 +1,120 @@
+import asyncio
+import logging
+from datetime import datetime
+from uuid import UUID
+
+from app.core.config import settings
+from app.repositories.revoked_token_repository import RevokedTokenRepository
+from app.utils.bloom import BloomFilter
+
+logger = logging.getLogger(__name__)
+
+
+class RevocationList:
+    """Отозванные jti в Bloom-фильтре процесса, база — только при положительном ответе.
+
+    Фильтр заполняется из таблицы при старте или на первой проверке и
+    дальше пополняется отзывами этого процесса. Истёкшие jti из него не
+    удаляются, поэтому фильтр перестраивается из активных записей
+    периодически (см. ``lifespan``) и сразу, как только переполнится.
+    Отзывы из других воркеров он может не знать — от повторного
+    использования токена защищает атомарная вставка при ротации, а фильтр
+    лишь отсекает заведомо отозванные токены без запроса.
+    """
+
+    def __init__(self, capacity: int, error_rate: float):
+        self.capacity = capacity
+        self.error_rate = error_rate
+        self.filter = BloomFilter(capacity, error_rate)
+        self.hydrated = False
+        self._lock = asyncio.Lock()
+        self._pending: list[str] | None = None
+
+        self.checks = 0
+        self.db_checks = 0
+        self.false_positives = 0
+        self.rebuilds = 0
+
+    @property
+    def saturated(self) -> bool:
+        return len(self.filter) > self.filter.capacity
+
+    async def _load(self, repo: RevokedTokenRepository) -> None:
+        # Отзывы, сделанные пока идёт чтение, попадают в старый фильтр и
+        # в _pending, чтобы не потеряться при подмене.
+        self._pending = []
+        try:
+            jtis = [str(jti) async for jti in repo.iter_active_jtis(datetime.utcnow())]
+            jtis += self._pending
+        finally:
+            self._pending = None
+
+        capacity = max(self.capacity, 2 * len(jtis))
+        if capacity > self.capacity:
+            logger.warning(
+                "Активных отозванных токенов %s больше REVOCATION_FILTER_CAPACITY=%s: "
+                "фильтр расширен до %s",
+                len(jtis),
+                self.capacity,
+                capacity,
+            )
+
+        bloom = BloomFilter(capacity, self.error_rate)
+        for jti in jtis:
+            bloom.add(jti)
+        self.filter = bloom
+        self.hydrated = True
+        logger.info("Загружено отозванных токенов: %s", len(bloom))
+
+    async def hydrate(self, repo: RevokedTokenRepository) -> None:
+        async with self._lock:
+            if not self.hydrated:
+                await self._load(repo)
+
+    async def rebuild(self, repo: RevokedTokenRepository) -> None:
+        """Строит фильтр заново из активных jti, отбрасывая истёкшие."""
+        async with self._lock:
+            await self._load(repo)
+            self.rebuilds += 1
+
+    async def is_revoked(self, jti: UUID, repo: RevokedTokenRepository) -> bool:
+        if not self.hydrated:
+            await self.hydrate(repo)
+        elif self.saturated and not self._lock.locked():
+            await self.rebuild(repo)
+
+        self.checks += 1
+        if str(jti) not in self.filter:
+            return False
+
+        self.db_checks += 1
+        revoked = await repo.is_revoked(jti)
+        if not revoked:
+            self.false_positives += 1
+        return revoked
+
+    def add(self, jti: UUID) -> None:
+        self.filter.add(str(jti))
+        if self._pending is not None:
+            self._pending.append(str(jti))
+
+    def reset(self) -> None:
+        self.filter = BloomFilter(self.capacity, self.error_rate)
+        self.hydrated = False
+        self.checks = self.db_checks = self.false_positives = self.rebuilds = 0
+
+    def stats(self) -> dict:
+        return {
+            "hydrated": self.hydrated,
+            "checks": self.checks,
+            "db_checks": self.db_checks,
+            "false_positives": self.false_positives,
+            "rebuilds": self.rebuilds,
+            "filter": self.filter.stats(),
+        }
+
+
+revocation_list = RevocationList(
+    capacity=settings.REVOCATION_FILTER_CAPACITY,
+    error_rate=settings.REVOCATION_FILTER_ERROR_RATE,
+)
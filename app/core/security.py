@@ -1,34 +1,120 @@
+import functools
+import hashlib
 from datetime import datetime, timedelta
+from typing import TYPE_CHECKING
 
 import jwt
 from passlib.context import CryptContext
 
 from app.core.config import settings
+from app.core.hashing import PasswordHasherPool, password_hasher
+from app.core.passwords import build_password_context
 from app.errors.exceptions import InvalidTokenError, TokenError, TokenExpiredError
+from app.utils.cache import TTLCache
+from app.utils.timing import span
 
-pwd_context = CryptContext(schemes=["bcrypt"], deprecated="auto")
+if TYPE_CHECKING:
+    from app.core.keys import KeyRing
+
+# bcrypt-хеш строки "prime" с cost 4: его проверка загружает backend passlib за ~1 мс.
+_PRIME_HASH = "$2b$04$Ogm8liTOh30BTsOxkc3el.s0dkAfZkMvqOCKzXdZ1UgqLha68LF9i"
+_NOT_LOADED = object()
+
+token_cache = TTLCache(maxsize=settings.TOKEN_CACHE_MAX_SIZE)
+keyring: "KeyRing | None" = _NOT_LOADED
+
+
+@functools.cache
+def get_password_context() -> CryptContext:
+    """Контекст хеширования строится при первом обращении: калибровка bcrypt не нужна на импорте."""
+    return build_password_context()
+
+
+def get_keyring() -> "KeyRing | None":
+    """Кольцо ключей JWT; PEM-файлы читаются и разбираются при первом обращении."""
+    global keyring
+    if keyring is _NOT_LOADED:
+        if settings.JWT_KEYS:
+            from app.core.keys import KeyRing
+
+            keyring = KeyRing.from_files(settings.JWT_KEYS, settings.JWT_ACTIVE_KID)
+        else:
+            keyring = None
+    return keyring
+
+
+def prime_password_hashing() -> None:
+    get_password_context().verify("prime", _PRIME_HASH)
 
 
 def hash_password(password: str) -> str:
-    return pwd_context.hash(password)
+    return get_password_context().hash(password)
 
 
 def verify_password(plain_password: str, hashed_password: str) -> bool:
-    return pwd_context.verify(plain_password, hashed_password)
+    return get_password_context().verify(plain_password, hashed_password)
+
+
+def password_needs_rehash(hashed_password: str) -> bool:
+    return get_password_context().needs_update(hashed_password)
+
+
+def _ready_hasher() -> PasswordHasherPool:
+    # Cost bcrypt выбирается здесь, до запуска процессов пула: иначе при
+    # BCRYPT_ROUNDS=0 каждый из них откалибровался бы сам.
+    get_password_context()
+    return password_hasher
+
+
+async def hash_password_async(password: str) -> str:
+    with span("hash"):
+        return await _ready_hasher().run(hash_password, password)
+
+
+async def hash_passwords_async(passwords: list[str]) -> list[str]:
+    with span("hash"):
+        return await _ready_hasher().map(hash_password, passwords)
+
+
+async def verify_password_async(plain_password: str, hashed_password: str) -> bool:
+    with span("hash"):
+        return await _ready_hasher().run(
+            verify_password, plain_password, hashed_password
+        )
 
 
 def create_token(data: dict, expire_delta: timedelta) -> str:
     payload = data.copy()
     expire = datetime.utcnow() + expire_delta
     payload.update({"exp": expire})
-    return jwt.encode(payload, settings.SECRET_KEY, algorithm=settings.ALGORITHM)
+    keyring = get_keyring()
+    with span("jwt"):
+        if keyring is None:
+            return jwt.encode(
+                payload, settings.SECRET_KEY, algorithm=settings.ALGORITHM
+            )
+
+        key = keyring.signing_key
+        return jwt.encode(
+            payload, key.private_key, algorithm=key.algorithm, headers={"kid": key.kid}
+        )
 
 
-def verify_token(token, token_type):
+def _token_cache_key(token: str) -> bytes:
+    return hashlib.blake2b(token.encode(), digest_size=16).digest()
+
+
+def _decode_token(token, token_type) -> dict:
+    keyring = get_keyring()
     try:
-        payload = jwt.decode(
-            token, settings.SECRET_KEY, algorithms=[settings.ALGORITHM]
-        )
+        with span("jwt"):
+            if keyring is None:
+                payload = jwt.decode(
+                    token, settings.SECRET_KEY, algorithms=[settings.ALGORITHM]
+                )
+            else:
+                key = keyring.get(jwt.get_unverified_header(token).get("kid"))
+                payload = jwt.decode(token, key.public_key, algorithms=[key.algorithm])
         exp = payload.get("exp")
         current_token_type = payload.get("type")
 
@@ -41,11 +127,27 @@ def verify_token(token, token_type):
         if datetime.utcfromtimestamp(exp) < datetime.utcnow():
             raise TokenExpiredError()
 
-        sub = payload.get("sub")
-        if not sub:
+        if not payload.get("sub"):
             raise InvalidTokenError(detail="Subject not found in token")
 
-        return sub
+        return payload
 
     except jwt.PyJWTError as e:
         raise TokenError(detail=str(e))
+
+
+def verify_token_payload(token, token_type) -> dict:
+    cache_key = _token_cache_key(token)
+    payload = token_cache.get(cache_key)
+
+    if payload is None:
+        payload = _decode_token(token, token_type)
+        token_cache.set(cache_key, payload, expires_at=payload["exp"])
+    elif payload["type"] != token_type:
+        raise InvalidTokenError(detail="Invalid token type")
+
+    return payload
+
+
+def verify_token(token, token_type):
+    return verify_token_payload(token, token_type)["sub"]
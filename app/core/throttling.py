@@ -0,0 +1,146 @@
+import math
+import time
+from abc import ABC, abstractmethod
+from collections import OrderedDict
+from typing import Callable, Hashable
+
+from app.core.config import settings
+from app.errors.exceptions import TooManyRequestsError
+
+
+class ThrottleBackend(ABC):
+    """Хранилище лимитов; внешний бэкенд (например, Redis) реализует тот же интерфейс."""
+
+    @abstractmethod
+    def hit(self, key: Hashable, cost: float = 1) -> float:
+        """Списывает ``cost`` попыток; возвращает 0 или сколько секунд ждать."""
+
+    @abstractmethod
+    def reset(self) -> None: ...
+
+    @abstractmethod
+    def stats(self) -> dict: ...
+
+
+class InMemoryTokenBucketBackend(ThrottleBackend):
+    """Token bucket на ключ; бакеты лежат в LRU, самые старые вытесняются.
+
+    Вытесненный бакет эквивалентен полному, поэтому ограничение по
+    памяти может только ослабить лимит, но никогда не заблокирует
+    лишнего.
+    """
+
+    def __init__(
+        self,
+        capacity: float,
+        refill_per_second: float,
+        maxsize: int,
+        clock: Callable[[], float] = time.monotonic,
+    ):
+        self.capacity = capacity
+        self.refill_per_second = refill_per_second
+        self.maxsize = maxsize
+        self._clock = clock
+        self._buckets: OrderedDict[Hashable, list[float]] = OrderedDict()
+        self.evictions = 0
+
+    def hit(self, key: Hashable, cost: float = 1) -> float:
+        now = self._clock()
+        bucket = self._buckets.get(key)
+        if bucket is None:
+            bucket = self._buckets[key] = [self.capacity, now]
+            if len(self._buckets) > self.maxsize:
+                self._buckets.popitem(last=False)
+                self.evictions += 1
+        else:
+            self._buckets.move_to_end(key)
+            tokens, updated = bucket
+            bucket[0] = min(
+                self.capacity, tokens + (now - updated) * self.refill_per_second
+            )
+            bucket[1] = now
+
+        if bucket[0] >= cost:
+            bucket[0] -= cost
+            return 0
+
+        return (cost - bucket[0]) / self.refill_per_second
+
+    def reset(self) -> None:
+        self._buckets.clear()
+
+    def stats(self) -> dict:
+        return {
+            "keys": len(self._buckets),
+            "maxsize": self.maxsize,
+            "evictions": self.evictions,
+        }
+
+
+class LoginThrottle:
+    """Лимиты на попытки входа по email и по IP клиента.
+
+    Проверяется до поиска пользователя и bcrypt, поэтому отклонённая
+    попытка не стоит ни запроса к базе, ни CPU.
+    """
+
+    def __init__(
+        self,
+        email_backend: ThrottleBackend,
+        ip_backend: ThrottleBackend,
+        enabled: bool = True,
+    ):
+        self.email_backend = email_backend
+        self.ip_backend = ip_backend
+        self.enabled = enabled
+
+        self.allowed = 0
+        self.throttled_email = 0
+        self.throttled_ip = 0
+
+    def check(self, email: str, client_ip: str | None = None) -> None:
+        if not self.enabled:
+            return
+
+        if client_ip is not None:
+            retry_after = self.ip_backend.hit(client_ip)
+            if retry_after:
+                self.throttled_ip += 1
+                raise TooManyRequestsError(retry_after=math.ceil(retry_after))
+
+        retry_after = self.email_backend.hit(email.lower())
+        if retry_after:
+            self.throttled_email += 1
+            raise TooManyRequestsError(retry_after=math.ceil(retry_after))
+
+        self.allowed += 1
+
+    def reset(self) -> None:
+        self.email_backend.reset()
+        self.ip_backend.reset()
+        self.allowed = self.throttled_email = self.throttled_ip = 0
+
+    def stats(self) -> dict:
+        return {
+            "enabled": self.enabled,
+            "allowed": self.allowed,
+            "throttled_email": self.throttled_email,
+            "throttled_ip": self.throttled_ip,
+            "email": self.email_backend.stats(),
+            "ip": self.ip_backend.stats(),
+        }
+
+
+login_throttle = LoginThrottle(
+    email_backend=InMemoryTokenBucketBackend(
+        capacity=settings.LOGIN_THROTTLE_EMAIL_BURST,
+        refill_per_second=settings.LOGIN_THROTTLE_EMAIL_PER_MINUTE / 60,
+        maxsize=settings.LOGIN_THROTTLE_MAX_KEYS,
+    ),
+    ip_backend=InMemoryTokenBucketBackend(
+        capacity=settings.LOGIN_THROTTLE_IP_BURST,
+        refill_per_second=settings.LOGIN_THROTTLE_IP_PER_MINUTE / 60,
+        maxsize=settings.LOGIN_THROTTLE_MAX_KEYS,
+    ),
+    enabled=settings.LOGIN_THROTTLE_ENABLED,
+)
@@ -1,11 +1,67 @@
-from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker, create_async_engine
+import functools
+
+from sqlalchemy import event
+from sqlalchemy.ext.asyncio import (
+    AsyncEngine,
+    AsyncSession,
+    async_sessionmaker,
+    create_async_engine,
+)
 from sqlalchemy.orm import DeclarativeBase
 
 from app.core.config import settings
+from app.db.pool import AdaptivePoolSizer, InstrumentedAsyncPool, instrument_pool
+from app.db.routing import ReplicaRouter
+from app.utils.logging_decorators import record_statement
+
+
+def build_engine(url: str) -> AsyncEngine:
+    engine = create_async_engine(
+        url,
+        poolclass=InstrumentedAsyncPool,
+        pool_size=settings.DB_POOL_SIZE,
+        max_overflow=settings.DB_MAX_OVERFLOW,
+        pool_timeout=settings.DB_POOL_TIMEOUT,
+        pool_recycle=settings.DB_POOL_RECYCLE,
+        pool_pre_ping=settings.DB_POOL_PRE_PING,
+        query_cache_size=settings.DB_COMPILED_CACHE_SIZE,
+        connect_args={
+            "prepared_statement_cache_size": settings.DB_STATEMENT_CACHE_SIZE,
+        },
+    )
+
+    if settings.DB_POOL_METRICS_ENABLED:
+        sizer = None
+        if settings.DB_POOL_ADAPTIVE:
+            sizer = AdaptivePoolSizer(
+                min_overflow=settings.DB_POOL_ADAPTIVE_MIN_OVERFLOW,
+                max_overflow=settings.DB_POOL_ADAPTIVE_MAX_OVERFLOW,
+                target_wait_ms=settings.DB_POOL_ADAPTIVE_TARGET_WAIT_MS,
+            )
+        instrument_pool(engine, sizer)
+
+    if settings.DB_INSTRUMENTATION_ENABLED:
+        event.listen(engine.sync_engine, "before_cursor_execute", record_statement)
 
-engine = create_async_engine(settings.ASYNC_DATABASE_URL)
+    return engine
+
+
+@functools.cache
+def autocommit_engine(engine: AsyncEngine) -> AsyncEngine:
+    """Тот же пул в режиме AUTOCOMMIT: чтения идут без BEGIN и ROLLBACK."""
+    return engine.execution_options(isolation_level="AUTOCOMMIT")
+
+
+engine = build_engine(settings.ASYNC_DATABASE_URL)
 async_session_maker = async_sessionmaker(engine, class_=AsyncSession)
 
+replica_engines = [build_engine(url) for url in settings.DB_REPLICA_URLS]
+replica_router = ReplicaRouter(
+    replica_engines,
+    strategy=settings.DB_REPLICA_STRATEGY,
+    read_your_writes_seconds=settings.DB_READ_YOUR_WRITES_SECONDS,
+)
+
 
 class Base(DeclarativeBase):
     pass
@@ -1,6 +1,8 @@
 import uuid
+from datetime import datetime
 from enum import StrEnum
 
+from sqlalchemy import func
 from sqlalchemy.dialects.postgresql import UUID
 from sqlalchemy.orm import Mapped, mapped_column
 
@@ -24,3 +26,15 @@ class User(Base):
 
     def __repr__(self):
         return f"<User id={self.id} email={self.email}>"
+
+
+class RevokedToken(Base):
+    __tablename__ = "revoked_tokens"
+
+    jti: Mapped[uuid.UUID] = mapped_column(UUID(as_uuid=True), primary_key=True)
+    user_id: Mapped[uuid.UUID] = mapped_column(UUID(as_uuid=True))
+    expires_at: Mapped[datetime] = mapped_column(index=True)
+    revoked_at: Mapped[datetime] = mapped_column(server_default=func.now())
+
+    def __repr__(self):
+        return f"<RevokedToken jti={self.jti} user_id={self.user_id}>"
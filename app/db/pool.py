@@ -0,0 +1,141 @@
+import logging
+import time
+from collections import deque
+
+from sqlalchemy import exc
+from sqlalchemy.ext.asyncio import AsyncEngine
+from sqlalchemy.pool import AsyncAdaptedQueuePool
+
+from app.utils.metrics import LatencyHistogram
+
+logger = logging.getLogger(__name__)
+
+POOL_WAIT_BUCKETS_MS = (0.1, 0.5, 1, 2.5, 5, 10, 25, 50, 100, 250, 1000, 5000)
+
+
+class PoolMetrics:
+    def __init__(self):
+        self.wait = LatencyHistogram(POOL_WAIT_BUCKETS_MS)
+        self.checkouts = 0
+        self.overflow_checkouts = 0
+        self.max_overflow_in_use = 0
+        self.timeouts = 0
+
+    def observe_checkout(self, wait_ms: float, overflow: int) -> None:
+        self.checkouts += 1
+        self.wait.observe(wait_ms)
+        if overflow > 0:
+            self.overflow_checkouts += 1
+            self.max_overflow_in_use = max(self.max_overflow_in_use, overflow)
+
+
+class AdaptivePoolSizer:
+    """Двигает ``max_overflow`` пула в заданных границах по среднему ожиданию checkout.
+
+    Решение принимается раз в ``window`` выдач соединения: если среднее
+    ожидание выше ``target_wait_ms`` — пул растёт на ``step``, если
+    ниже четверти цели — сжимается обратно.
+    """
+
+    def __init__(
+        self,
+        min_overflow: int,
+        max_overflow: int,
+        target_wait_ms: float,
+        window: int = 200,
+        step: int = 2,
+    ):
+        self.min_overflow = min_overflow
+        self.max_overflow = max_overflow
+        self.target_wait_ms = target_wait_ms
+        self.step = step
+        self._waits: deque[float] = deque(maxlen=window)
+        self.adjustments = 0
+
+    def observe(self, pool: "InstrumentedAsyncPool", wait_ms: float) -> None:
+        self._waits.append(wait_ms)
+        if len(self._waits) < self._waits.maxlen:
+            return
+
+        avg_wait = sum(self._waits) / len(self._waits)
+        self._waits.clear()
+
+        current = pool._max_overflow
+        if avg_wait > self.target_wait_ms:
+            new_overflow = min(current + self.step, self.max_overflow)
+        elif avg_wait < self.target_wait_ms / 4:
+            new_overflow = max(current - self.step, self.min_overflow)
+        else:
+            return
+
+        if new_overflow != current:
+            pool._max_overflow = new_overflow
+            self.adjustments += 1
+            logger.info(
+                "Размер пула изменён: max_overflow %s -> %s (среднее ожидание %.2f мс)",
+                current,
+                new_overflow,
+                avg_wait,
+            )
+
+
+class InstrumentedAsyncPool(AsyncAdaptedQueuePool):
+    metrics: PoolMetrics | None = None
+    sizer: AdaptivePoolSizer | None = None
+
+    def _do_get(self):
+        if self.metrics is None:
+            return super()._do_get()
+
+        start = time.perf_counter()
+        try:
+            record = super()._do_get()
+        except exc.TimeoutError:
+            self.metrics.timeouts += 1
+            raise
+
+        wait_ms = (time.perf_counter() - start) * 1000
+        self.metrics.observe_checkout(wait_ms, self._overflow)
+        if self.sizer is not None:
+            self.sizer.observe(self, wait_ms)
+        return record
+
+    def recreate(self):
+        pool = super().recreate()
+        pool.metrics = self.metrics
+        pool.sizer = self.sizer
+        pool._max_overflow = self._max_overflow
+        return pool
+
+    def stats(self) -> dict:
+        stats = {
+            "size": self.size(),
+            "checked_in": self.checkedin(),
+            "checked_out": self.checkedout(),
+            "overflow": self.overflow(),
+            "max_overflow": self._max_overflow,
+        }
+        if self.metrics is not None:
+            stats.update(
+                checkouts=self.metrics.checkouts,
+                overflow_checkouts=self.metrics.overflow_checkouts,
+                max_overflow_in_use=self.metrics.max_overflow_in_use,
+                timeouts=self.metrics.timeouts,
+                wait=self.metrics.wait.snapshot(),
+            )
+        if self.sizer is not None:
+            stats["adaptive_adjustments"] = self.sizer.adjustments
+        return stats
+
+
+def instrument_pool(
+    engine: AsyncEngine, sizer: AdaptivePoolSizer | None = None
+) -> InstrumentedAsyncPool:
+    pool = engine.sync_engine.pool
+    pool.metrics = PoolMetrics()
+    pool.sizer = sizer
+    return pool
+
+
+def pool_stats(engine: AsyncEngine) -> dict:
+    return engine.sync_engine.pool.stats()
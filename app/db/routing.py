@@ -0,0 +1,65 @@
+import itertools
+import time
+from typing import Hashable
+
+from sqlalchemy.ext.asyncio import AsyncEngine
+
+from app.utils.cache import TTLCache
+
+
+class ReplicaRouter:
+    """Выбирает реплику для чтения и помнит недавние записи (read-your-writes).
+
+    Пока для ключа (id или email пользователя) не истекло окно после
+    записи, ``choose`` возвращает ``None`` — чтение идёт в primary.
+    """
+
+    def __init__(
+        self,
+        engines: list[AsyncEngine],
+        strategy: str = "round_robin",
+        read_your_writes_seconds: float = 5,
+        max_tracked_writes: int = 100_000,
+    ):
+        self.engines = engines
+        self.strategy = strategy
+        self.read_your_writes_seconds = read_your_writes_seconds
+        self._cycle = itertools.cycle(engines)
+        self._recent_writes = TTLCache(maxsize=max_tracked_writes)
+
+        self.replica_reads = 0
+        self.pinned_reads = 0
+
+    def mark_written(self, *keys: Hashable) -> None:
+        if not self.engines or self.read_your_writes_seconds <= 0:
+            return
+
+        expires_at = time.time() + self.read_your_writes_seconds
+        for key in keys:
+            if key is not None:
+                self._recent_writes.set(str(key), True, expires_at)
+
+    def is_pinned(self, key: Hashable | None) -> bool:
+        return key is not None and self._recent_writes.get(str(key), False)
+
+    def choose(self, key: Hashable | None = None) -> AsyncEngine | None:
+        if not self.engines:
+            return None
+
+        if self.is_pinned(key):
+            self.pinned_reads += 1
+            return None
+
+        self.replica_reads += 1
+        if self.strategy == "least_connections":
+            return min(self.engines, key=lambda e: e.sync_engine.pool.checkedout())
+        return next(self._cycle)
+
+    def stats(self) -> dict:
+        return {
+            "replicas": len(self.engines),
+            "strategy": self.strategy,
+            "replica_reads": self.replica_reads,
+            "pinned_reads": self.pinned_reads,
+            "tracked_writes": len(self._recent_writes),
+        }
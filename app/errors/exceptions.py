@@ -51,6 +51,10 @@ class AccessTokenExpiredError(TokenExpiredError):
     detail = "Access token expired"
 
 
+class RevokedTokenError(TokenError):
+    detail = "Token revoked"
+
+
 class ForbiddenError(ClientError):
     status_code = status.HTTP_403_FORBIDDEN
     detail = "Operation forbidden"
@@ -64,6 +68,10 @@ class InactiveUserError(ForbiddenError):
     detail = "Inactive user account"
 
 
+class InvalidCursorError(ClientError):
+    detail = "Invalid pagination cursor"
+
+
 class NotFoundError(ClientError):
     status_code = status.HTTP_404_NOT_FOUND
     detail = "Resource not found"
@@ -82,6 +90,16 @@ class UserAlreadyExistsError(ConflictError):
     detail = "User already exists"
 
 
+class TooManyRequestsError(ClientError):
+    status_code = status.HTTP_429_TOO_MANY_REQUESTS
+    detail = "Too many requests"
+
+    def __init__(self, detail: str | None = None, retry_after: int | None = None):
+        super().__init__(detail)
+        if retry_after is not None:
+            self.headers = {"Retry-After": str(retry_after)}
+
+
 class ValidationError(ClientError):
     status_code = status.HTTP_422_UNPROCESSABLE_ENTITY
     detail = "Validation error"
@@ -97,3 +115,17 @@ class ServerError(BaseHTTPException):
 
 class DatabaseError(ServerError):
     detail = "Database operation failed"
+
+
+class ServiceUnavailableError(ServerError):
+    status_code = status.HTTP_503_SERVICE_UNAVAILABLE
+    detail = "Service temporarily unavailable"
+
+
+class PasswordHasherBusyError(ServiceUnavailableError):
+    detail = "Too many concurrent authentication requests"
+
+    def __init__(self, detail: str | None = None, retry_after: int | None = None):
+        super().__init__(detail)
+        if retry_after is not None:
+            self.headers = {"Retry-After": str(retry_after)}
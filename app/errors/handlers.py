@@ -1,15 +1,66 @@
+import json
 import logging
+import time
+from typing import Callable
 
 from fastapi import Request
-from fastapi.responses import JSONResponse
+from fastapi.responses import JSONResponse, Response
 
+from app.core.config import settings
 from app.errors.exceptions import (
     BaseHTTPException,
+    ClientError,
+    PasswordHasherBusyError,
     ValidationError,
 )
 
 logger = logging.getLogger(__name__)
 
+ERROR_BODY_CACHE_MAX_SIZE = 1024
+
+_error_bodies: dict[tuple[type, int, str], bytes] = {}
+
+
+class LogRateLimiter:
+    """Пропускает не больше ``burst`` записей на ключ за ``interval`` секунд.
+
+    Возвращает число подавленных записей с прошлого пропуска, чтобы
+    его можно было дописать в следующую строку лога.
+    """
+
+    def __init__(
+        self,
+        burst: int,
+        interval: float,
+        clock: Callable[[], float] = time.monotonic,
+    ):
+        self.burst = burst
+        self.interval = interval
+        self._clock = clock
+        self._windows: dict[object, list] = {}
+
+    def acquire(self, key: object) -> int | None:
+        now = self._clock()
+        window = self._windows.get(key)
+        if window is None or now - window[0] >= self.interval:
+            suppressed = window[2] if window is not None else 0
+            self._windows[key] = [now, 1, 0]
+            return suppressed
+
+        if window[1] < self.burst:
+            window[1] += 1
+            suppressed, window[2] = window[2], 0
+            return suppressed
+
+        window[2] += 1
+        return None
+
+
+client_error_log_limiter = LogRateLimiter(
+    burst=settings.CLIENT_ERROR_LOG_BURST,
+    interval=settings.CLIENT_ERROR_LOG_INTERVAL_SECONDS,
+)
+
 
 def get_error_response(request: Request, exc: BaseHTTPException) -> dict:
     error_response = {
@@ -26,17 +77,73 @@ def get_error_response(request: Request, exc: BaseHTTPException) -> dict:
     return error_response
 
 
-async def http_exception_handler(
-    request: Request, exc: BaseHTTPException
-) -> JSONResponse:
+def render_error_body(request: Request, exc: BaseHTTPException) -> bytes:
+    cacheable = isinstance(exc.detail, str) and getattr(exc, "errors", None) is None
+    if cacheable:
+        key = (exc.__class__, exc.status_code, exc.detail)
+        body = _error_bodies.get(key)
+        if body is not None:
+            return body
+
+    body = json.dumps(
+        get_error_response(request, exc),
+        ensure_ascii=False,
+        allow_nan=False,
+        separators=(",", ":"),
+    ).encode("utf-8")
+
+    if cacheable and len(_error_bodies) < ERROR_BODY_CACHE_MAX_SIZE:
+        _error_bodies[key] = body
+    return body
+
+
+def _log_rate_limited(request: Request, exc: BaseHTTPException, message: str) -> None:
+    if not logger.isEnabledFor(logging.WARNING):
+        return
+    suppressed = client_error_log_limiter.acquire(exc.__class__)
+    if suppressed is None:
+        return
+    logger.warning(
+        "%s: %s, status_code=%s, detail=%s, path=%s%s",
+        message,
+        exc.__class__.__name__,
+        exc.status_code,
+        exc.detail,
+        request.url.path,
+        f" ({suppressed} more suppressed)" if suppressed else "",
+        extra={"error_type": exc.__class__.__name__, "suppressed": suppressed},
+    )
+
+
+def _log_http_exception(request: Request, exc: BaseHTTPException) -> None:
+    if isinstance(exc, ClientError):
+        _log_rate_limited(request, exc, "HTTP client error")
+        return
+
+    # Отказ перегруженного пула хеширования — штатная реакция на всплеск
+    # входов, а не сбой: пишем его как предупреждение и с тем же лимитом.
+    if isinstance(exc, PasswordHasherBusyError):
+        _log_rate_limited(request, exc, "HTTP service overloaded")
+        return
+
     logger.error(
-        f"HTTP error: {exc.__class__.__name__}, status_code={exc.status_code}, "
-        f"detail={exc.detail}, path={request.url.path}"
+        "HTTP error: %s, status_code=%s, detail=%s, path=%s",
+        exc.__class__.__name__,
+        exc.status_code,
+        exc.detail,
+        request.url.path,
     )
-    return JSONResponse(
+
+
+async def http_exception_handler(
+    request: Request, exc: BaseHTTPException
+) -> Response:
+    _log_http_exception(request, exc)
+    return Response(
+        content=render_error_body(request, exc),
         status_code=exc.status_code,
-        content=get_error_response(request, exc),
         headers=exc.headers,
+        media_type="application/json",
     )
 
 
@@ -2,16 +2,24 @@ from fastapi import FastAPI
 
 from app.api.routers.auth import auth_router
 from app.api.routers.users import user_router
+from app.api.routers.well_known import well_known_router
+from app.core.config import settings
+from app.core.lifespan import lifespan
 from app.core.logger import configure_logger
 from app.errors.exceptions import BaseHTTPException
 from app.errors.handlers import http_exception_handler, unexpected_exception_handler
+from app.utils.timing import ServerTimingMiddleware
 
 configure_logger()
 
-app = FastAPI()
+app = FastAPI(lifespan=lifespan)
 
 app.add_exception_handler(BaseHTTPException, http_exception_handler)
 app.add_exception_handler(Exception, unexpected_exception_handler)
 
+if settings.SERVER_TIMING_ENABLED:
+    app.add_middleware(ServerTimingMiddleware)
+
 app.include_router(auth_router)
 app.include_router(user_router)
+app.include_router(well_known_router)
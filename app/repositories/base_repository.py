@@ -1,32 +1,85 @@
+import base64
+import binascii
+import json
 import logging
+import uuid
 from abc import ABC, abstractmethod
+from typing import Callable, Hashable, Sequence
 
-from sqlalchemy import delete, insert, select, update
+from sqlalchemy import (
+    Executable,
+    bindparam,
+    delete,
+    insert,
+    select,
+    text,
+    tuple_,
+    update,
+)
+from sqlalchemy.dialects.postgresql import insert as pg_insert
 from sqlalchemy.ext.asyncio import AsyncSession
 
+from app.errors.exceptions import InvalidCursorError
 from app.utils.logging_decorators import log_db_operation
 
 logger = logging.getLogger(__name__)
 
+_statement_cache: dict[tuple, Executable] = {}
+
+
+def encode_cursor(values: list) -> str:
+    raw = json.dumps([str(value) for value in values], separators=(",", ":"))
+    return base64.urlsafe_b64encode(raw.encode()).decode().rstrip("=")
+
+
+def decode_cursor(cursor: str, columns: list) -> list:
+    try:
+        raw = base64.urlsafe_b64decode(cursor + "=" * (-len(cursor) % 4))
+        values = json.loads(raw)
+        if (
+            not isinstance(values, list)
+            or len(values) != len(columns)
+            or not all(isinstance(value, str) for value in values)
+        ):
+            raise InvalidCursorError()
+        return [column.type.python_type(value) for column, value in zip(columns, values)]
+    except (binascii.Error, UnicodeDecodeError, ValueError, TypeError):
+        raise InvalidCursorError()
+
 
 class AbstractRepository(ABC):
 
     @abstractmethod
-    async def find_all(self):
+    async def find_all(self, columns: Sequence[str] | None = None):
         raise NotImplementedError
 
     @abstractmethod
-    async def find_by_id(self, id: int):
+    async def find_by_id(self, id: int, columns: Sequence[str] | None = None):
         raise NotImplementedError
 
     @abstractmethod
-    async def find_by_filters(self, **filters):
+    async def find_by_filters(self, columns: Sequence[str] | None = None, **filters):
+        raise NotImplementedError
+
+    @abstractmethod
+    async def find_page(
+        self,
+        limit: int,
+        cursor: str | None = None,
+        order_by: str = "id",
+        columns: Sequence[str] | None = None,
+        **filters,
+    ) -> tuple[list, str | None]:
         raise NotImplementedError
 
     @abstractmethod
     async def create(self, data: dict):
         raise NotImplementedError
 
+    @abstractmethod
+    async def create_many(self, data: list[dict]) -> list:
+        raise NotImplementedError
+
     @abstractmethod
     async def update(self, id: int, data: dict):
         raise NotImplementedError
@@ -38,26 +91,114 @@ class AbstractRepository(ABC):
 
 class SQLAlchemyRepository(AbstractRepository):
     model = None
+    sortable_columns = ("id",)
+    copy_threshold = 1000
 
     def __init__(self, session: AsyncSession):
         self.session = session
 
+    @classmethod
+    def cached_statement(
+        cls, name: Hashable, build: Callable[[], Executable]
+    ) -> Executable:
+        """Возвращает построенный один раз запрос с bindparam-параметрами.
+
+        SQLAlchemy мемоизирует ключ кэша на объекте запроса, поэтому
+        повторные вызовы не тратят время на построение и хеширование
+        конструкции, а скомпилированный SQL берётся из кэша движка.
+        """
+        key = (cls.model, name)
+        stmt = _statement_cache.get(key)
+        if stmt is None:
+            stmt = _statement_cache[key] = build()
+        return stmt
+
+    def _projection(self, columns: Sequence[str] | None) -> list:
+        """Что выбирать: ORM-сущность целиком или только перечисленные колонки.
+
+        Проекция возвращает лёгкие ``Row`` с доступом по атрибутам и не
+        попадает в identity map сессии.
+        """
+        if columns is None:
+            return [self.model]
+        try:
+            return [self.model.__table__.c[name] for name in columns]
+        except KeyError as e:
+            raise ValueError(f"Неизвестная колонка {e}")
+
+    @staticmethod
+    def _one_or_none(result, columns: Sequence[str] | None):
+        return result.scalar_one_or_none() if columns is None else result.one_or_none()
+
+    @staticmethod
+    def _all(result, columns: Sequence[str] | None):
+        return result.scalars().all() if columns is None else result.all()
+
     @log_db_operation("Получение всех записей")
-    async def find_all(self):
-        result = await self.session.execute(select(self.model))
-        return result.scalars().all()
+    async def find_all(self, columns: Sequence[str] | None = None):
+        result = await self.session.execute(select(*self._projection(columns)))
+        return self._all(result, columns)
 
     @log_db_operation("Получение записи по ID")
-    async def find_by_id(self, id: int):
-        stmt = select(self.model).where(self.model.id == id)
-        result = await self.session.execute(stmt)
-        return result.scalar_one_or_none()
+    async def find_by_id(self, id: int, columns: Sequence[str] | None = None):
+        columns = tuple(columns) if columns is not None else None
+        stmt = self.cached_statement(
+            ("find_by_id", columns),
+            lambda: select(*self._projection(columns)).where(
+                self.model.id == bindparam("id")
+            ),
+        )
+        result = await self.session.execute(stmt, {"id": id})
+        return self._one_or_none(result, columns)
 
     @log_db_operation("Поиск записей по фильтрам")
-    async def find_by_filters(self, **filters):
-        stmt = select(self.model).filter_by(**filters)
+    async def find_by_filters(self, columns: Sequence[str] | None = None, **filters):
+        stmt = select(*self._projection(columns)).filter_by(**filters)
+        result = await self.session.execute(stmt)
+        return self._all(result, columns)
+
+    @log_db_operation("Постраничное получение записей")
+    async def find_page(
+        self,
+        limit: int,
+        cursor: str | None = None,
+        order_by: str = "id",
+        columns: Sequence[str] | None = None,
+        **filters,
+    ) -> tuple[list, str | None]:
+        if order_by not in self.sortable_columns:
+            raise ValueError(f"Сортировка по '{order_by}' не поддерживается")
+
+        key_columns = [getattr(self.model, order_by)]
+        if order_by != "id":
+            key_columns.append(self.model.id)
+
+        if columns is not None:
+            columns = list(columns) + [
+                column.key for column in key_columns if column.key not in columns
+            ]
+
+        stmt = select(*self._projection(columns)).filter_by(**filters)
+        if cursor is not None:
+            last_values = decode_cursor(cursor, key_columns)
+            if len(key_columns) == 1:
+                stmt = stmt.where(key_columns[0] > last_values[0])
+            else:
+                stmt = stmt.where(tuple_(*key_columns) > tuple_(*last_values))
+
+        stmt = stmt.order_by(*key_columns).limit(limit + 1)
         result = await self.session.execute(stmt)
-        return result.scalars().all()
+        items = self._all(result, columns)
+
+        next_cursor = None
+        if len(items) > limit:
+            items = items[:limit]
+            last = items[-1]
+            next_cursor = encode_cursor(
+                [getattr(last, column.key) for column in key_columns]
+            )
+
+        return items, next_cursor
 
     @log_db_operation("Создание новой записи")
     async def create(self, data: dict):
@@ -65,6 +206,80 @@ class SQLAlchemyRepository(AbstractRepository):
         result = await self.session.execute(stmt)
         return result.scalar_one_or_none()
 
+    @log_db_operation("Массовое создание записей")
+    async def create_many(self, data: list[dict], use_copy: bool | None = None) -> list:
+        """Вставляет строки пачкой, пропуская конфликты уникальности.
+
+        Возвращает только реально вставленные строки — по ним вызывающий
+        код определяет, какие записи конфликтовали. На asyncpg большие
+        пачки идут через COPY во временную таблицу. Все строки должны
+        содержать одинаковый набор ключей.
+        """
+        if not data:
+            return []
+
+        keys = data[0].keys()
+        if any(row.keys() != keys for row in data):
+            raise ValueError("Все строки пачки должны содержать одинаковые поля")
+
+        connection = await self.session.connection()
+        if use_copy is None:
+            use_copy = (
+                connection.dialect.driver == "asyncpg"
+                and len(data) >= self.copy_threshold
+            )
+
+        if use_copy:
+            return await self._copy_many(data)
+
+        table = self.model.__table__
+        stmt = pg_insert(table).on_conflict_do_nothing().returning(*table.columns)
+        result = await self.session.execute(stmt, data)
+        return result.all()
+
+    async def _copy_many(self, data: list[dict]) -> list:
+        table = self.model.__table__
+        columns = [column for column in table.columns if column.key in data[0]]
+        generated = [
+            column
+            for column in table.columns
+            if column.key not in data[0]
+            and column.default is not None
+            and column.default.is_callable
+        ]
+        names = [column.name for column in columns + generated]
+
+        records = [
+            tuple(row[column.key] for column in columns)
+            + tuple(column.default.arg(None) for column in generated)
+            for row in data
+        ]
+
+        temp_table = f"tmp_{table.name}_{uuid.uuid4().hex}"
+        column_list = ", ".join(f'"{name}"' for name in names)
+        returning_list = ", ".join(f'"{column.name}"' for column in table.columns)
+        await self.session.execute(
+            text(
+                f'CREATE TEMP TABLE "{temp_table}" '
+                f'(LIKE "{table.name}" INCLUDING DEFAULTS) ON COMMIT DROP'
+            )
+        )
+
+        connection = await self.session.connection()
+        raw_connection = await connection.get_raw_connection()
+        await raw_connection.driver_connection.copy_records_to_table(
+            temp_table, records=records, columns=names
+        )
+
+        result = await self.session.execute(
+            text(
+                f'INSERT INTO "{table.name}" ({column_list}) '
+                f'SELECT {column_list} FROM "{temp_table}" '
+                f"ON CONFLICT DO NOTHING RETURNING {returning_list}"
+            ).columns(*table.columns)
+        )
+        return result.all()
+
     @log_db_operation("Обновление записи")
     async def update(self, id: int, data: dict):
         stmt = (
@@ -0,0 +1,381 @@
+import asyncio
+import heapq
+from collections import namedtuple
+from datetime import datetime
+from functools import cache
+from typing import AsyncIterator, Callable, Sequence
+
+from sqlalchemy import Table
+from sqlalchemy.sql import functions
+
+from app.core.cache import principal_cache
+from app.db.models import RevokedToken, User
+from app.errors.exceptions import DatabaseError
+from app.repositories.base_repository import (
+    AbstractRepository,
+    decode_cursor,
+    encode_cursor,
+)
+from app.repositories.user_repository import UserRepository
+from app.utils.logging_decorators import log_db_operation
+
+
+@cache
+def _row_type(columns: tuple[str, ...]) -> type:
+    return namedtuple("Row", columns)
+
+
+class InMemoryTable:
+    """Строки одной таблицы и хеш-индексы по первичному ключу и уникальным колонкам."""
+
+    def __init__(self, table: Table):
+        self.table = table
+        self.pk = table.primary_key.columns.values()[0].key
+        self.rows: dict = {}
+        self.unique_indexes: dict[str, dict] = {
+            column.key: {}
+            for column in table.columns
+            if column.unique and not column.primary_key
+        }
+
+    def lookup(self, key: str, value) -> dict | None:
+        if key == self.pk:
+            return self.rows.get(value)
+        pk = self.unique_indexes[key].get(value)
+        return None if pk is None else self.rows[pk]
+
+    def conflicts(self, row: dict, ignore_pk=None) -> bool:
+        if row[self.pk] != ignore_pk and row[self.pk] in self.rows:
+            return True
+        return any(
+            index.get(row[key], ignore_pk) != ignore_pk
+            for key, index in self.unique_indexes.items()
+        )
+
+    def insert(self, row: dict) -> None:
+        self.rows[row[self.pk]] = row
+        for key, index in self.unique_indexes.items():
+            index[row[key]] = row[self.pk]
+
+    def remove(self, pk) -> dict:
+        row = self.rows.pop(pk)
+        for key, index in self.unique_indexes.items():
+            index.pop(row[key], None)
+        return row
+
+    def clear(self) -> None:
+        self.rows.clear()
+        for index in self.unique_indexes.values():
+            index.clear()
+
+
+class InMemoryStore:
+    """Общее для всех UoW хранилище таблиц."""
+
+    def __init__(self):
+        self.tables: dict[str, InMemoryTable] = {}
+
+    def table(self, model) -> InMemoryTable:
+        table = self.tables.get(model.__tablename__)
+        if table is None:
+            table = self.tables[model.__tablename__] = InMemoryTable(model.__table__)
+        return table
+
+    def clear(self) -> None:
+        for table in self.tables.values():
+            table.clear()
+
+
+memory_store = InMemoryStore()
+
+
+class InMemoryRepository(AbstractRepository):
+    """Репозиторий поверх ``InMemoryTable`` с семантикой ``SQLAlchemyRepository``.
+
+    Каждое изменение кладёт в журнал UoW функцию отмены, по которому
+    ``rollback`` откатывает незакоммиченные записи.
+    """
+
+    model = None
+    sortable_columns = ("id",)
+
+    def __init__(self, store: InMemoryStore, journal: list[Callable[[], None]]):
+        self.table = store.table(self.model)
+        self.journal = journal
+
+    def _check_columns(self, names) -> None:
+        for name in names:
+            if name not in self.table.table.c:
+                raise ValueError(f"Неизвестная колонка '{name}'")
+
+    def _coerce(self, key: str, value):
+        python_type = self.table.table.c[key].type.python_type
+        if value is None or isinstance(value, python_type):
+            return value
+        return python_type(value)
+
+    def _project(self, row: dict, columns: Sequence[str] | None):
+        if columns is None:
+            return self.model(**row)
+        return _row_type(tuple(columns))._make(row[name] for name in columns)
+
+    def _select(self, filters: dict) -> list[dict]:
+        """Строки под фильтры; по ключу или уникальной колонке — через индекс."""
+        self._check_columns(filters)
+        try:
+            filters = {key: self._coerce(key, value) for key, value in filters.items()}
+        except ValueError:
+            return []
+
+        for key, value in filters.items():
+            if key == self.table.pk or key in self.table.unique_indexes:
+                row = self.table.lookup(key, value)
+                candidates = [] if row is None else [row]
+                break
+        else:
+            candidates = self.table.rows.values()
+
+        return [
+            row
+            for row in candidates
+            if all(row[key] == value for key, value in filters.items())
+        ]
+
+    def _new_row(self, data: dict) -> dict:
+        self._check_columns(data)
+        row = {}
+        for column in self.table.table.columns:
+            if column.key in data:
+                row[column.key] = data[column.key]
+            elif column.default is not None:
+                default = column.default
+                row[column.key] = default.arg(None) if default.is_callable else default.arg
+            elif column.server_default is not None:
+                row[column.key] = self._server_default(column)
+            else:
+                row[column.key] = None
+        return row
+
+    @staticmethod
+    def _server_default(column):
+        arg = column.server_default.arg
+        if isinstance(arg, str):
+            return column.type.python_type(arg)
+        if isinstance(arg, functions.now):
+            return datetime.now()
+        raise NotImplementedError(
+            f"Серверное значение по умолчанию колонки '{column.key}' не поддерживается"
+        )
+
+    def _insert(self, row: dict) -> None:
+        self.table.insert(row)
+        self.journal.append(lambda: self.table.remove(row[self.table.pk]))
+
+    def _replace(self, old: dict, new: dict) -> None:
+        self.table.remove(old[self.table.pk])
+        self.table.insert(new)
+
+        def undo():
+            self.table.remove(new[self.table.pk])
+            self.table.insert(old)
+
+        self.journal.append(undo)
+
+    def _remove(self, row: dict) -> None:
+        self.table.remove(row[self.table.pk])
+        self.journal.append(lambda: self.table.insert(row))
+
+    def _unique_violation(self, operation_name: str) -> DatabaseError:
+        return DatabaseError(
+            detail=(
+                f"Ошибка при выполнении операции '{operation_name}': "
+                f"нарушена уникальность в таблице '{self.table.table.name}'"
+            )
+        )
+
+    @log_db_operation("Получение всех записей")
+    async def find_all(self, columns: Sequence[str] | None = None):
+        if columns is not None:
+            self._check_columns(columns)
+        return [self._project(row, columns) for row in self.table.rows.values()]
+
+    @log_db_operation("Получение записи по ID")
+    async def find_by_id(self, id, columns: Sequence[str] | None = None):
+        if columns is not None:
+            self._check_columns(columns)
+        rows = self._select({self.table.pk: id})
+        return self._project(rows[0], columns) if rows else None
+
+    @log_db_operation("Поиск записей по фильтрам")
+    async def find_by_filters(self, columns: Sequence[str] | None = None, **filters):
+        if columns is not None:
+            self._check_columns(columns)
+        return [self._project(row, columns) for row in self._select(filters)]
+
+    @log_db_operation("Постраничное получение записей")
+    async def find_page(
+        self,
+        limit: int,
+        cursor: str | None = None,
+        order_by: str = "id",
+        columns: Sequence[str] | None = None,
+        **filters,
+    ) -> tuple[list, str | None]:
+        if order_by not in self.sortable_columns:
+            raise ValueError(f"Сортировка по '{order_by}' не поддерживается")
+
+        key_names = [order_by]
+        if order_by != self.table.pk:
+            key_names.append(self.table.pk)
+
+        if columns is not None:
+            self._check_columns(columns)
+            columns = list(columns) + [name for name in key_names if name not in columns]
+
+        def sort_key(row: dict) -> tuple:
+            return tuple(row[name] for name in key_names)
+
+        rows = self._select(filters)
+        if cursor is not None:
+            last_values = tuple(
+                decode_cursor(cursor, [self.table.table.c[name] for name in key_names])
+            )
+            rows = [row for row in rows if sort_key(row) > last_values]
+
+        page = heapq.nsmallest(limit + 1, rows, key=sort_key)
+
+        next_cursor = None
+        if len(page) > limit:
+            page = page[:limit]
+            next_cursor = encode_cursor(list(sort_key(page[-1])))
+
+        return [self._project(row, columns) for row in page], next_cursor
+
+    @log_db_operation("Создание новой записи")
+    async def create(self, data: dict):
+        row = self._new_row(data)
+        if self.table.conflicts(row):
+            raise self._unique_violation("Создание новой записи")
+        self._insert(row)
+        return self._project(row, None)
+
+    @log_db_operation("Массовое создание записей")
+    async def create_many(self, data: list[dict], use_copy: bool | None = None) -> list:
+        """Вставляет строки, пропуская конфликты; ``use_copy`` игнорируется."""
+        if not data:
+            return []
+
+        keys = data[0].keys()
+        if any(row.keys() != keys for row in data):
+            raise ValueError("Все строки пачки должны содержать одинаковые поля")
+
+        all_columns = tuple(self.table.table.c.keys())
+        created = []
+        for item in data:
+            row = self._new_row(item)
+            if self.table.conflicts(row):
+                continue
+            self._insert(row)
+            created.append(self._project(row, all_columns))
+        return created
+
+    @log_db_operation("Обновление записи")
+    async def update(self, id, data: dict):
+        self._check_columns(data)
+        rows = self._select({self.table.pk: id})
+        if not rows:
+            return None
+
+        old = rows[0]
+        new = {**old, **data}
+        if self.table.conflicts(new, ignore_pk=old[self.table.pk]):
+            raise self._unique_violation("Обновление записи")
+        self._replace(old, new)
+        return self._project(new, None)
+
+    @log_db_operation("Удаление записи")
+    async def delete(self, id):
+        rows = self._select({self.table.pk: id})
+        if not rows:
+            return None
+        self._remove(rows[0])
+        return rows[0][self.table.pk]
+
+
+class InMemoryUserRepository(InMemoryRepository):
+    model = User
+    sortable_columns = UserRepository.sortable_columns
+    principal_columns = UserRepository.principal_columns
+    credentials_columns = UserRepository.credentials_columns
+
+    @log_db_operation("Поиск пользователя по email")
+    async def find_by_email(self, email, columns: Sequence[str] | None = None):
+        if columns is not None:
+            self._check_columns(columns)
+        row = self.table.lookup("email", email)
+        return None if row is None else self._project(row, columns)
+
+    @log_db_operation("Обновление хеша пароля")
+    async def update_password_hash(self, id, old_hash: str, new_hash: str) -> bool:
+        """Меняет хеш, только если пароль не успели сменить с момента чтения."""
+        rows = self._select({"id": id, "hashed_password": old_hash})
+        if not rows:
+            return False
+        self._replace(rows[0], {**rows[0], "hashed_password": new_hash})
+        return True
+
+    def _invalidate_principal(self, id) -> None:
+        """Сбрасывает кеш принципала сейчас и при откате изменения.
+
+        Записи видны сразу, поэтому до коммита кеш может получить новую
+        строку; если UoW откатится, её нужно выбросить. Сброс действует
+        только в этом процессе.
+        """
+        key = str(id)
+        principal_cache.pop(key)
+        self.journal.append(lambda: principal_cache.pop(key))
+
+    async def update(self, id, data: dict):
+        user = await super().update(id, data)
+        self._invalidate_principal(id)
+        return user
+
+    async def delete(self, id):
+        deleted_id = await super().delete(id)
+        self._invalidate_principal(id)
+        return deleted_id
+
+
+class InMemoryRevokedTokenRepository(InMemoryRepository):
+    model = RevokedToken
+    sortable_columns = ("jti",)
+
+    @log_db_operation("Отзыв токена")
+    async def revoke(self, jti, user_id, expires_at: datetime) -> bool:
+        """Атомарно отзывает токен; ``False`` — если он уже был отозван."""
+        row = self._new_row({"jti": jti, "user_id": user_id, "expires_at": expires_at})
+        if self.table.conflicts(row):
+            return False
+        self._insert(row)
+        return True
+
+    @log_db_operation("Проверка отзыва токена")
+    async def is_revoked(self, jti) -> bool:
+        return bool(self._select({"jti": jti}))
+
+    @log_db_operation("Удаление истёкших отзывов")
+    async def purge_expired(self, now: datetime) -> int:
+        """Удаляет записи об отзыве токенов, которые уже истекли сами."""
+        expired = [row for row in self.table.rows.values() if row["expires_at"] <= now]
+        for row in expired:
+            self._remove(row)
+        return len(expired)
+
+    async def iter_active_jtis(
+        self, now: datetime, batch_size: int = 10_000
+    ) -> AsyncIterator:
+        jtis = [row["jti"] for row in self.table.rows.values() if row["expires_at"] > now]
+        for offset in range(0, len(jtis), batch_size):
+            for jti in jtis[offset : offset + batch_size]:
+                yield jti
+            await asyncio.sleep(0)
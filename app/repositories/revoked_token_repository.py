@@ -0,0 +1,64 @@
+from datetime import datetime
+from typing import AsyncIterator
+
+from sqlalchemy import bindparam, delete, select
+from sqlalchemy.dialects.postgresql import insert as pg_insert
+
+from app.db.models import RevokedToken
+from app.repositories.base_repository import SQLAlchemyRepository
+from app.utils.logging_decorators import log_db_operation
+
+
+class RevokedTokenRepository(SQLAlchemyRepository):
+    model = RevokedToken
+    sortable_columns = ("jti",)
+
+    @log_db_operation("Отзыв токена")
+    async def revoke(self, jti, user_id, expires_at: datetime) -> bool:
+        """Атомарно отзывает токен; ``False`` — если он уже был отозван."""
+        stmt = self.cached_statement(
+            "revoke",
+            lambda: pg_insert(self.model)
+            .values(
+                jti=bindparam("jti"),
+                user_id=bindparam("user_id"),
+                expires_at=bindparam("expires_at"),
+            )
+            .on_conflict_do_nothing(index_elements=["jti"])
+            .returning(self.model.jti),
+        )
+        result = await self.session.execute(
+            stmt, {"jti": jti, "user_id": user_id, "expires_at": expires_at}
+        )
+        return result.scalar_one_or_none() is not None
+
+    @log_db_operation("Проверка отзыва токена")
+    async def is_revoked(self, jti) -> bool:
+        stmt = self.cached_statement(
+            "is_revoked",
+            lambda: select(self.model.jti).where(self.model.jti == bindparam("jti")),
+        )
+        result = await self.session.execute(stmt, {"jti": jti})
+        return result.scalar_one_or_none() is not None
+
+    @log_db_operation("Удаление истёкших отзывов")
+    async def purge_expired(self, now: datetime) -> int:
+        """Удаляет записи об отзыве токенов, которые уже истекли сами."""
+        stmt = self.cached_statement(
+            "purge_expired",
+            lambda: delete(self.model).where(self.model.expires_at <= bindparam("now")),
+        )
+        result = await self.session.execute(stmt, {"now": now})
+        return result.rowcount
+
+    async def iter_active_jtis(
+        self, now: datetime, batch_size: int = 10_000
+    ) -> AsyncIterator:
+        stmt = (
+            select(self.model.jti)
+            .where(self.model.expires_at > now)
+            .execution_options(yield_per=batch_size)
+        )
+        result = await self.session.stream_scalars(stmt)
+        async for jti in result:
+            yield jti
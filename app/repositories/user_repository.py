@@ -1,20 +1,94 @@
 import logging
+from typing import Sequence
 
-from sqlalchemy import select
+from sqlalchemy import bindparam, event, select, update
+from sqlalchemy.orm import Session
 
+from app.core.cache import principal_cache
+from app.db.database import replica_router
 from app.db.models import User
 from app.repositories.base_repository import SQLAlchemyRepository
 from app.utils.logging_decorators import log_db_operation
 
 logger = logging.getLogger(__name__)
 
+_PENDING_INVALIDATIONS = "principal_cache_invalidations"
+
+
+@event.listens_for(Session, "after_commit")
+def _invalidate_committed_principals(session: Session) -> None:
+    for key in session.info.pop(_PENDING_INVALIDATIONS, ()):
+        principal_cache.pop(key)
+
 
 class UserRepository(SQLAlchemyRepository):
     model = User
+    sortable_columns = ("id", "email")
+    principal_columns = ("id", "email", "role")
+    credentials_columns = principal_columns + ("hashed_password",)
 
     @log_db_operation("Поиск пользователя по email")
-    async def find_by_email(self, email):
-        stmt = select(self.model).where(self.model.email == email)
-        result = await self.session.execute(stmt)
-        user = result.scalar_one_or_none()
+    async def find_by_email(self, email, columns: Sequence[str] | None = None):
+        columns = tuple(columns) if columns is not None else None
+        stmt = self.cached_statement(
+            ("find_by_email", columns),
+            lambda: select(*self._projection(columns)).where(
+                self.model.email == bindparam("email")
+            ),
+        )
+        result = await self.session.execute(stmt, {"email": email})
+        return self._one_or_none(result, columns)
+
+    @log_db_operation("Обновление хеша пароля")
+    async def update_password_hash(self, id, old_hash: str, new_hash: str) -> bool:
+        """Меняет хеш, только если пароль не успели сменить с момента чтения."""
+        stmt = self.cached_statement(
+            "update_password_hash",
+            lambda: update(self.model)
+            .where(
+                self.model.id == bindparam("user_id"),
+                self.model.hashed_password == bindparam("old_hash"),
+            )
+            .values(hashed_password=bindparam("new_hash"))
+            .execution_options(synchronize_session=False),
+        )
+        result = await self.session.execute(
+            stmt, {"user_id": id, "old_hash": old_hash, "new_hash": new_hash}
+        )
+        replica_router.mark_written(id)
+        return result.rowcount == 1
+
+    async def create(self, data: dict):
+        user = await super().create(data)
+        if user is not None:
+            replica_router.mark_written(user.id, user.email)
         return user
+
+    async def create_many(self, data: list[dict], use_copy: bool | None = None) -> list:
+        users = await super().create_many(data, use_copy=use_copy)
+        for user in users:
+            replica_router.mark_written(user.id, user.email)
+        return users
+
+    def _invalidate_principal(self, id) -> None:
+        """Сбрасывает кеш принципала сейчас и ещё раз после коммита.
+
+        Между изменением и коммитом параллельный запрос может прочитать и
+        закешировать старую строку. Сброс действует только в этом процессе:
+        другие воркеры увидят изменение по истечении TTL кеша.
+        """
+        key = str(id)
+        principal_cache.pop(key)
+        self.session.info.setdefault(_PENDING_INVALIDATIONS, set()).add(key)
+
+    async def update(self, id, data: dict):
+        user = await super().update(id, data)
+        self._invalidate_principal(id)
+        replica_router.mark_written(id, data.get("email"))
+        return user
+
+    async def delete(self, id):
+        deleted_id = await super().delete(id)
+        self._invalidate_principal(id)
+        replica_router.mark_written(id)
+        return deleted_id
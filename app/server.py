@@ -0,0 +1,128 @@
+import logging
+import math
+import os
+import random
+
+import uvicorn
+from uvicorn.supervisors import Multiprocess
+
+from app.core.config import settings
+from app.core.logger import configure_logger
+
+logger = logging.getLogger(__name__)
+
+
+def available_cpus(cgroup_cpu_max: str = "/sys/fs/cgroup/cpu.max") -> int:
+    """Ядра, доступные процессу: с учётом affinity и квоты cgroup v2, а не все ядра узла."""
+    try:
+        cpus = len(os.sched_getaffinity(0))
+    except AttributeError:
+        cpus = os.cpu_count() or 1
+
+    try:
+        with open(cgroup_cpu_max) as f:
+            quota, period = f.read().split()
+    except (OSError, ValueError):
+        return cpus
+
+    if quota != "max":
+        cpus = min(cpus, max(math.ceil(int(quota) / int(period)), 1))
+    return cpus
+
+
+def worker_limits(workers: int) -> dict[str, int]:
+    """Пул БД и пул хеширования на один воркер.
+
+    Все воркеры вместе держат не больше ``DB_MAX_CONNECTIONS -
+    DB_RESERVED_CONNECTIONS`` соединений, включая overflow; потоки
+    хеширования делят ядра, а не берут их все в каждом воркере.
+
+    Лимиты ``LOGIN_THROTTLE_*`` не делятся: корзины живут в памяти
+    воркера, и фактический лимит — настроенный, умноженный на число
+    воркеров. Общий лимит требует общего хранилища корзин.
+    """
+    budget = max((settings.DB_MAX_CONNECTIONS - settings.DB_RESERVED_CONNECTIONS) // workers, 1)
+    pool_size = min(settings.DB_POOL_SIZE, budget)
+    limits = {
+        "DB_POOL_SIZE": pool_size,
+        "DB_MAX_OVERFLOW": min(settings.DB_MAX_OVERFLOW, budget - pool_size),
+        "DB_POOL_ADAPTIVE_MAX_OVERFLOW": min(
+            settings.DB_POOL_ADAPTIVE_MAX_OVERFLOW, budget - pool_size
+        ),
+        "PASSWORD_HASHER_WORKERS": settings.PASSWORD_HASHER_WORKERS
+        or max(available_cpus() // workers, 1),
+    }
+
+    if pool_size < settings.DB_POOL_SIZE:
+        logger.warning(
+            "Пул БД урезан до %s соединений на воркер: %s воркеров при лимите %s",
+            pool_size,
+            workers,
+            settings.DB_MAX_CONNECTIONS,
+        )
+    return limits
+
+
+def apply_worker_limits(limits: dict[str, int]) -> None:
+    # Воркеры запускаются через spawn и читают настройки заново: переменные
+    # окружения перекрывают .env. Этот процесс правим напрямую.
+    for name, value in limits.items():
+        os.environ[name] = str(value)
+        setattr(settings, name, value)
+
+
+class ServerConfig(uvicorn.Config):
+    """``uvicorn.Config``, где каждый воркер добавляет к ``limit_max_requests`` свой разброс.
+
+    ``load`` вызывается уже в процессе воркера, в том числе после его
+    перезапуска, поэтому воркеры, стартовавшие вместе, не
+    перезапускаются одновременно.
+    """
+
+    def __init__(self, *args, max_requests_jitter: int = 0, **kwargs):
+        super().__init__(*args, **kwargs)
+        self.max_requests_jitter = max_requests_jitter
+
+    def load(self) -> None:
+        if self.limit_max_requests and self.max_requests_jitter:
+            self.limit_max_requests += random.randint(0, self.max_requests_jitter)
+        super().load()
+
+
+def build_config(workers: int) -> ServerConfig:
+    return ServerConfig(
+        "app.main:app",
+        host=settings.SERVER_HOST,
+        port=settings.SERVER_PORT,
+        workers=workers,
+        loop=settings.SERVER_LOOP,
+        http=settings.SERVER_HTTP,
+        backlog=settings.SERVER_BACKLOG,
+        timeout_keep_alive=settings.SERVER_KEEPALIVE_SECONDS,
+        limit_concurrency=settings.SERVER_LIMIT_CONCURRENCY or None,
+        limit_max_requests=settings.SERVER_MAX_REQUESTS or None,
+        max_requests_jitter=settings.SERVER_MAX_REQUESTS_JITTER,
+        access_log=settings.SERVER_ACCESS_LOG,
+        log_config=None,
+    )
+
+
+def main() -> None:
+    configure_logger()
+
+    workers = settings.SERVER_WORKERS or available_cpus()
+    limits = worker_limits(workers)
+    apply_worker_limits(limits)
+    logger.info("Запуск сервера: workers=%s, %s", workers, limits)
+
+    config = build_config(workers)
+    server = uvicorn.Server(config)
+    if workers > 1:
+        sock = config.bind_socket()
+        Multiprocess(config, target=server.run, sockets=[sock]).run()
+    else:
+        server.run()
+
+
+if __name__ == "__main__":
+    main()
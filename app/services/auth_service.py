@@ -1,20 +1,36 @@
-from datetime import timedelta
-from uuid import UUID
+import logging
+from datetime import datetime, timedelta
+from uuid import UUID, uuid4
 
-from app.api.schemas.auth import AccessTokenResponse, RefreshTokenRequest, TokenPair
+from fastapi import BackgroundTasks
+
+from app.api.schemas.auth import RefreshTokenRequest, TokenPair
 from app.api.schemas.user import UserCreate, UserLogin, UserResponse
 from app.core.config import settings
-from app.core.security import create_token, hash_password, verify_password, verify_token
+from app.core.revocation import revocation_list
+from app.core.security import (
+    create_token,
+    hash_password_async,
+    password_needs_rehash,
+    verify_password_async,
+    verify_token_payload,
+)
+from app.core.throttling import login_throttle
+from app.db.models import UserRole
 from app.errors.exceptions import (
     AccessTokenExpiredError,
     InvalidCredentialsError,
     RefreshTokenExpiredError,
+    RevokedTokenError,
     TokenError,
     TokenExpiredError,
     UserAlreadyExistsError,
 )
+from app.utils.timing import span
 from app.utils.unitofwork import IUnitOfWork
 
+logger = logging.getLogger(__name__)
+
 
 class AuthService:
 
@@ -23,69 +39,188 @@ class AuthService:
 
     async def register(self, user: UserCreate) -> UserResponse:
         async with self.uow as uow:
-            user_exists = await uow.user_repo.find_by_email(user.email)
+            user_exists = await uow.user_repo.find_by_email(user.email, columns=("id",))
             if user_exists:
                 raise UserAlreadyExistsError()
 
-            hashed_password = hash_password(user.password)
+            hashed_password = await hash_password_async(user.password)
             new_user_data = {"email": user.email, "hashed_password": hashed_password}
 
             created_user = await uow.user_repo.create(new_user_data)
-            user_response = UserResponse.model_validate(created_user)
+            with span("validation"):
+                user_response = UserResponse.model_validate(created_user)
             await uow.commit()
 
             return user_response
 
-    async def login(self, credentials: UserLogin) -> TokenPair:
-        user = await self._authenticate(credentials)
+    async def login(
+        self,
+        credentials: UserLogin,
+        client_ip: str | None = None,
+        background_tasks: BackgroundTasks | None = None,
+    ) -> TokenPair:
+        login_throttle.check(credentials.email, client_ip)
+        user = await self._authenticate(credentials, background_tasks)
 
-        access_token = self.create_access_token(user.id)
+        access_token = self.create_access_token(user.id, self.principal_claims(user))
         refresh_token = self.create_refresh_token(user.id)
 
         return TokenPair(access_token=access_token, refresh_token=refresh_token)
 
-    async def refresh(self, refresh_token: RefreshTokenRequest) -> AccessTokenResponse:
-        sub = self.verify_refresh_token(refresh_token.refresh_token)
-        access_token = self.create_access_token(sub)
-        return AccessTokenResponse(access_token=access_token)
+    async def refresh(self, refresh_token: RefreshTokenRequest) -> TokenPair:
+        payload = self.verify_refresh_token_payload(refresh_token.refresh_token)
+        sub, jti = payload["sub"], self._token_id(payload)
+
+        async with self.uow as uow:
+            if await revocation_list.is_revoked(jti, uow.revoked_token_repo):
+                raise RevokedTokenError()
+
+            claims = {}
+            if settings.ACCESS_TOKEN_CLAIMS_MODE:
+                user = await uow.user_repo.find_by_id(
+                    sub, columns=uow.user_repo.principal_columns
+                )
+                if not user:
+                    raise InvalidCredentialsError()
+                claims = self.principal_claims(UserResponse.model_validate(user))
+
+            if not await self._revoke_refresh_token(uow, jti, payload):
+                revocation_list.add(jti)
+                logger.warning(
+                    "Повторное использование refresh-токена: jti=%s, sub=%s", jti, sub
+                )
+                raise RevokedTokenError()
+            await uow.commit()
+
+        revocation_list.add(jti)
+        return TokenPair(
+            access_token=self.create_access_token(sub, claims),
+            refresh_token=self.create_refresh_token(sub),
+        )
+
+    async def logout(self, refresh_token: RefreshTokenRequest) -> None:
+        payload = self.verify_refresh_token_payload(refresh_token.refresh_token)
+        jti = self._token_id(payload)
 
-    async def _authenticate(self, credentials: UserLogin) -> UserResponse:
         async with self.uow as uow:
-            user = await uow.user_repo.find_by_email(credentials.email)
-            if not user or not verify_password(
+            await self._revoke_refresh_token(uow, jti, payload)
+            await uow.commit()
+
+        revocation_list.add(jti)
+
+    @staticmethod
+    async def _revoke_refresh_token(uow: IUnitOfWork, jti: UUID, payload: dict) -> bool:
+        return await uow.revoked_token_repo.revoke(
+            jti, UUID(payload["sub"]), datetime.utcfromtimestamp(payload["exp"])
+        )
+
+    async def _authenticate(
+        self, credentials: UserLogin, background_tasks: BackgroundTasks | None = None
+    ) -> UserResponse:
+        async with self.uow.read_only(consistency_key=credentials.email) as uow:
+            user = await uow.user_repo.find_by_email(
+                credentials.email, columns=uow.user_repo.credentials_columns
+            )
+            if not user or not await verify_password_async(
                 credentials.password, user.hashed_password
             ):
                 raise InvalidCredentialsError()
-            return UserResponse.model_validate(user)
+
+            if (
+                background_tasks is not None
+                and settings.PASSWORD_REHASH_ON_LOGIN
+                and password_needs_rehash(user.hashed_password)
+            ):
+                background_tasks.add_task(
+                    self._rehash_password,
+                    user.id,
+                    credentials.password,
+                    user.hashed_password,
+                )
+
+            with span("validation"):
+                return UserResponse.model_validate(user)
+
+    async def _rehash_password(self, user_id: UUID, password: str, old_hash: str) -> None:
+        # Отдельный UoW: запросный read-only, может смотреть в реплику и к
+        # моменту запуска фоновой задачи уже закрыт.
+        try:
+            new_hash = await hash_password_async(password)
+            async with type(self.uow)() as uow:
+                updated = await uow.user_repo.update_password_hash(
+                    user_id, old_hash, new_hash
+                )
+                await uow.commit()
+        except Exception:
+            logger.exception("Не удалось перехешировать пароль пользователя %s", user_id)
+            return
+
+        if updated:
+            logger.info("Пароль пользователя %s перехеширован", user_id)
 
     @staticmethod
-    def verify_access_token(token: str):
+    def verify_access_token_payload(token: str) -> dict:
         try:
-            return verify_token(token, token_type="access")
+            return verify_token_payload(token, token_type="access")
         except TokenExpiredError:
             raise AccessTokenExpiredError()
         except TokenError as e:
             raise InvalidCredentialsError(detail=str(e))
 
+    @classmethod
+    def verify_access_token(cls, token: str):
+        return cls.verify_access_token_payload(token)["sub"]
+
+    @classmethod
+    def get_principal_from_token(cls, token: str) -> UserResponse | None:
+        payload = cls.verify_access_token_payload(token)
+        if "role" not in payload or "email" not in payload:
+            return None
+
+        return UserResponse.model_construct(
+            id=UUID(payload["sub"]),
+            email=payload["email"],
+            role=UserRole(payload["role"]),
+        )
+
     @staticmethod
-    def verify_refresh_token(token: str):
+    def verify_refresh_token_payload(token: str) -> dict:
         try:
-            return verify_token(token, token_type="refresh")
+            return verify_token_payload(token, token_type="refresh")
         except TokenExpiredError:
             raise RefreshTokenExpiredError()
         except TokenError as e:
             raise InvalidCredentialsError(detail=str(e))
 
+    @classmethod
+    def verify_refresh_token(cls, token: str):
+        return cls.verify_refresh_token_payload(token)["sub"]
+
+    @staticmethod
+    def _token_id(payload: dict) -> UUID:
+        try:
+            return UUID(payload["jti"])
+        except (KeyError, TypeError, ValueError):
+            raise InvalidCredentialsError(detail="Token id not found")
+
+    @staticmethod
+    def principal_claims(user: UserResponse) -> dict:
+        if not settings.ACCESS_TOKEN_CLAIMS_MODE:
+            return {}
+        return {"email": user.email, "role": user.role.value}
+
     @staticmethod
-    def create_access_token(user_id: int | UUID | str) -> str:
+    def create_access_token(
+        user_id: int | UUID | str, claims: dict | None = None
+    ) -> str:
         return create_token(
-            {"sub": str(user_id), "type": "access"},
+            {**(claims or {}), "sub": str(user_id), "type": "access"},
             timedelta(minutes=settings.ACCESS_TOKEN_EXPIRE_MINUTES),
         )
 
     @staticmethod
     def create_refresh_token(user_id: int | UUID | str) -> str:
         return create_token(
-            {"sub": str(user_id), "type": "refresh"},
+            {"sub": str(user_id), "type": "refresh", "jti": str(uuid4())},
             timedelta(days=settings.REFRESH_TOKEN_EXPIRE_DAYS),
         )
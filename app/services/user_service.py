@@ -1,5 +1,22 @@
-from app.api.schemas.user import UserResponse
-from app.errors.exceptions import UserNotFoundError
+import time
+from typing import AsyncIterator
+
+from pydantic import ValidationError
+
+from app.api.schemas.user import (
+    BulkImportResult,
+    BulkImportRowError,
+    UserImport,
+    UserPage,
+    UserPartialResponse,
+    UserResponse,
+)
+from app.core.cache import principal_cache
+from app.core.config import settings
+from app.core.security import hash_passwords_async
+from app.errors.exceptions import UserAlreadyExistsError, UserNotFoundError
+from app.utils.ndjson import iter_ndjson_lines
+from app.utils.timing import span
 from app.utils.unitofwork import IUnitOfWork
 
 
@@ -9,9 +26,121 @@ class UserService:
         self.uow = uow
 
     async def get_user_by_id(self, id: int) -> UserResponse:
-        async with self.uow as uow:
-            user = await uow.user_repo.find_by_id(id)
+        if settings.PRINCIPAL_CACHE_ENABLED:
+            cached_user = principal_cache.get(str(id))
+            if cached_user is not None:
+                return cached_user
+
+        async with self.uow.read_only(consistency_key=id) as uow:
+            user = await uow.user_repo.find_by_id(
+                id, columns=uow.user_repo.principal_columns
+            )
             if not user:
                 raise UserNotFoundError()
 
-            return UserResponse.model_validate(user)
+            with span("validation"):
+                user_response = UserResponse.model_validate(user)
+
+        if settings.PRINCIPAL_CACHE_ENABLED:
+            principal_cache.set(
+                str(id),
+                user_response,
+                expires_at=time.time() + settings.PRINCIPAL_CACHE_TTL_SECONDS,
+            )
+
+        return user_response
+
+    async def list_users(
+        self,
+        limit: int,
+        cursor: str | None = None,
+        order_by: str = "id",
+        fields: tuple[str, ...] | None = None,
+    ) -> UserPage:
+        async with self.uow.read_only() as uow:
+            fields = fields or uow.user_repo.principal_columns
+            rows, next_cursor = await uow.user_repo.find_page(
+                limit, cursor=cursor, order_by=order_by, columns=fields
+            )
+
+        return UserPage(
+            items=[
+                UserPartialResponse.model_validate(
+                    {field: getattr(row, field) for field in fields}
+                )
+                for row in rows
+            ],
+            next_cursor=next_cursor,
+        )
+
+    async def import_users(self, chunks: AsyncIterator[bytes]) -> BulkImportResult:
+        result = BulkImportResult()
+        batch: list[tuple[int, UserImport]] = []
+        seen_emails: set[str] = set()
+
+        async for line_no, line in iter_ndjson_lines(
+            chunks, settings.BULK_IMPORT_MAX_LINE_BYTES
+        ):
+            if line is None:
+                result.errors.append(
+                    BulkImportRowError(line=line_no, error="Line is too long")
+                )
+                continue
+
+            try:
+                batch.append((line_no, UserImport.model_validate_json(line)))
+            except ValidationError as e:
+                result.errors.append(
+                    BulkImportRowError(line=line_no, error=e.errors()[0]["msg"])
+                )
+                continue
+
+            if len(batch) >= settings.BULK_IMPORT_BATCH_SIZE:
+                await self._import_batch(batch, result, seen_emails)
+                batch = []
+
+        if batch:
+            await self._import_batch(batch, result, seen_emails)
+
+        result.conflicts.sort(key=lambda conflict: conflict.line)
+        return result
+
+    async def _import_batch(
+        self,
+        batch: list[tuple[int, UserImport]],
+        result: BulkImportResult,
+        seen_emails: set[str],
+    ) -> None:
+        unique = []
+        for line_no, user in batch:
+            if user.email in seen_emails:
+                result.conflicts.append(
+                    BulkImportRowError(
+                        line=line_no, email=user.email, error="Duplicate email in import"
+                    )
+                )
+            else:
+                seen_emails.add(user.email)
+                unique.append((line_no, user))
+
+        hashed_passwords = await hash_passwords_async(
+            [user.password for _, user in unique]
+        )
+        rows = [
+            {"email": user.email, "hashed_password": hashed_password, "role": user.role}
+            for (_, user), hashed_password in zip(unique, hashed_passwords)
+        ]
+
+        async with self.uow as uow:
+            created = await uow.user_repo.create_many(rows)
+            await uow.commit()
+
+        created_emails = {user.email for user in created}
+        result.created += len(created)
+        result.conflicts.extend(
+            BulkImportRowError(
+                line=line_no, email=user.email, error=UserAlreadyExistsError.detail
+            )
+            for line_no, user in unique
+            if user.email not in created_emails
+        )
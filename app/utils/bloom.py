@@ -0,0 +1,56 @@
+import hashlib
+import math
+
+
+class BloomFilter:
+    """Битовый Bloom-фильтр: «нет» — точно нет, «да» — возможно да.
+
+    Размер и число хешей подбираются под ``capacity`` элементов и
+    заданную долю ложных срабатываний; позиции считаются двойным
+    хешированием по одному blake2b-дайджесту.
+    """
+
+    def __init__(self, capacity: int, error_rate: float = 0.001):
+        self.capacity = capacity
+        self.error_rate = error_rate
+        self.size = max(
+            8, math.ceil(-capacity * math.log(error_rate) / math.log(2) ** 2)
+        )
+        self.hash_count = max(1, round(self.size / capacity * math.log(2)))
+        self.clear()
+
+    def _positions(self, item: str) -> list[int]:
+        digest = hashlib.blake2b(item.encode(), digest_size=16).digest()
+        h1 = int.from_bytes(digest[:8], "little")
+        h2 = int.from_bytes(digest[8:], "little") | 1
+        return [(h1 + i * h2) % self.size for i in range(self.hash_count)]
+
+    def add(self, item: str) -> None:
+        for position in self._positions(item):
+            self._bits[position >> 3] |= 1 << (position & 7)
+        self.count += 1
+
+    def __contains__(self, item: str) -> bool:
+        return all(
+            self._bits[position >> 3] & (1 << (position & 7))
+            for position in self._positions(item)
+        )
+
+    def __len__(self) -> int:
+        return self.count
+
+    def clear(self) -> None:
+        self._bits = bytearray((self.size + 7) // 8)
+        self.count = 0
+
+    def stats(self) -> dict:
+        return {
+            "count": self.count,
+            "capacity": self.capacity,
+            "size_bits": self.size,
+            "hash_count": self.hash_count,
+            "expected_error_rate": (
+                1 - math.exp(-self.hash_count * self.count / self.size)
+            )
+            ** self.hash_count,
+        }
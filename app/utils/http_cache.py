@@ -0,0 +1,54 @@
+import hashlib
+from typing import Any, Callable
+
+from fastapi import Depends, Request, Response
+from fastapi.responses import JSONResponse
+
+PRIVATE_REVALIDATE = "private, no-cache"
+NO_STORE = "no-store"
+
+
+def weak_etag(*parts: Any) -> str:
+    """Слабый ETag из частей представления: ``W/"<16 hex>"``."""
+    raw = "\x1f".join(str(part) for part in parts).encode()
+    return f'W/"{hashlib.blake2b(raw, digest_size=8).hexdigest()}"'
+
+
+def etag_matches(if_none_match: str | None, etag: str) -> bool:
+    """Слабое сравнение для ``If-None-Match``: префикс ``W/`` не учитывается."""
+    if not if_none_match:
+        return False
+    if if_none_match.strip() == "*":
+        return True
+
+    opaque = etag.removeprefix("W/")
+    return any(
+        tag.strip().removeprefix("W/") == opaque for tag in if_none_match.split(",")
+    )
+
+
+def conditional_json(
+    request: Request,
+    etag: str,
+    render: Callable[[], Any],
+    cache_control: str = PRIVATE_REVALIDATE,
+) -> Response:
+    """304 без тела, если клиент прислал совпадающий ETag, иначе JSON из ``render()``.
+
+    ``render`` вызывается только для 200, так что на неизменившемся
+    ресурсе ответ не собирается и не сериализуется.
+    """
+    headers = {"ETag": etag, "Cache-Control": cache_control, "Vary": "Authorization"}
+    if etag_matches(request.headers.get("if-none-match"), etag):
+        return Response(status_code=304, headers=headers)
+    return JSONResponse(render(), headers=headers)
+
+
+def cache_control(value: str):
+    """Зависимость маршрута: ``Cache-Control`` и ``Vary: Authorization`` для ответа."""
+
+    def set_headers(response: Response) -> None:
+        response.headers["Cache-Control"] = value
+        response.headers["Vary"] = "Authorization"
+
+    return Depends(set_headers)
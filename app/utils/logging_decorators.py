@@ -1,34 +1,91 @@
+import functools
 import logging
+import time
+from contextvars import ContextVar
 
 from sqlalchemy.exc import SQLAlchemyError
 
+from app.core.config import settings
 from app.errors.exceptions import DatabaseError
+from app.utils.metrics import OperationMetrics
+from app.utils.timing import record_span
 
 logger = logging.getLogger(__name__)
 
+db_operation_metrics = OperationMetrics()
+last_statement: ContextVar[str | None] = ContextVar("last_statement", default=None)
+
+
+def record_statement(conn, cursor, statement, parameters, context, executemany):
+    last_statement.set(statement)
+
 
 def log_db_operation(operation_name: str):
     def decorator(func):
-        async def wrapper(self, *args, **kwargs):
-            logger.debug(
-                "Начало операции '%s'. Аргументы: args=%s, kwargs=%s",
-                operation_name,
-                args,
-                kwargs,
-            )
-            try:
-                result = await func(self, *args, **kwargs)
+        if not settings.DB_INSTRUMENTATION_ENABLED:
+
+            @functools.wraps(func)
+            async def wrapper(self, *args, **kwargs):
+                try:
+                    return await func(self, *args, **kwargs)
+                except SQLAlchemyError as e:
+                    raise DatabaseError(
+                        detail=f"Ошибка при выполнении операции '{operation_name}': {str(e)}"
+                    )
+
+            return wrapper
+
+        @functools.wraps(func)
+        async def instrumented_wrapper(self, *args, **kwargs):
+            metric_name = f"{type(self).__name__}.{func.__name__}"
+            if logger.isEnabledFor(logging.DEBUG):
                 logger.debug(
-                    "Операция '%s' успешно завершена. Результат: %s",
+                    "Начало операции '%s'. Аргументы: args=%s, kwargs=%s",
                     operation_name,
-                    result,
+                    args,
+                    kwargs,
                 )
-                return result
+
+            last_statement.set(None)
+            start = time.perf_counter()
+            try:
+                result = await func(self, *args, **kwargs)
             except SQLAlchemyError as e:
+                duration_ms = (time.perf_counter() - start) * 1000
+                db_operation_metrics.observe(metric_name, duration_ms, error=True)
+                record_span("db", duration_ms)
                 raise DatabaseError(
                     detail=f"Ошибка при выполнении операции '{operation_name}': {str(e)}"
                 )
 
-        return wrapper
+            duration_ms = (time.perf_counter() - start) * 1000
+            db_operation_metrics.observe(metric_name, duration_ms)
+            record_span("db", duration_ms)
+
+            if duration_ms >= settings.DB_SLOW_OPERATION_MS:
+                statement = last_statement.get()
+                logger.warning(
+                    "Медленная операция '%s' (%s): %.1f мс. SQL: %s",
+                    operation_name,
+                    metric_name,
+                    duration_ms,
+                    statement,
+                    extra={
+                        "db_operation": metric_name,
+                        "duration_ms": round(duration_ms, 3),
+                        "sql": statement,
+                    },
+                )
+
+            if logger.isEnabledFor(logging.DEBUG):
+                logger.debug(
+                    "Операция '%s' успешно завершена за %.1f мс. Результат: %s",
+                    operation_name,
+                    duration_ms,
+                    result,
+                )
+            return result
+
+        return instrumented_wrapper
 
     return decorator
@@ -0,0 +1,76 @@
+import bisect
+from itertools import accumulate
+
+DEFAULT_LATENCY_BUCKETS_MS = (1, 2.5, 5, 10, 25, 50, 100, 250, 500, 1000, 2500, 5000)
+
+
+class LatencyHistogram:
+    def __init__(self, buckets: tuple[float, ...] = DEFAULT_LATENCY_BUCKETS_MS):
+        self.buckets = tuple(buckets)
+        self.reset()
+
+    def reset(self) -> None:
+        self.counts = [0] * (len(self.buckets) + 1)
+        self.count = 0
+        self.total = 0.0
+        self.max = 0.0
+
+    def observe(self, value_ms: float) -> None:
+        self.counts[bisect.bisect_left(self.buckets, value_ms)] += 1
+        self.count += 1
+        self.total += value_ms
+        if value_ms > self.max:
+            self.max = value_ms
+
+    def percentile(self, q: float) -> float:
+        if not self.count:
+            return 0.0
+
+        rank = q * self.count
+        seen = 0
+        for bound, bucket_count in zip(self.buckets, self.counts):
+            seen += bucket_count
+            if seen >= rank:
+                return min(bound, self.max)
+        return self.max
+
+    def snapshot(self) -> dict:
+        return {
+            "count": self.count,
+            "avg_ms": self.total / self.count if self.count else 0.0,
+            "p50_ms": self.percentile(0.5),
+            "p95_ms": self.percentile(0.95),
+            "p99_ms": self.percentile(0.99),
+            "max_ms": self.max,
+            "buckets": dict(
+                zip(
+                    [f"le_{bound}" for bound in self.buckets] + ["le_inf"],
+                    accumulate(self.counts),
+                )
+            ),
+        }
+
+
+class OperationMetrics:
+    def __init__(self, buckets: tuple[float, ...] = DEFAULT_LATENCY_BUCKETS_MS):
+        self.buckets = buckets
+        self._latency: dict[str, LatencyHistogram] = {}
+        self._errors: dict[str, int] = {}
+
+    def observe(self, name: str, duration_ms: float, error: bool = False) -> None:
+        histogram = self._latency.get(name)
+        if histogram is None:
+            histogram = self._latency[name] = LatencyHistogram(self.buckets)
+        histogram.observe(duration_ms)
+        if error:
+            self._errors[name] = self._errors.get(name, 0) + 1
+
+    def reset(self) -> None:
+        self._latency.clear()
+        self._errors.clear()
+
+    def snapshot(self) -> dict:
+        return {
+            name: {**histogram.snapshot(), "errors": self._errors.get(name, 0)}
+            for name, histogram in self._latency.items()
+        }
@@ -0,0 +1,38 @@
+from typing import AsyncIterator
+
+
+async def iter_ndjson_lines(
+    chunks: AsyncIterator[bytes], max_line_bytes: int
+) -> AsyncIterator[tuple[int, bytes | None]]:
+    """Режет поток байт на строки NDJSON, не держа в памяти больше одной строки.
+
+    Пустые строки пропускаются, но учитываются в нумерации. Вместо строк
+    длиннее ``max_line_bytes`` отдаётся ``None``.
+    """
+    buffer = b""
+    line_no = 0
+    oversized = False
+
+    async for chunk in chunks:
+        buffer += chunk
+        # Остаток буфера отрезается один раз на чанк, а не после каждой строки.
+        start = 0
+        while (newline := buffer.find(b"\n", start)) != -1:
+            line = buffer[start:newline]
+            start = newline + 1
+            line_no += 1
+            if oversized or len(line) > max_line_bytes:
+                oversized = False
+                yield line_no, None
+            elif line.strip():
+                yield line_no, line
+
+        buffer = buffer[start:]
+        if len(buffer) > max_line_bytes:
+            oversized = True
+            buffer = b""
+
+    if oversized:
+        yield line_no + 1, None
+    elif buffer.strip():
+        yield line_no + 1, buffer
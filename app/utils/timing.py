@@ -0,0 +1,100 @@
+import logging
+import time
+from contextvars import ContextVar
+
+logger = logging.getLogger("app.access")
+
+_spans: ContextVar[dict[str, list[float]] | None] = ContextVar(
+    "timing_spans", default=None
+)
+
+
+def record_span(name: str, duration_ms: float) -> None:
+    spans = _spans.get()
+    if spans is None:
+        return
+
+    entry = spans.get(name)
+    if entry is None:
+        spans[name] = [duration_ms, 1]
+    else:
+        entry[0] += duration_ms
+        entry[1] += 1
+
+
+class span:
+    """Замеряет блок кода и добавляет его длительность к фазе ``name`` текущего запроса."""
+
+    __slots__ = ("name", "start")
+
+    def __init__(self, name: str):
+        self.name = name
+
+    def __enter__(self) -> "span":
+        self.start = time.perf_counter()
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        record_span(self.name, (time.perf_counter() - self.start) * 1000)
+
+
+def format_server_timing(spans: dict[str, list[float]], total_ms: float) -> str:
+    metrics = [f"{name};dur={duration:.2f}" for name, (duration, _) in spans.items()]
+    metrics.append(f"total;dur={total_ms:.2f}")
+    return ", ".join(metrics)
+
+
+class ServerTimingMiddleware:
+    """Собирает длительности фаз запроса в заголовок ``Server-Timing`` и access-лог."""
+
+    def __init__(self, app):
+        self.app = app
+
+    async def __call__(self, scope, receive, send):
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        spans: dict[str, list[float]] = {}
+        token = _spans.set(spans)
+        start = time.perf_counter()
+        status_code = 500
+
+        async def send_with_timing(message):
+            nonlocal status_code
+            if message["type"] == "http.response.start":
+                status_code = message["status"]
+                total_ms = (time.perf_counter() - start) * 1000
+                message["headers"] = [
+                    *message.get("headers", []),
+                    (b"server-timing", format_server_timing(spans, total_ms).encode()),
+                ]
+            await send(message)
+
+        try:
+            await self.app(scope, receive, send_with_timing)
+        finally:
+            _spans.reset(token)
+            total_ms = (time.perf_counter() - start) * 1000
+            logger.info(
+                "%s %s %s за %.1f мс (%s)",
+                scope["method"],
+                scope["path"],
+                status_code,
+                total_ms,
+                ", ".join(
+                    f"{name}={duration:.1f}мс×{count}"
+                    for name, (duration, count) in spans.items()
+                )
+                or "без фаз",
+                extra={
+                    "method": scope["method"],
+                    "path": scope["path"],
+                    "status_code": status_code,
+                    "duration_ms": round(total_ms, 3),
+                    "phases": {
+                        name: {"duration_ms": round(duration, 3), "count": count}
+                        for name, (duration, count) in spans.items()
+                    },
+                },
+            )
@@ -1,11 +1,27 @@
 from abc import ABC, abstractmethod
+from typing import Callable, Hashable
 
-from app.db.database import async_session_maker
+from app.core.config import settings
+from app.db.database import (
+    async_session_maker,
+    autocommit_engine,
+    engine,
+    replica_router,
+)
+from app.repositories.memory_repository import (
+    InMemoryRevokedTokenRepository,
+    InMemoryStore,
+    InMemoryUserRepository,
+    memory_store,
+)
+from app.repositories.revoked_token_repository import RevokedTokenRepository
 from app.repositories.user_repository import UserRepository
 
 
 class IUnitOfWork(ABC):
     user_repo: UserRepository
+    revoked_token_repo: RevokedTokenRepository
+    request_scoped: bool
 
     @abstractmethod
     def __init__(self): ...
@@ -22,23 +38,143 @@ class IUnitOfWork(ABC):
     @abstractmethod
     async def rollback(self): ...
 
+    @abstractmethod
+    def read_only(self, consistency_key: Hashable | None = None) -> "IUnitOfWork": ...
+
+    @abstractmethod
+    async def close(self): ...
+
 
 class UnitOfWork(IUnitOfWork):
+    """UoW поверх сессии SQLAlchemy.
+
+    Блок ``read_only()`` получает сессию на соединении в режиме
+    AUTOCOMMIT (реплики или основной базы): asyncpg не открывает
+    транзакцию, и ни BEGIN, ни ROLLBACK при возврате в пул не уходят.
+    Такая сессия не переиспользуется для записи.
+    """
+
+    engine = engine
+    router = replica_router
+    session = None
+    request_scoped = False
+    _depth = 0
+    _read_only = False
+    _consistency_key = None
+    _on_replica = False
+    _autocommit = False
+
     def __init__(self):
         self.session_factory = async_session_maker
 
+    def read_only(self, consistency_key=None):
+        if self._depth == 0:
+            self._read_only = True
+            self._consistency_key = consistency_key
+        return self
+
     async def __aenter__(self):
-        self.session = self.session_factory()
-        self.user_repo = UserRepository(self.session)
+        if self._autocommit and self._depth == 0 and (
+            not self._read_only
+            or (self._on_replica and self.router.is_pinned(self._consistency_key))
+        ):
+            await self._release_session()
+
+        if self.session is None:
+            self.session = self._create_session()
+            self.user_repo = UserRepository(self.session)
+            self.revoked_token_repo = RevokedTokenRepository(self.session)
+        self._depth += 1
         return self
 
-    async def __aexit__(self, *args):
-        await self.rollback()
-        await self.session.close()
-        self.session = None
+    def _create_session(self):
+        self._on_replica = False
+        self._autocommit = self._read_only
+        if not self._read_only:
+            return self.session_factory()
+
+        replica = self.router.choose(self._consistency_key)
+        self._on_replica = replica is not None
+        return self.session_factory(bind=autocommit_engine(replica or self.engine))
+
+    async def __aexit__(self, exc_type, exc_val, exc_tb):
+        self._depth -= 1
+        if self._depth > 0:
+            return
+
+        if (
+            self.request_scoped
+            and exc_type is None
+            and (self._read_only or not self.session.in_transaction())
+        ):
+            self._read_only = False
+            return
+
+        await self.close()
 
     async def commit(self):
         await self.session.commit()
 
     async def rollback(self):
         await self.session.rollback()
+
+    async def close(self):
+        await self._release_session()
+        self._read_only = False
+
+    async def _release_session(self):
+        if self.session is None:
+            return
+
+        if not self._autocommit:
+            await self.rollback()
+        await self.session.close()
+        self.session = None
+        self._on_replica = False
+        self._autocommit = False
+
+
+class InMemoryUnitOfWork(IUnitOfWork):
+    """UoW поверх хранилища в памяти — для прогонов без базы.
+
+    Записи видны другим UoW сразу, без изоляции транзакций; ``rollback``
+    и выход из внешнего блока без ``commit`` проигрывают журнал отмены в
+    обратном порядке.
+    """
+
+    request_scoped = False
+    _depth = 0
+
+    def __init__(self, store: InMemoryStore = memory_store):
+        self.journal: list[Callable[[], None]] = []
+        self.user_repo = InMemoryUserRepository(store, self.journal)
+        self.revoked_token_repo = InMemoryRevokedTokenRepository(store, self.journal)
+
+    def read_only(self, consistency_key=None):
+        return self
+
+    async def __aenter__(self):
+        self._depth += 1
+        return self
+
+    async def __aexit__(self, exc_type, exc_val, exc_tb):
+        self._depth -= 1
+        if self._depth == 0:
+            await self.close()
+
+    async def commit(self):
+        self.journal.clear()
+
+    async def rollback(self):
+        while self.journal:
+            self.journal.pop()()
+
+    async def close(self):
+        await self.rollback()
+
+
+def create_unit_of_work() -> IUnitOfWork:
+    """Зависимость FastAPI: UoW выбранного в ``UOW_BACKEND`` бэкенда."""
+    if settings.UOW_BACKEND == "memory":
+        return InMemoryUnitOfWork()
+    return UnitOfWork()
@@ -0,0 +1,121 @@
+"""Сравнение RPS для /api/users/admin в режимах reference и claims.
+
+Запуск (нужна мигрированная база из текущих настроек):
+
+    python -m benchmarks.admin_auth_modes --requests 5000 --concurrency 32
+"""
+
+import argparse
+import asyncio
+import json
+import time
+
+from httpx import ASGITransport, AsyncClient
+
+from app.api.schemas.user import UserResponse
+from app.core.cache import principal_cache
+from app.core.config import settings
+from app.core.security import hash_password
+from app.db.database import engine
+from app.db.models import UserRole
+from app.main import app
+from app.services.auth_service import AuthService
+from app.utils.unitofwork import UnitOfWork
+
+ADMIN_EMAIL = "bench-admin@example.com"
+
+
+async def ensure_admin() -> UserResponse:
+    async with UnitOfWork() as uow:
+        admin = await uow.user_repo.find_by_email(ADMIN_EMAIL)
+        if admin is None:
+            admin = await uow.user_repo.create(
+                {
+                    "email": ADMIN_EMAIL,
+                    "hashed_password": hash_password("Bench_p@ss123"),
+                    "role": UserRole.ADMIN,
+                }
+            )
+        admin = UserResponse.model_validate(admin)
+        await uow.commit()
+    return admin
+
+
+async def run_mode(
+    client: AsyncClient, admin: UserResponse, claims_mode: bool, args
+) -> dict:
+    settings.ACCESS_TOKEN_CLAIMS_MODE = claims_mode
+    settings.PRINCIPAL_CACHE_ENABLED = args.principal_cache
+    principal_cache.clear()
+
+    token = AuthService.create_access_token(
+        admin.id, AuthService.principal_claims(admin)
+    )
+    headers = {"Authorization": f"Bearer {token}"}
+    remaining = args.requests
+    errors = 0
+
+    async def worker():
+        nonlocal remaining, errors
+        while remaining > 0:
+            remaining -= 1
+            response = await client.get("/api/users/admin", headers=headers)
+            if response.status_code != 200:
+                errors += 1
+
+    for _ in range(args.warmup):
+        await client.get("/api/users/admin", headers=headers)
+
+    start = time.perf_counter()
+    await asyncio.gather(*(worker() for _ in range(args.concurrency)))
+    elapsed = time.perf_counter() - start
+
+    return {
+        "mode": "claims" if claims_mode else "reference",
+        "requests": args.requests,
+        "concurrency": args.concurrency,
+        "principal_cache": args.principal_cache,
+        "errors": errors,
+        "seconds": round(elapsed, 3),
+        "rps": round(args.requests / elapsed, 1),
+    }
+
+
+async def main(args) -> None:
+    admin = await ensure_admin()
+    results = []
+
+    async with AsyncClient(
+        transport=ASGITransport(app=app), base_url="http://bench"
+    ) as client:
+        for claims_mode in (False, True):
+            results.append(await run_mode(client, admin, claims_mode, args))
+
+    await engine.dispose()
+
+    if args.json:
+        print(json.dumps(results, indent=2))
+        return
+
+    for result in results:
+        print(
+            f"{result['mode']:>10}: {result['rps']:>9} req/s "
+            f"({result['requests']} requests, concurrency={result['concurrency']}, "
+            f"errors={result['errors']})"
+        )
+    print(f"speedup: x{results[1]['rps'] / results[0]['rps']:.2f}")
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--requests", type=int, default=2000)
+    parser.add_argument("--concurrency", type=int, default=32)
+    parser.add_argument("--warmup", type=int, default=50)
+    parser.add_argument(
+        "--principal-cache",
+        action=argparse.BooleanOptionalAction,
+        default=False,
+        help="включить кэш пользователей в режиме reference",
+    )
+    parser.add_argument("--json", action="store_true")
+    asyncio.run(main(parser.parse_args()))
@@ -0,0 +1,83 @@
+"""Пропускная способность UserRepository.create_many без учёта хеширования.
+
+Запуск (нужна мигрированная база из текущих настроек):
+
+    python -m benchmarks.bulk_import --rows 50000 --batch-size 5000
+"""
+
+import argparse
+import asyncio
+import json
+import time
+import uuid
+
+from sqlalchemy import delete
+
+from app.core.security import hash_password
+from app.db.database import engine
+from app.db.models import User, UserRole
+from app.utils.unitofwork import UnitOfWork
+
+TARGET_ROWS_PER_SECOND = 10_000
+
+
+async def run_method(use_copy: bool, args, hashed_password: str) -> dict:
+    prefix = f"bulk-{uuid.uuid4().hex[:8]}"
+    rows = [
+        {
+            "email": f"{prefix}-{i}@example.com",
+            "hashed_password": hashed_password,
+            "role": UserRole.USER,
+        }
+        for i in range(args.rows)
+    ]
+
+    created = 0
+    start = time.perf_counter()
+    for offset in range(0, len(rows), args.batch_size):
+        async with UnitOfWork() as uow:
+            users = await uow.user_repo.create_many(
+                rows[offset : offset + args.batch_size], use_copy=use_copy
+            )
+            await uow.commit()
+        created += len(users)
+    elapsed = time.perf_counter() - start
+
+    async with UnitOfWork() as uow:
+        await uow.session.execute(delete(User).where(User.email.startswith(prefix)))
+        await uow.commit()
+
+    rows_per_second = created / elapsed
+    return {
+        "method": "copy" if use_copy else "insert",
+        "rows": created,
+        "batch_size": args.batch_size,
+        "seconds": round(elapsed, 3),
+        "rows_per_second": round(rows_per_second),
+        "meets_target": rows_per_second >= TARGET_ROWS_PER_SECOND,
+    }
+
+
+async def main(args) -> None:
+    hashed_password = hash_password("Bench_p@ss123")
+    results = [await run_method(use_copy, args, hashed_password) for use_copy in (False, True)]
+    await engine.dispose()
+
+    if args.json:
+        print(json.dumps(results, indent=2))
+        return
+
+    for result in results:
+        print(
+            f"{result['method']:>6}: {result['rows_per_second']:>8} rows/s "
+            f"({result['rows']} rows in {result['seconds']}s, "
+            f"target {TARGET_ROWS_PER_SECOND}: {'ok' if result['meets_target'] else 'MISSED'})"
+        )
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--rows", type=int, default=50_000)
+    parser.add_argument("--batch-size", type=int, default=5_000)
+    parser.add_argument("--json", action="store_true")
+    asyncio.run(main(parser.parse_args()))
@@ -0,0 +1,104 @@
+"""Пропускная способность подписи и проверки JWT по алгоритмам.
+
+Для асимметричных алгоритмов отдельно меряется вариант, когда PEM
+разбирается на каждый вызов, и вариант с ключом, разобранным один раз
+(как в ``KeyRing``). Ключи генерируются на лету, база не нужна.
+
+    python -m benchmarks.jwt_algorithms --iterations 5000
+"""
+
+import argparse
+import json
+import time
+
+import jwt
+from cryptography.hazmat.primitives import serialization
+
+from app.core.keys import SigningKey, generate_private_key_pem
+
+SECRET = "benchmark-secret-key-with-enough-length"
+
+
+def ops_per_second(func, iterations: int) -> float:
+    func()
+    start = time.perf_counter()
+    for _ in range(iterations):
+        func()
+    return iterations / (time.perf_counter() - start)
+
+
+def bench(iterations: int) -> list[dict]:
+    payload = {
+        "sub": "7a1d3c52-9d8e-4a0c-9f0e-5b8a2c1f3e47",
+        "type": "access",
+        "exp": int(time.time()) + 3600,
+    }
+    results = []
+
+    token = jwt.encode(payload, SECRET, algorithm="HS256")
+    results.append(
+        {
+            "algorithm": "HS256",
+            "key": "secret",
+            "sign_ops": ops_per_second(
+                lambda: jwt.encode(payload, SECRET, algorithm="HS256"), iterations
+            ),
+            "verify_ops": ops_per_second(
+                lambda: jwt.decode(token, SECRET, algorithms=["HS256"]), iterations
+            ),
+        }
+    )
+
+    for algorithm in ("EdDSA", "ES256"):
+        pem = generate_private_key_pem(algorithm)
+        key = SigningKey.from_pem("bench", pem)
+        public_pem = key.public_key.public_bytes(
+            serialization.Encoding.PEM,
+            serialization.PublicFormat.SubjectPublicKeyInfo,
+        )
+        token = jwt.encode(payload, key.private_key, algorithm=algorithm)
+
+        for key_kind, private_key, public_key in (
+            ("pem per call", pem, public_pem),
+            ("parsed once", key.private_key, key.public_key),
+        ):
+            results.append(
+                {
+                    "algorithm": algorithm,
+                    "key": key_kind,
+                    "sign_ops": ops_per_second(
+                        lambda: jwt.encode(payload, private_key, algorithm=algorithm),
+                        iterations,
+                    ),
+                    "verify_ops": ops_per_second(
+                        lambda: jwt.decode(token, public_key, algorithms=[algorithm]),
+                        iterations,
+                    ),
+                }
+            )
+
+    for result in results:
+        result["sign_ops"] = round(result["sign_ops"])
+        result["verify_ops"] = round(result["verify_ops"])
+    return results
+
+
+def main(args) -> None:
+    results = bench(args.iterations)
+
+    if args.json:
+        print(json.dumps(results, indent=2))
+        return
+
+    for result in results:
+        print(
+            f"{result['algorithm']:>6} {result['key']:>12}: "
+            f"sign {result['sign_ops']:>7} ops/s, verify {result['verify_ops']:>7} ops/s"
+        )
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--iterations", type=int, default=5_000)
+    parser.add_argument("--json", action="store_true")
+    main(parser.parse_args())
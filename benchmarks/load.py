@@ -0,0 +1,380 @@
+"""Нагрузочный прогон приложения смесью сценариев с перцентилями по маршрутам.
+
+Приложение гоняется либо в процессе через ``ASGITransport`` (по
+умолчанию), либо через настоящий сокет: ``--spawn-uvicorn`` поднимает
+uvicorn на свободном порту, ``--url`` бьёт в уже запущенный сервер.
+Пользователи и токены готовятся напрямую в базе из текущих настроек,
+поэтому сервер должен смотреть в ту же базу и подписывать токены тем
+же ключом. Лимиты на вход по умолчанию выключены, иначе сценарии с
+логином упираются в 429 (``--keep-throttle`` оставляет их). С
+``UOW_BACKEND=memory`` прогон идёт без базы, только в процессе.
+
+    python -m benchmarks.load --mix default --concurrency 64 --duration 20
+    python -m benchmarks.load --spawn-uvicorn --workers 2 --mix me_valid=90,refresh=10
+"""
+
+import argparse
+import asyncio
+import json
+import os
+import random
+import socket
+import subprocess
+import sys
+import time
+import uuid
+from collections import Counter
+from datetime import timedelta
+
+from httpx import ASGITransport, AsyncClient, Limits, TransportError
+from sqlalchemy import delete
+
+from app.core.config import settings
+from app.core.security import create_token, hash_password
+from app.db.database import engine
+from app.db.models import User
+from app.repositories.memory_repository import memory_store
+from app.services.auth_service import AuthService
+from app.utils.unitofwork import UnitOfWork, create_unit_of_work
+
+PREFIX = "load-"
+PASSWORD = "Load_p@ss123"
+
+MIXES = {
+    "default": {
+        "login": 10,
+        "login_invalid": 10,
+        "refresh": 10,
+        "me_valid": 50,
+        "me_expired": 10,
+        "me_garbage": 10,
+    },
+    "read_heavy": {"me_valid": 90, "refresh": 5, "login": 5},
+    "stuffing": {"login_invalid": 80, "me_valid": 20},
+    "signup": {"register": 40, "login": 40, "me_valid": 20},
+}
+
+
+class State:
+    """Пул пользователей и токенов, общий для всех воркеров."""
+
+    def __init__(self, rng: random.Random):
+        self.rng = rng
+        self.emails: list[str] = []
+        self.access_tokens: list[str] = []
+        self.refresh_tokens: list[str] = []
+        self.expired_token = ""
+
+
+class RouteStats:
+    def __init__(self):
+        self.latencies: list[float] = []
+        self.statuses: Counter = Counter()
+        self.unexpected = 0
+
+    def report(self, elapsed: float) -> dict:
+        latencies = sorted(self.latencies)
+
+        def percentile(q: float) -> float:
+            index = min(len(latencies) - 1, max(0, round(q * len(latencies)) - 1))
+            return round(latencies[index], 2)
+
+        return {
+            "requests": len(latencies),
+            "rps": round(len(latencies) / elapsed, 1),
+            "p50_ms": percentile(0.50),
+            "p95_ms": percentile(0.95),
+            "p99_ms": percentile(0.99),
+            "max_ms": round(latencies[-1], 2),
+            "unexpected": self.unexpected,
+            "statuses": dict(sorted(self.statuses.items())),
+        }
+
+
+# --- сценарии: возвращают (маршрут, ожидаемые статусы, запрос) ---------------
+
+
+def scenario_register(state: State):
+    email = f"{PREFIX}reg-{uuid.uuid4().hex}@example.com"
+    return "POST /api/auth/register", {200}, lambda client: client.post(
+        "/api/auth/register", json={"email": email, "password": PASSWORD}
+    )
+
+
+def scenario_login(state: State):
+    email = state.rng.choice(state.emails)
+    return "POST /api/auth/login", {200}, lambda client: client.post(
+        "/api/auth/login", json={"email": email, "password": PASSWORD}
+    )
+
+
+def scenario_login_invalid(state: State):
+    email = state.rng.choice(state.emails)
+    return "POST /api/auth/login [invalid]", {401}, lambda client: client.post(
+        "/api/auth/login", json={"email": email, "password": "Wrong_p@ss123"}
+    )
+
+
+def scenario_refresh(state: State):
+    if not state.refresh_tokens:
+        return scenario_login(state)
+
+    token = state.refresh_tokens.pop(state.rng.randrange(len(state.refresh_tokens)))
+
+    async def request(client):
+        response = await client.post("/api/auth/refresh", json={"refresh_token": token})
+        if response.status_code == 200:
+            state.refresh_tokens.append(response.json()["refresh_token"])
+        return response
+
+    return "POST /api/auth/refresh", {200}, request
+
+
+def _me(label: str, token: str, expected: set[int]):
+    headers = {"Authorization": f"Bearer {token}"}
+    return label, expected, lambda client: client.get("/api/users/me", headers=headers)
+
+
+def scenario_me_valid(state: State):
+    return _me("GET /api/users/me", state.rng.choice(state.access_tokens), {200})
+
+
+def scenario_me_expired(state: State):
+    return _me("GET /api/users/me [expired]", state.expired_token, {401})
+
+
+def scenario_me_garbage(state: State):
+    return _me("GET /api/users/me [garbage]", uuid.uuid4().hex, {401})
+
+
+SCENARIOS = {
+    "register": scenario_register,
+    "login": scenario_login,
+    "login_invalid": scenario_login_invalid,
+    "refresh": scenario_refresh,
+    "me_valid": scenario_me_valid,
+    "me_expired": scenario_me_expired,
+    "me_garbage": scenario_me_garbage,
+}
+
+
+def parse_mix(value: str) -> dict[str, float]:
+    if value in MIXES:
+        return MIXES[value]
+
+    mix = {}
+    for item in value.split(","):
+        name, _, weight = item.partition("=")
+        if name not in SCENARIOS:
+            raise argparse.ArgumentTypeError(
+                f"Неизвестный сценарий '{name}', есть: {', '.join(SCENARIOS)}"
+            )
+        mix[name] = float(weight or 1)
+    return mix
+
+
+# --- подготовка ---------------------------------------------------------------
+
+
+async def delete_load_users() -> None:
+    if settings.UOW_BACKEND == "memory":
+        memory_store.clear()
+        return
+
+    async with UnitOfWork() as uow:
+        await uow.session.execute(delete(User).where(User.email.like(f"{PREFIX}%")))
+        await uow.commit()
+
+
+async def seed(state: State, users: int) -> None:
+    hashed_password = hash_password(PASSWORD)
+    await delete_load_users()
+    async with create_unit_of_work() as uow:
+        created = await uow.user_repo.create_many(
+            [
+                {"email": f"{PREFIX}{i}@example.com", "hashed_password": hashed_password}
+                for i in range(users)
+            ]
+        )
+        await uow.commit()
+
+    state.emails = [user.email for user in created]
+    state.access_tokens = [
+        AuthService.create_access_token(user.id, AuthService.principal_claims(user))
+        for user in created
+    ]
+    state.refresh_tokens = [AuthService.create_refresh_token(user.id) for user in created]
+    state.expired_token = create_token(
+        {"sub": str(created[0].id), "type": "access"}, timedelta(seconds=-60)
+    )
+
+
+async def cleanup() -> None:
+    await delete_load_users()
+    await engine.dispose()
+
+
+def free_port() -> int:
+    with socket.socket() as sock:
+        sock.bind(("127.0.0.1", 0))
+        return sock.getsockname()[1]
+
+
+async def spawn_uvicorn(workers: int = 1, env: dict | None = None) -> tuple[subprocess.Popen, str]:
+    """Запускает uvicorn на свободном порту и ждёт первого успешного ответа."""
+    port = free_port()
+    process = subprocess.Popen(
+        [
+            sys.executable,
+            "-m",
+            "uvicorn",
+            "app.main:app",
+            "--host",
+            "127.0.0.1",
+            "--port",
+            str(port),
+            "--workers",
+            str(workers),
+            "--no-access-log",
+            "--log-level",
+            "warning",
+        ],
+        env={**os.environ, **(env or {})},
+    )
+    url = f"http://127.0.0.1:{port}"
+
+    async with AsyncClient(base_url=url) as client:
+        for _ in range(1500):
+            if process.poll() is not None:
+                raise RuntimeError("uvicorn завершился при старте")
+            try:
+                await client.get("/.well-known/jwks.json")
+                return process, url
+            except TransportError:
+                await asyncio.sleep(0.02)
+
+    process.terminate()
+    raise RuntimeError("uvicorn не поднялся за 30 секунд")
+
+
+# --- прогон -------------------------------------------------------------------
+
+
+async def drive(client: AsyncClient, state: State, mix: dict[str, float], args) -> dict:
+    names = list(mix)
+    weights = [mix[name] for name in names]
+    stats: dict[str, RouteStats] = {}
+    remaining = args.requests
+    deadline = time.perf_counter() + args.duration if args.duration else None
+
+    async def worker():
+        nonlocal remaining
+        while True:
+            if deadline is not None:
+                if time.perf_counter() >= deadline:
+                    return
+            elif remaining <= 0:
+                return
+            remaining -= 1
+
+            name = state.rng.choices(names, weights)[0]
+            route, expected, request = SCENARIOS[name](state)
+
+            start = time.perf_counter()
+            response = await request(client)
+            latency_ms = (time.perf_counter() - start) * 1000
+
+            route_stats = stats.setdefault(route, RouteStats())
+            route_stats.latencies.append(latency_ms)
+            route_stats.statuses[response.status_code] += 1
+            if response.status_code not in expected:
+                route_stats.unexpected += 1
+
+    start = time.perf_counter()
+    await asyncio.gather(*(worker() for _ in range(args.concurrency)))
+    elapsed = time.perf_counter() - start
+
+    total = RouteStats()
+    for route_stats in stats.values():
+        total.latencies += route_stats.latencies
+        total.statuses.update(route_stats.statuses)
+        total.unexpected += route_stats.unexpected
+
+    return {
+        "seconds": round(elapsed, 3),
+        "routes": {route: stats[route].report(elapsed) for route in sorted(stats)},
+        "total": total.report(elapsed),
+    }
+
+
+async def main(args) -> None:
+    if settings.UOW_BACKEND == "memory" and (args.url or args.spawn_uvicorn):
+        raise SystemExit("UOW_BACKEND=memory работает только в процессе, без --url")
+
+    state = State(random.Random(args.seed))
+    mix = parse_mix(args.mix)
+    await seed(state, args.users)
+
+    process = None
+    try:
+        if args.spawn_uvicorn:
+            env = {} if args.keep_throttle else {"LOGIN_THROTTLE_ENABLED": "false"}
+            process, url = await spawn_uvicorn(args.workers, env)
+        else:
+            url = args.url
+
+        if url:
+            client = AsyncClient(
+                base_url=url,
+                timeout=30.0,
+                limits=Limits(max_connections=args.concurrency),
+            )
+        else:
+            from app.core.throttling import login_throttle
+            from app.main import app
+
+            login_throttle.enabled = args.keep_throttle
+            client = AsyncClient(
+                transport=ASGITransport(app=app), base_url="http://load", timeout=30.0
+            )
+
+        async with client:
+            report = await drive(client, state, mix, args)
+    finally:
+        if process is not None:
+            process.terminate()
+            process.wait(timeout=10)
+        await cleanup()
+
+    report["target"] = url or "asgi"
+    report["concurrency"] = args.concurrency
+    report["mix"] = mix
+
+    if args.json:
+        print(json.dumps(report, indent=2))
+        return
+
+    print(f"target={report['target']} concurrency={args.concurrency} seconds={report['seconds']}")
+    header = f"{'route':<32} {'req':>7} {'rps':>8} {'p50':>8} {'p95':>8} {'p99':>8} {'max':>8} {'unexp':>6}"
+    print(header)
+    for route, row in [*report["routes"].items(), ("TOTAL", report["total"])]:
+        print(
+            f"{route:<32} {row['requests']:>7} {row['rps']:>8} {row['p50_ms']:>8} "
+            f"{row['p95_ms']:>8} {row['p99_ms']:>8} {row['max_ms']:>8} {row['unexpected']:>6}"
+        )
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--mix", default="default", help=f"{', '.join(MIXES)} или имя=вес,...")
+    parser.add_argument("--concurrency", type=int, default=32)
+    parser.add_argument("--requests", type=int, default=2000)
+    parser.add_argument("--duration", type=float, help="секунды; вместо --requests")
+    parser.add_argument("--users", type=int, default=200)
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--url", help="уже запущенный сервер")
+    parser.add_argument("--spawn-uvicorn", action="store_true")
+    parser.add_argument("--workers", type=int, default=1)
+    parser.add_argument("--keep-throttle", action="store_true")
+    parser.add_argument("--json", action="store_true")
+    asyncio.run(main(parser.parse_args()))
@@ -0,0 +1,117 @@
+"""Стоимость одного вызова logger.error в потоке, который логирует.
+
+Сравнивает синхронный StreamHandler с текущим форматтером и пайплайн
+QueueHandler/QueueListener из ``app.core.logger``: во втором случае
+форматирование и запись в поток вывода уходят в отдельный поток, а в
+вызывающем остаётся только подготовка записи и ``put_nowait``. Вывод
+направляется в /dev/null; ``--sink-latency-us`` добавляет к каждой
+записи блокирующую задержку, имитируя медленный stderr/pipe под
+нагрузкой — именно её очередь и убирает из event loop.
+
+    python -m benchmarks.logging_overhead --iterations 50000 --sink-latency-us 50
+"""
+
+import argparse
+import json
+import logging
+import os
+import time
+
+from app.core.logger import (
+    LOG_DATE_FORMAT,
+    LOG_FORMAT,
+    BoundedQueueHandler,
+    BoundedQueueListener,
+    JsonFormatter,
+)
+
+
+class SlowStream:
+    def __init__(self, stream, latency_us: float):
+        self.stream = stream
+        self.latency = latency_us / 1_000_000
+
+    def write(self, data: str) -> int:
+        if self.latency:
+            time.sleep(self.latency)
+        return self.stream.write(data)
+
+    def flush(self) -> None:
+        self.stream.flush()
+
+
+def stream_handler(stream, formatter: logging.Formatter) -> logging.Handler:
+    handler = logging.StreamHandler(stream)
+    handler.setFormatter(formatter)
+    return handler
+
+
+def per_call_us(handler: logging.Handler, iterations: int) -> float:
+    logger = logging.getLogger("benchmarks.logging_overhead")
+    logger.handlers[:] = [handler]
+    logger.propagate = False
+    logger.setLevel(logging.INFO)
+
+    start = time.perf_counter()
+    for i in range(iterations):
+        logger.error(
+            "HTTP ошибка: %s",
+            "Invalid credentials",
+            extra={"status_code": 401, "path": "/api/auth/login", "attempt": i},
+        )
+    return (time.perf_counter() - start) / iterations * 1_000_000
+
+
+def main(args) -> None:
+    plain = logging.Formatter(LOG_FORMAT, datefmt=LOG_DATE_FORMAT)
+    results = []
+
+    with open(os.devnull, "w") as devnull_file:
+        devnull = SlowStream(devnull_file, args.sink_latency_us)
+        for name, formatter in (("text", plain), ("json", JsonFormatter())):
+            results.append(
+                {
+                    "case": f"sync {name}",
+                    "us_per_call": per_call_us(
+                        stream_handler(devnull, formatter), args.iterations
+                    ),
+                    "dropped": 0,
+                }
+            )
+
+            queue_handler = BoundedQueueHandler(args.queue_size)
+            listener = BoundedQueueListener(
+                queue_handler.queue, stream_handler(devnull, formatter)
+            )
+            listener.start()
+            us = per_call_us(queue_handler, args.iterations)
+            listener.stop()
+            results.append(
+                {
+                    "case": f"queue {name}",
+                    "us_per_call": us,
+                    "dropped": queue_handler.dropped,
+                }
+            )
+
+    for result in results:
+        result["us_per_call"] = round(result["us_per_call"], 2)
+
+    if args.json:
+        print(json.dumps(results, indent=2))
+        return
+
+    for result in results:
+        print(
+            f"{result['case']:>12}: {result['us_per_call']:>7} us/call, "
+            f"dropped {result['dropped']}"
+        )
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--iterations", type=int, default=50_000)
+    parser.add_argument("--sink-latency-us", type=float, default=0)
+    parser.add_argument("--queue-size", type=int, default=10_000)
+    parser.add_argument("--json", action="store_true")
+    main(parser.parse_args())
@@ -0,0 +1,125 @@
+"""Время старта uvicorn и задержка первых запросов с прогревом и без.
+
+Для каждого режима поднимает отдельный процесс uvicorn, меряет время
+от запуска до первого ответа и задержку первого запроса на горячих
+маршрутах против медианы следующих ``--requests``. Без прогрева
+первый запрос платит за соединения с базой, backend bcrypt и прочую
+ленивую инициализацию; с прогревом за это платит старт.
+
+    python -m benchmarks.startup --runs 3 --requests 20
+"""
+
+import argparse
+import asyncio
+import json
+import random
+import statistics
+import time
+
+from httpx import AsyncClient
+
+from benchmarks.load import PASSWORD, State, cleanup, seed, spawn_uvicorn
+
+MODES = {"cold": "false", "warm": "true"}
+
+
+async def timed(request) -> float:
+    start = time.perf_counter()
+    response = await request()
+    elapsed_ms = (time.perf_counter() - start) * 1000
+    response.raise_for_status()
+    return elapsed_ms
+
+
+async def measure(state: State, user: int, warm_up: str, requests: int) -> dict:
+    start = time.perf_counter()
+    process, url = await spawn_uvicorn(
+        env={"STARTUP_WARMUP_ENABLED": warm_up, "LOGIN_THROTTLE_ENABLED": "false"}
+    )
+    ready_ms = (time.perf_counter() - start) * 1000
+
+    email = state.emails[user]
+    headers = {"Authorization": f"Bearer {state.access_tokens[user]}"}
+    refresh_token = state.refresh_tokens[user]
+    routes = {}
+
+    try:
+        async with AsyncClient(base_url=url, timeout=30.0) as client:
+
+            async def refresh():
+                nonlocal refresh_token
+                response = await client.post(
+                    "/api/auth/refresh", json={"refresh_token": refresh_token}
+                )
+                if response.status_code == 200:
+                    refresh_token = response.json()["refresh_token"]
+                return response
+
+            scenarios = {
+                "GET /api/users/me": lambda: client.get("/api/users/me", headers=headers),
+                "POST /api/auth/refresh": refresh,
+                "POST /api/auth/login": lambda: client.post(
+                    "/api/auth/login", json={"email": email, "password": PASSWORD}
+                ),
+            }
+            for route, request in scenarios.items():
+                first_ms = await timed(request)
+                rest = [await timed(request) for _ in range(requests)]
+                routes[route] = {
+                    "first_ms": round(first_ms, 2),
+                    "p50_ms": round(statistics.median(rest), 2),
+                }
+    finally:
+        process.terminate()
+        process.wait(timeout=10)
+
+    return {"ready_ms": round(ready_ms, 1), "routes": routes}
+
+
+def summarize(runs: list[dict]) -> dict:
+    return {
+        "ready_ms": round(statistics.median(run["ready_ms"] for run in runs), 1),
+        "routes": {
+            route: {
+                key: round(statistics.median(run["routes"][route][key] for run in runs), 2)
+                for key in ("first_ms", "p50_ms")
+            }
+            for route in runs[0]["routes"]
+        },
+    }
+
+
+async def main(args) -> None:
+    state = State(random.Random(0))
+    # Refresh-токены одноразовые: у каждого прогона свой пользователь.
+    await seed(state, args.runs * len(MODES))
+    users = iter(range(len(state.emails)))
+
+    try:
+        report = {}
+        for mode, warm_up in MODES.items():
+            report[mode] = summarize(
+                [
+                    await measure(state, next(users), warm_up, args.requests)
+                    for _ in range(args.runs)
+                ]
+            )
+    finally:
+        await cleanup()
+
+    if args.json:
+        print(json.dumps(report, indent=2))
+        return
+
+    for mode, result in report.items():
+        print(f"{mode}: ready={result['ready_ms']} мс")
+        for route, row in result["routes"].items():
+            print(f"  {route:<28} first={row['first_ms']:>8} мс  p50={row['p50_ms']:>8} мс")
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--runs", type=int, default=3)
+    parser.add_argument("--requests", type=int, default=20)
+    parser.add_argument("--json", action="store_true")
+    asyncio.run(main(parser.parse_args()))
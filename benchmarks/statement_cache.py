@@ -0,0 +1,107 @@
+"""Накладные расходы на построение запросов в горячих методах репозиториев.
+
+Сравнивает запрос, собираемый на каждый вызов (как было раньше), с
+запросом, построенным один раз через ``cached_statement``. Без базы
+меряется построение конструкции и генерация ключа кэша — ровно то,
+что SQLAlchemy делает перед поиском скомпилированного SQL в кэше
+движка. С флагом ``--db`` оба варианта find_by_email гоняются против
+базы из текущих настроек.
+
+    python -m benchmarks.statement_cache --iterations 20000 --db
+"""
+
+import argparse
+import asyncio
+import json
+import time
+
+from sqlalchemy import select
+
+from app.db.database import engine
+from app.db.models import User
+from app.repositories.user_repository import UserRepository
+from app.utils.unitofwork import UnitOfWork
+
+EMAIL = "user@example.com"
+
+
+class InlineUserRepository(UserRepository):
+    async def find_by_email(self, email):
+        stmt = select(self.model).where(self.model.email == email)
+        result = await self.session.execute(stmt)
+        return result.scalar_one_or_none()
+
+
+class StatementCapturingSession:
+    async def execute(self, stmt, params=None):
+        self.stmt = stmt
+        return self
+
+    def scalar_one_or_none(self):
+        return None
+
+
+def per_call_us(func, iterations: int) -> float:
+    start = time.perf_counter()
+    for _ in range(iterations):
+        func()
+    return (time.perf_counter() - start) / iterations * 1_000_000
+
+
+async def bench_construction(iterations: int) -> list[dict]:
+    session = StatementCapturingSession()
+    await UserRepository(session).find_by_email(EMAIL)
+    cached_stmt = session.stmt
+
+    results = {
+        "inline: build + cache key": per_call_us(
+            lambda: select(User).where(User.email == EMAIL)._generate_cache_key(),
+            iterations,
+        ),
+        "cached: cache key": per_call_us(
+            lambda: cached_stmt._generate_cache_key(), iterations
+        ),
+    }
+    return [{"case": case, "us_per_call": round(us, 2)} for case, us in results.items()]
+
+
+async def bench_database(iterations: int) -> list[dict]:
+    results = []
+    async with UnitOfWork() as uow:
+        for name, repo in (
+            ("db inline: find_by_email", InlineUserRepository(uow.session)),
+            ("db cached: find_by_email", uow.user_repo),
+        ):
+            await repo.find_by_email(EMAIL)
+            start = time.perf_counter()
+            for _ in range(iterations):
+                await repo.find_by_email(EMAIL)
+            elapsed = time.perf_counter() - start
+            results.append(
+                {"case": name, "us_per_call": round(elapsed / iterations * 1_000_000, 2)}
+            )
+
+    await engine.dispose()
+    return results
+
+
+async def main(args) -> None:
+    results = await bench_construction(args.iterations)
+    if args.db:
+        results += await bench_database(args.db_iterations)
+
+    if args.json:
+        print(json.dumps(results, indent=2))
+        return
+
+    for result in results:
+        print(f"{result['case']:>28}: {result['us_per_call']:>9} us/call")
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--iterations", type=int, default=20_000)
+    parser.add_argument("--db", action="store_true")
+    parser.add_argument("--db-iterations", type=int, default=2_000)
+    parser.add_argument("--json", action="store_true")
+    asyncio.run(main(parser.parse_args()))
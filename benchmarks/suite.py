@@ -0,0 +1,544 @@
+"""Микробенчмарки горячих путей авторизации и доступа к данным.
+
+Каждый бенчмарк прогоняется ``--repeat`` раундов; в результат идёт
+медиана времени одной операции по раундам, минимум и разброс. Группы
+``repository.*`` работают с базой из текущих настроек и включаются
+флагом ``--db`` (нужна мигрированная база). Результаты — JSON, который
+потом сравнивается с базовым прогоном.
+
+    python -m benchmarks.suite run --db --output results.json
+    python -m benchmarks.suite compare baseline.json results.json --threshold 0.1
+    python -m benchmarks.suite list
+"""
+
+import argparse
+import asyncio
+import contextlib
+import fnmatch
+import inspect
+import itertools
+import json
+import logging
+import os
+import platform
+import statistics
+import subprocess
+import sys
+import time
+import uuid
+from datetime import datetime, timedelta, timezone
+
+import jwt
+from sqlalchemy import delete
+
+from app.api.schemas.user import UserCreate, UserResponse
+from app.core import security
+from app.core.config import settings
+from app.core.keys import SigningKey, generate_private_key_pem
+from app.core.logger import (
+    LOG_DATE_FORMAT,
+    LOG_FORMAT,
+    BoundedQueueHandler,
+    BoundedQueueListener,
+)
+from app.db.database import engine
+from app.db.models import User, UserRole
+from app.errors.exceptions import InvalidCredentialsError
+from app.errors.handlers import get_error_response, render_error_body
+from app.utils.unitofwork import UnitOfWork
+
+EMAIL = "suite-user@example.com"
+PASSWORD = "Strong_p@ss123"
+SEED_PREFIX = "suite-"
+SEED_USERS = 3000
+
+
+class Benchmark:
+    def __init__(self, name: str, factory, iterations: int, requires_db: bool):
+        self.name = name
+        self.factory = factory
+        self.iterations = iterations
+        self.requires_db = requires_db
+
+
+class Context:
+    """Общие данные прогона: засеянные пользователи и хеш пароля."""
+
+    def __init__(self):
+        self.user_ids: list[uuid.UUID] = []
+        self.emails: list[str] = []
+        self.hashed_password = ""
+
+
+REGISTRY: dict[str, Benchmark] = {}
+
+
+def benchmark(name: str, iterations: int = 1000, requires_db: bool = False):
+    """Регистрирует фабрику бенчмарка.
+
+    Фабрика — async-генератор, который готовит окружение, отдаёт
+    ``yield`` измеряемую операцию (обычную или async-функцию без
+    аргументов) и прибирает за собой после замера.
+    """
+
+    def decorator(factory):
+        REGISTRY[name] = Benchmark(
+            name, contextlib.asynccontextmanager(factory), iterations, requires_db
+        )
+        return factory
+
+    return decorator
+
+
+# --- security ---------------------------------------------------------------
+
+
+@benchmark("security.hash_password", iterations=3)
+async def bench_hash_password(ctx):
+    yield lambda: security.hash_password(PASSWORD)
+
+
+@benchmark("security.verify_password", iterations=3)
+async def bench_verify_password(ctx):
+    yield lambda: security.verify_password(PASSWORD, ctx.hashed_password)
+
+
+@benchmark("security.create_token", iterations=5000)
+async def bench_create_token(ctx):
+    data = {"sub": str(uuid.uuid4()), "type": "access"}
+    yield lambda: security.create_token(data, timedelta(minutes=30))
+
+
+@benchmark("security.verify_token.uncached", iterations=5000)
+async def bench_verify_token_uncached(ctx):
+    token = security.create_token(
+        {"sub": str(uuid.uuid4()), "type": "access"}, timedelta(minutes=30)
+    )
+    yield lambda: security._decode_token(token, "access")
+
+
+@benchmark("security.verify_token.cached", iterations=50_000)
+async def bench_verify_token_cached(ctx):
+    token = security.create_token(
+        {"sub": str(uuid.uuid4()), "type": "access"}, timedelta(minutes=30)
+    )
+    yield lambda: security.verify_token(token, "access")
+
+
+def _register_jwt_benchmarks(algorithm: str) -> None:
+    @benchmark(f"jwt.{algorithm}.sign", iterations=2000)
+    async def bench_sign(ctx):
+        key = SigningKey.from_pem("suite", generate_private_key_pem(algorithm))
+        payload = {"sub": str(uuid.uuid4()), "exp": int(time.time()) + 3600}
+        yield lambda: jwt.encode(payload, key.private_key, algorithm=algorithm)
+
+    @benchmark(f"jwt.{algorithm}.verify", iterations=2000)
+    async def bench_verify(ctx):
+        key = SigningKey.from_pem("suite", generate_private_key_pem(algorithm))
+        token = jwt.encode(
+            {"sub": str(uuid.uuid4()), "exp": int(time.time()) + 3600},
+            key.private_key,
+            algorithm=algorithm,
+        )
+        yield lambda: jwt.decode(token, key.public_key, algorithms=[algorithm])
+
+
+for _algorithm in ("EdDSA", "ES256"):
+    _register_jwt_benchmarks(_algorithm)
+
+
+# --- schemas and errors -----------------------------------------------------
+
+
+@benchmark("schemas.UserCreate.validate", iterations=20_000)
+async def bench_user_create(ctx):
+    data = {"email": "User@Example.com", "password": PASSWORD}
+    yield lambda: UserCreate.model_validate(data)
+
+
+@benchmark("schemas.UserResponse.from_orm", iterations=20_000)
+async def bench_user_response(ctx):
+    user = User(id=uuid.uuid4(), email=EMAIL, hashed_password="x", role=UserRole.USER)
+    yield lambda: UserResponse.model_validate(user)
+
+
+@benchmark("schemas.UserResponse.dump_json", iterations=20_000)
+async def bench_user_response_dump(ctx):
+    response = UserResponse(id=uuid.uuid4(), email=EMAIL, role=UserRole.USER)
+    yield response.model_dump_json
+
+
+@benchmark("errors.get_error_response", iterations=50_000)
+async def bench_error_response(ctx):
+    exc = InvalidCredentialsError()
+    yield lambda: get_error_response(None, exc)
+
+
+@benchmark("errors.render_error_body", iterations=50_000)
+async def bench_render_error_body(ctx):
+    exc = InvalidCredentialsError()
+    yield lambda: render_error_body(None, exc)
+
+
+# --- logging ----------------------------------------------------------------
+
+
+def _bench_logger(handler: logging.Handler) -> logging.Logger:
+    logger = logging.getLogger("benchmarks.suite.logging")
+    logger.handlers[:] = [handler]
+    logger.propagate = False
+    logger.setLevel(logging.INFO)
+    return logger
+
+
+@benchmark("logging.stream_handler", iterations=20_000)
+async def bench_logging_stream(ctx):
+    with open(os.devnull, "w") as devnull:
+        handler = logging.StreamHandler(devnull)
+        handler.setFormatter(logging.Formatter(LOG_FORMAT, datefmt=LOG_DATE_FORMAT))
+        logger = _bench_logger(handler)
+        yield lambda: logger.error("HTTP ошибка: %s", "Invalid credentials")
+
+
+@benchmark("logging.queue_handler", iterations=20_000)
+async def bench_logging_queue(ctx):
+    with open(os.devnull, "w") as devnull:
+        handler = logging.StreamHandler(devnull)
+        handler.setFormatter(logging.Formatter(LOG_FORMAT, datefmt=LOG_DATE_FORMAT))
+        queue_handler = BoundedQueueHandler(settings.LOG_QUEUE_MAX_SIZE)
+        listener = BoundedQueueListener(queue_handler.queue, handler)
+        listener.start()
+        logger = _bench_logger(queue_handler)
+        yield lambda: logger.error("HTTP ошибка: %s", "Invalid credentials")
+        listener.stop()
+
+
+# --- repositories -----------------------------------------------------------
+
+
+@benchmark("repository.find_all", iterations=20, requires_db=True)
+async def bench_find_all(ctx):
+    async with UnitOfWork() as uow:
+        yield lambda: uow.user_repo.find_all()
+
+
+@benchmark("repository.find_all.projection", iterations=20, requires_db=True)
+async def bench_find_all_projection(ctx):
+    async with UnitOfWork() as uow:
+        yield lambda: uow.user_repo.find_all(columns=("id", "email"))
+
+
+@benchmark("repository.find_by_id", iterations=2000, requires_db=True)
+async def bench_find_by_id(ctx):
+    async with UnitOfWork() as uow:
+        yield lambda: uow.user_repo.find_by_id(ctx.user_ids[0])
+
+
+@benchmark("repository.find_by_id.projection", iterations=2000, requires_db=True)
+async def bench_find_by_id_projection(ctx):
+    async with UnitOfWork() as uow:
+        columns = uow.user_repo.principal_columns
+        yield lambda: uow.user_repo.find_by_id(ctx.user_ids[0], columns=columns)
+
+
+@benchmark("repository.find_by_email", iterations=2000, requires_db=True)
+async def bench_find_by_email(ctx):
+    async with UnitOfWork() as uow:
+        columns = uow.user_repo.credentials_columns
+        yield lambda: uow.user_repo.find_by_email(ctx.emails[0], columns=columns)
+
+
+@benchmark("repository.find_by_filters", iterations=1000, requires_db=True)
+async def bench_find_by_filters(ctx):
+    async with UnitOfWork() as uow:
+        yield lambda: uow.user_repo.find_by_filters(email=ctx.emails[0])
+
+
+@benchmark("repository.find_page", iterations=500, requires_db=True)
+async def bench_find_page(ctx):
+    async with UnitOfWork() as uow:
+        _, cursor = await uow.user_repo.find_page(limit=50, columns=("id", "email"))
+        yield lambda: uow.user_repo.find_page(
+            limit=50, cursor=cursor, columns=("id", "email")
+        )
+
+
+@benchmark("repository.create", iterations=500, requires_db=True)
+async def bench_create(ctx):
+    counter = itertools.count()
+    async with UnitOfWork() as uow:
+        yield lambda: uow.user_repo.create(
+            {
+                "email": f"{SEED_PREFIX}create-{next(counter)}@example.com",
+                "hashed_password": ctx.hashed_password,
+            }
+        )
+
+
+@benchmark("repository.create_many.100", iterations=10, requires_db=True)
+async def bench_create_many(ctx):
+    counter = itertools.count()
+
+    def batch():
+        return [
+            {
+                "email": f"{SEED_PREFIX}many-{next(counter)}@example.com",
+                "hashed_password": ctx.hashed_password,
+            }
+            for _ in range(100)
+        ]
+
+    async with UnitOfWork() as uow:
+        yield lambda: uow.user_repo.create_many(batch())
+
+
+@benchmark("repository.update", iterations=500, requires_db=True)
+async def bench_update(ctx):
+    async with UnitOfWork() as uow:
+        yield lambda: uow.user_repo.update(ctx.user_ids[1], {"role": UserRole.USER})
+
+
+@benchmark("repository.update_password_hash", iterations=500, requires_db=True)
+async def bench_update_password_hash(ctx):
+    # Хеш чередуется, чтобы условие «старый хеш совпал» выполнялось каждый раз.
+    old, new = ctx.hashed_password, ctx.hashed_password + "x"
+    hashes = itertools.cycle([(old, new), (new, old)])
+    async with UnitOfWork() as uow:
+        yield lambda: uow.user_repo.update_password_hash(ctx.user_ids[2], *next(hashes))
+
+
+@benchmark("repository.delete", iterations=300, requires_db=True)
+async def bench_delete(ctx):
+    ids = itertools.cycle(ctx.user_ids)
+    async with UnitOfWork() as uow:
+        yield lambda: uow.user_repo.delete(next(ids))
+
+
+@benchmark("repository.revoke_token", iterations=500, requires_db=True)
+async def bench_revoke_token(ctx):
+    expires_at = datetime.now(timezone.utc).replace(tzinfo=None) + timedelta(days=1)
+    async with UnitOfWork() as uow:
+        yield lambda: uow.revoked_token_repo.revoke(
+            uuid.uuid4(), ctx.user_ids[0], expires_at
+        )
+
+
+@benchmark("repository.is_revoked", iterations=2000, requires_db=True)
+async def bench_is_revoked(ctx):
+    async with UnitOfWork() as uow:
+        yield lambda: uow.revoked_token_repo.is_revoked(uuid.uuid4())
+
+
+# --- runner -----------------------------------------------------------------
+
+
+async def seed(ctx: Context) -> None:
+    async with UnitOfWork() as uow:
+        await uow.session.execute(delete(User).where(User.email.like(f"{SEED_PREFIX}%")))
+        users = await uow.user_repo.create_many(
+            [
+                {
+                    "email": f"{SEED_PREFIX}{i}@example.com",
+                    "hashed_password": ctx.hashed_password,
+                }
+                for i in range(SEED_USERS)
+            ]
+        )
+        await uow.commit()
+
+    ctx.user_ids = [user.id for user in users]
+    ctx.emails = [user.email for user in users]
+
+
+async def cleanup() -> None:
+    async with UnitOfWork() as uow:
+        await uow.session.execute(delete(User).where(User.email.like(f"{SEED_PREFIX}%")))
+        await uow.commit()
+    await engine.dispose()
+
+
+async def measure(op, iterations: int, repeat: int) -> dict:
+    result = op()
+    is_async = inspect.isawaitable(result)
+    if is_async:
+        await result
+
+    for _ in range(iterations // 10):
+        if is_async:
+            await op()
+        else:
+            op()
+
+    rounds = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        if is_async:
+            for _ in range(iterations):
+                await op()
+        else:
+            for _ in range(iterations):
+                op()
+        rounds.append((time.perf_counter() - start) / iterations * 1_000_000)
+
+    median = statistics.median(rounds)
+    return {
+        "iterations": iterations,
+        "repeat": repeat,
+        "median_us": round(median, 3),
+        "min_us": round(min(rounds), 3),
+        "stdev_us": round(statistics.pstdev(rounds), 3),
+        "ops_per_sec": round(1_000_000 / median, 1),
+    }
+
+
+def select_benchmarks(patterns: list[str] | None, with_db: bool) -> list[Benchmark]:
+    selected = []
+    for bench in REGISTRY.values():
+        if bench.requires_db and not with_db:
+            continue
+        if patterns and not any(fnmatch.fnmatch(bench.name, p) for p in patterns):
+            continue
+        selected.append(bench)
+    return selected
+
+
+def metadata() -> dict:
+    try:
+        commit = subprocess.run(
+            ["git", "rev-parse", "--short", "HEAD"],
+            capture_output=True,
+            text=True,
+            check=True,
+        ).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        commit = None
+
+    keyring = security.get_keyring()
+    return {
+        "timestamp": datetime.now(timezone.utc).isoformat(timespec="seconds"),
+        "commit": commit,
+        "python": platform.python_version(),
+        "platform": platform.platform(),
+        "bcrypt_rounds": settings.BCRYPT_ROUNDS,
+        "jwt_algorithm": (
+            keyring.signing_key.algorithm if keyring is not None else settings.ALGORITHM
+        ),
+    }
+
+
+async def run(args) -> dict:
+    benchmarks = select_benchmarks(args.filter, args.db)
+    ctx = Context()
+    ctx.hashed_password = security.hash_password(PASSWORD)
+
+    if any(bench.requires_db for bench in benchmarks):
+        await seed(ctx)
+
+    results = {}
+    try:
+        for bench in benchmarks:
+            iterations = max(1, int(bench.iterations * args.scale))
+            async with bench.factory(ctx) as op:
+                results[bench.name] = await measure(op, iterations, args.repeat)
+            if not args.json:
+                print(
+                    f"{bench.name:>36}: {results[bench.name]['median_us']:>12.2f} us/op",
+                    file=sys.stderr,
+                )
+    finally:
+        if any(bench.requires_db for bench in benchmarks):
+            await cleanup()
+
+    return {"meta": metadata(), "results": results}
+
+
+def compare(baseline: dict, current: dict, threshold: float) -> list[dict]:
+    rows = []
+    names = dict.fromkeys([*baseline["results"], *current["results"]])
+    for name in names:
+        before = baseline["results"].get(name)
+        after = current["results"].get(name)
+        if before is None or after is None:
+            rows.append({"name": name, "status": "new" if before is None else "missing"})
+            continue
+
+        change = after["median_us"] / before["median_us"] - 1
+        if change > threshold:
+            status = "regression"
+        elif change < -threshold:
+            status = "improvement"
+        else:
+            status = "ok"
+        rows.append(
+            {
+                "name": name,
+                "baseline_us": before["median_us"],
+                "current_us": after["median_us"],
+                "change": round(change, 4),
+                "status": status,
+            }
+        )
+    return rows
+
+
+def print_comparison(rows: list[dict]) -> None:
+    for row in rows:
+        if "change" not in row:
+            print(f"{row['name']:>36}: {row['status']}")
+            continue
+        print(
+            f"{row['name']:>36}: {row['baseline_us']:>12.2f} -> {row['current_us']:>12.2f} us"
+            f" ({row['change']:+.1%}) {row['status']}"
+        )
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    commands = parser.add_subparsers(dest="command", required=True)
+
+    run_parser = commands.add_parser("run", help="прогнать бенчмарки")
+    run_parser.add_argument("--filter", action="append", help="glob по имени, можно несколько")
+    run_parser.add_argument("--db", action="store_true", help="включить repository.*")
+    run_parser.add_argument("--repeat", type=int, default=5)
+    run_parser.add_argument("--scale", type=float, default=1.0, help="множитель итераций")
+    run_parser.add_argument("--output", help="куда записать JSON")
+    run_parser.add_argument("--json", action="store_true", help="JSON в stdout")
+
+    compare_parser = commands.add_parser("compare", help="сравнить два прогона")
+    compare_parser.add_argument("baseline")
+    compare_parser.add_argument("current")
+    compare_parser.add_argument("--threshold", type=float, default=0.1)
+    compare_parser.add_argument("--json", action="store_true")
+
+    commands.add_parser("list", help="список бенчмарков")
+
+    args = parser.parse_args()
+
+    if args.command == "list":
+        for bench in REGISTRY.values():
+            print(f"{bench.name}{' (db)' if bench.requires_db else ''}")
+        return 0
+
+    if args.command == "compare":
+        with open(args.baseline) as f:
+            baseline = json.load(f)
+        with open(args.current) as f:
+            current = json.load(f)
+        rows = compare(baseline, current, args.threshold)
+        if args.json:
+            print(json.dumps(rows, indent=2))
+        else:
+            print_comparison(rows)
+        return 1 if any(row["status"] == "regression" for row in rows) else 0
+
+    report = asyncio.run(run(args))
+    if args.output:
+        with open(args.output, "w") as f:
+            json.dump(report, f, indent=2)
+    if args.json:
+        print(json.dumps(report, indent=2))
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
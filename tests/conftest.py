@@ -6,9 +6,11 @@ from sqlalchemy.ext.asyncio import AsyncSession, create_async_engine
 from sqlalchemy.sql import text
 
 from app.core.config import settings
+from app.core.revocation import revocation_list
+from app.core.throttling import login_throttle
 from app.db.database import Base
 from app.main import app
-from app.utils.unitofwork import UnitOfWork
+from app.utils.unitofwork import UnitOfWork, create_unit_of_work
 
 
 @pytest.fixture(scope="session")
@@ -50,9 +52,11 @@ async def client(session):
 
     class TestUnitOfWork(UnitOfWork):
         def __init__(self):
-            self.session_factory = lambda: session
+            self.session_factory = lambda **kwargs: session
 
-    app.dependency_overrides[UnitOfWork] = TestUnitOfWork
+    app.dependency_overrides[create_unit_of_work] = TestUnitOfWork
+    login_throttle.reset()
+    revocation_list.reset()
 
     async with AsyncClient(
         transport=ASGITransport(app=app), base_url="http://test", timeout=30.0
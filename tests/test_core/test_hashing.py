@@ -0,0 +1,42 @@
+import asyncio
+import threading
+
+import pytest
+
+from app.core.hashing import PasswordHasherPool
+from app.core.security import hash_password_async, verify_password_async
+from app.errors.exceptions import PasswordHasherBusyError
+
+
+@pytest.mark.asyncio
+class TestPasswordHasherPool:
+    async def test_hash_and_verify_roundtrip(self):
+        hashed = await hash_password_async("Strong_p@ss123")
+
+        assert await verify_password_async("Strong_p@ss123", hashed)
+        assert not await verify_password_async("Wrong_p@ss123", hashed)
+
+    async def test_rejects_when_saturated(self):
+        pool = PasswordHasherPool(max_workers=1, max_queue=1)
+        release = threading.Event()
+
+        tasks = [asyncio.create_task(pool.run(release.wait, 5)) for _ in range(2)]
+        await asyncio.sleep(0.05)
+
+        with pytest.raises(PasswordHasherBusyError) as exc_info:
+            await pool.run(release.wait, 5)
+        assert exc_info.value.headers == {"Retry-After": "1"}
+
+        stats = pool.stats()
+        assert stats["in_flight"] == 1
+        assert stats["queue_depth"] == 1
+        assert stats["rejected"] == 1
+
+        release.set()
+        await asyncio.gather(*tasks)
+        pool.shutdown()
+
+        stats = pool.stats()
+        assert stats["in_flight"] == 0
+        assert stats["submitted"] == 2
+        assert stats["latency"]["count"] == 2
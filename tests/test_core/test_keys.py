@@ -0,0 +1,97 @@
+from datetime import timedelta
+
+import jwt
+import pytest
+
+from app.core import security
+from app.core.keys import KeyRing, SigningKey, generate_private_key_pem
+from app.errors.exceptions import InvalidTokenError
+
+
+def make_key(kid, algorithm="EdDSA"):
+    return SigningKey.from_pem(kid, generate_private_key_pem(algorithm))
+
+
+@pytest.fixture
+def use_keyring(monkeypatch):
+    def use(keyring):
+        monkeypatch.setattr(security, "keyring", keyring)
+        security.token_cache.clear()
+        return keyring
+
+    yield use
+    security.token_cache.clear()
+
+
+@pytest.mark.parametrize("algorithm", ["EdDSA", "ES256"])
+def test_sign_and_verify(use_keyring, algorithm):
+    use_keyring(KeyRing([make_key("k1", algorithm)]))
+
+    token = security.create_token({"sub": "42", "type": "access"}, timedelta(minutes=5))
+
+    assert jwt.get_unverified_header(token) == {"alg": algorithm, "kid": "k1", "typ": "JWT"}
+    assert security.verify_token(token, "access") == "42"
+
+
+def test_rotation_keeps_old_tokens_valid(use_keyring):
+    old, new = make_key("old"), make_key("new", "ES256")
+    use_keyring(KeyRing([old], active_kid="old"))
+    old_token = security.create_token({"sub": "1", "type": "access"}, timedelta(minutes=5))
+
+    use_keyring(KeyRing([old, new], active_kid="new"))
+    new_token = security.create_token({"sub": "2", "type": "access"}, timedelta(minutes=5))
+
+    assert jwt.get_unverified_header(new_token)["kid"] == "new"
+    assert security.verify_token(old_token, "access") == "1"
+    assert security.verify_token(new_token, "access") == "2"
+
+
+def test_unknown_kid_rejected(use_keyring):
+    use_keyring(KeyRing([make_key("k1")]))
+    token = security.create_token({"sub": "1", "type": "access"}, timedelta(minutes=5))
+
+    use_keyring(KeyRing([make_key("k2")]))
+    with pytest.raises(InvalidTokenError):
+        security.verify_token(token, "access")
+
+
+def test_symmetric_token_rejected_by_keyring(use_keyring):
+    token = security.create_token({"sub": "1", "type": "access"}, timedelta(minutes=5))
+
+    use_keyring(KeyRing([make_key("k1")]))
+    with pytest.raises(InvalidTokenError):
+        security.verify_token(token, "access")
+
+
+def test_public_only_key_cannot_be_active():
+    private = make_key("k1")
+    public_only = SigningKey("k2", public_key=private.public_key)
+
+    with pytest.raises(ValueError):
+        KeyRing([private, public_only], active_kid="k2")
+
+
+def test_from_files(tmp_path):
+    path = tmp_path / "k1.pem"
+    path.write_bytes(generate_private_key_pem("ES256"))
+
+    keyring = KeyRing.from_files({"k1": str(path)})
+    assert keyring.signing_key.algorithm == "ES256"
+
+
+async def test_jwks_endpoint(client, use_keyring):
+    use_keyring(KeyRing([make_key("k1"), make_key("k2", "ES256")]))
+
+    response = await client.get("/.well-known/jwks.json")
+
+    assert response.status_code == 200
+    assert "max-age" in response.headers["cache-control"]
+    keys = {key["kid"]: key for key in response.json()["keys"]}
+    assert keys["k1"]["kty"] == "OKP" and keys["k1"]["alg"] == "EdDSA"
+    assert keys["k2"]["kty"] == "EC" and keys["k2"]["alg"] == "ES256"
+    assert "d" not in keys["k1"] and "d" not in keys["k2"]
+
+
+async def test_jwks_empty_for_symmetric_signing(client):
+    response = await client.get("/.well-known/jwks.json")
+    assert response.json() == {"keys": []}
@@ -0,0 +1,79 @@
+import logging
+from datetime import datetime, timedelta
+from uuid import uuid4
+
+import pytest
+
+from app.core import lifespan
+from app.core.config import settings
+from app.core.revocation import revocation_list
+from app.db.database import build_engine
+from app.main import app
+from app.repositories.memory_repository import InMemoryStore
+from app.utils.unitofwork import InMemoryUnitOfWork
+
+
+@pytest.fixture
+async def fresh_engine():
+    engine = build_engine(settings.ASYNC_DATABASE_URL)
+    yield engine
+    await engine.dispose()
+
+
+@pytest.mark.asyncio
+async def test_warm_up_pool_keeps_connections(fresh_engine):
+    await lifespan.warm_up_pool(fresh_engine, 2)
+
+    assert fresh_engine.pool.checkedin() == 2
+    assert fresh_engine.pool.checkedout() == 0
+
+
+@pytest.mark.asyncio
+async def test_warm_up_pool_is_capped_by_pool_size(fresh_engine, monkeypatch):
+    monkeypatch.setattr(settings, "DB_POOL_SIZE", 1)
+
+    await lifespan.warm_up_pool(fresh_engine, 3)
+
+    assert fresh_engine.pool.checkedin() == 1
+
+
+@pytest.mark.asyncio
+async def test_warm_up_survives_unavailable_database(monkeypatch, caplog):
+    async def unavailable():
+        raise OSError("connection refused")
+
+    monkeypatch.setattr(lifespan, "_warm_up_database", unavailable)
+    monkeypatch.setattr(app, "openapi_schema", None)
+    caplog.set_level(logging.WARNING, logger=lifespan.__name__)
+
+    try:
+        timings = await lifespan.warm_up(app)
+    finally:
+        revocation_list.reset()
+
+    assert set(timings) == {"keyring", "hashing", "pool", "revocation", "openapi"}
+    assert app.openapi_schema is not None
+    assert "Прогрев 'pool' не удался" in caplog.text
+
+
+@pytest.mark.asyncio
+async def test_maintenance_purges_expired_revocations(monkeypatch):
+    store = InMemoryStore()
+    monkeypatch.setattr(lifespan, "create_unit_of_work", lambda: InMemoryUnitOfWork(store))
+    now = datetime.utcnow()
+    active, expired = uuid4(), uuid4()
+    async with InMemoryUnitOfWork(store) as uow:
+        await uow.revoked_token_repo.revoke(active, uuid4(), now + timedelta(hours=1))
+        await uow.revoked_token_repo.revoke(expired, uuid4(), now - timedelta(hours=1))
+        await uow.commit()
+    revocation_list.add(expired)
+
+    try:
+        await lifespan.maintain_revocation_list()
+
+        assert len(revocation_list.filter) == 1
+        assert str(active) in revocation_list.filter
+        async with InMemoryUnitOfWork(store) as uow:
+            assert not await uow.revoked_token_repo.is_revoked(expired)
+    finally:
+        revocation_list.reset()
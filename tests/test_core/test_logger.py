@@ -0,0 +1,108 @@
+import json
+import logging
+import sys
+
+import pytest
+
+from app.core import logger as app_logger
+from app.core.config import settings
+from app.core.logger import BoundedQueueHandler, JsonFormatter
+
+
+def make_record(msg="Пользователь %s вошёл", args=("user@example.com",), **extra):
+    record = logging.makeLogRecord(
+        {"name": "app.test", "levelname": "INFO", "levelno": logging.INFO, "msg": msg, "args": args}
+    )
+    record.__dict__.update(extra)
+    return record
+
+
+class TestJsonFormatter:
+    def test_formats_message_and_extra(self):
+        data = json.loads(JsonFormatter().format(make_record(duration_ms=1.5)))
+
+        assert data["level"] == "INFO"
+        assert data["logger"] == "app.test"
+        assert data["message"] == "Пользователь user@example.com вошёл"
+        assert data["duration_ms"] == 1.5
+        assert "args" not in data
+
+    def test_formats_exception(self):
+        try:
+            raise ValueError("boom")
+        except ValueError:
+            record = logging.makeLogRecord(
+                {"msg": "ошибка", "exc_info": sys.exc_info()}
+            )
+
+        data = json.loads(JsonFormatter().format(record))
+        assert "ValueError: boom" in data["exc_info"]
+
+
+class TestBoundedQueueHandler:
+    def test_drops_records_when_queue_is_full(self):
+        handler = BoundedQueueHandler(maxsize=2)
+        for _ in range(5):
+            handler.handle(make_record())
+
+        assert handler.queue.qsize() == 2
+        assert handler.dropped == 3
+
+    def test_prepares_message_before_enqueue(self):
+        handler = BoundedQueueHandler(maxsize=1)
+        handler.handle(make_record())
+
+        record = handler.queue.get_nowait()
+        assert record.msg == "Пользователь user@example.com вошёл"
+        assert record.args is None
+
+
+@pytest.fixture
+def restore_root_logger():
+    root = logging.getLogger()
+    handlers, level = root.handlers[:], root.level
+    yield
+    app_logger.stop_logger()
+    root.handlers[:] = handlers
+    root.setLevel(level)
+
+
+def test_queue_mode_writes_through_listener(monkeypatch, restore_root_logger, capsys):
+    monkeypatch.setattr(settings, "LOG_QUEUE_ENABLED", True)
+    monkeypatch.setattr(settings, "LOG_FORMAT", "json")
+    monkeypatch.setattr(settings, "LOG_LEVEL", "INFO")
+
+    app_logger.configure_logger()
+    logging.getLogger("app.test").info("запрос обработан", extra={"status_code": 200})
+    app_logger.stop_logger()
+
+    line = capsys.readouterr().err.strip().splitlines()[-1]
+    assert json.loads(line)["status_code"] == 200
+    assert app_logger.logger_stats()["dropped"] == 0
+
+
+def test_logs_after_stop_are_written(monkeypatch, restore_root_logger, capsys):
+    monkeypatch.setattr(settings, "LOG_QUEUE_ENABLED", True)
+    monkeypatch.setattr(settings, "LOG_FORMAT", "json")
+    monkeypatch.setattr(settings, "LOG_LEVEL", "INFO")
+
+    app_logger.configure_logger()
+    app_logger.stop_logger()
+    logging.getLogger("app.test").info("завершение работы")
+    app_logger.stop_logger()
+
+    line = capsys.readouterr().err.strip().splitlines()[-1]
+    assert json.loads(line)["message"] == "завершение работы"
+    assert not any(
+        isinstance(handler, BoundedQueueHandler) for handler in logging.getLogger().handlers
+    )
+
+
+def test_listener_stops_with_full_queue():
+    handler = BoundedQueueHandler(maxsize=1)
+    handler.handle(make_record())
+    listener = app_logger.BoundedQueueListener(handler.queue, logging.NullHandler())
+    listener.start()
+    listener.stop()
+
+    assert handler.queue.empty()
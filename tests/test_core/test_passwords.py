@@ -0,0 +1,61 @@
+import pytest
+from passlib.context import CryptContext
+
+from app.core import passwords
+from app.core.config import settings
+from app.core.passwords import (
+    BCRYPT_MAX_ROUNDS,
+    BCRYPT_MIN_ROUNDS,
+    build_password_context,
+    calibrate_bcrypt_rounds,
+)
+
+
+@pytest.mark.parametrize(
+    "base_ms, target_ms, expected",
+    [
+        (20, 150, BCRYPT_MIN_ROUNDS),
+        (2, 150, 14),
+        (2, 300, 15),
+        (0.01, 10_000, BCRYPT_MAX_ROUNDS),
+    ],
+)
+def test_calibrate_bcrypt_rounds(monkeypatch, base_ms, target_ms, expected):
+    monkeypatch.setattr(passwords, "_measure_ms", lambda context: base_ms)
+    assert calibrate_bcrypt_rounds(target_ms) == expected
+
+
+def test_zero_rounds_triggers_calibration(monkeypatch):
+    monkeypatch.setattr(settings, "BCRYPT_ROUNDS", 0)
+    monkeypatch.setattr(passwords, "calibrate_bcrypt_rounds", lambda target_ms: 11)
+    monkeypatch.delenv("BCRYPT_ROUNDS", raising=False)
+
+    context = build_password_context()
+
+    assert settings.BCRYPT_ROUNDS == 11
+    assert context.hash("Strong_p@ss123").startswith("$2b$11$")
+
+
+def test_weaker_hash_needs_update(monkeypatch):
+    monkeypatch.setattr(settings, "BCRYPT_ROUNDS", 5)
+    context = build_password_context()
+
+    weak = CryptContext(schemes=["bcrypt"], bcrypt__rounds=4).hash("Strong_p@ss123")
+    strong = CryptContext(schemes=["bcrypt"], bcrypt__rounds=6).hash("Strong_p@ss123")
+
+    assert context.needs_update(weak)
+    assert not context.needs_update(strong)
+    assert not context.needs_update(context.hash("Strong_p@ss123"))
+
+
+def test_argon2_rehashes_bcrypt(monkeypatch):
+    pytest.importorskip("argon2")
+    monkeypatch.setattr(settings, "PASSWORD_SCHEME", "argon2")
+    monkeypatch.setattr(settings, "ARGON2_MEMORY_COST", 1024)
+    monkeypatch.setattr(settings, "ARGON2_TIME_COST", 1)
+    context = build_password_context()
+
+    bcrypt_hash = CryptContext(schemes=["bcrypt"], bcrypt__rounds=4).hash("x")
+    assert context.verify("x", bcrypt_hash)
+    assert context.needs_update(bcrypt_hash)
+    assert context.hash("x").startswith("$argon2")
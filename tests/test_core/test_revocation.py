@@ -0,0 +1,80 @@
+import asyncio
+from datetime import datetime, timedelta
+from uuid import uuid4
+
+import pytest
+
+from app.core.revocation import RevocationList
+from app.repositories.memory_repository import InMemoryStore
+from app.utils.unitofwork import InMemoryUnitOfWork
+
+
+@pytest.fixture
+def uow():
+    return InMemoryUnitOfWork(InMemoryStore())
+
+
+async def revoke(uow, count, expires_in=timedelta(hours=1)):
+    jtis = [uuid4() for _ in range(count)]
+    async with uow:
+        for jti in jtis:
+            await uow.revoked_token_repo.revoke(jti, uuid4(), datetime.utcnow() + expires_in)
+        await uow.commit()
+    return jtis
+
+
+@pytest.mark.asyncio
+async def test_saturated_filter_is_rebuilt_from_active_jtis(uow):
+    revocations = RevocationList(capacity=4, error_rate=0.01)
+    active = await revoke(uow, 3)
+    async with uow:
+        await revocations.hydrate(uow.revoked_token_repo)
+
+    expired = await revoke(uow, 4, expires_in=timedelta(hours=-1))
+    for jti in expired:
+        revocations.add(jti)
+    assert revocations.saturated
+
+    async with uow:
+        assert await revocations.is_revoked(active[0], uow.revoked_token_repo)
+
+    assert revocations.rebuilds == 1
+    assert not revocations.saturated
+    assert len(revocations.filter) == 3
+
+
+@pytest.mark.asyncio
+async def test_filter_grows_past_capacity(uow):
+    revocations = RevocationList(capacity=4, error_rate=0.01)
+    await revoke(uow, 10)
+
+    async with uow:
+        await revocations.hydrate(uow.revoked_token_repo)
+
+    assert revocations.filter.capacity == 20
+    assert not revocations.saturated
+
+
+@pytest.mark.asyncio
+async def test_revocation_during_rebuild_is_kept(uow, monkeypatch):
+    revocations = RevocationList(capacity=100, error_rate=0.01)
+    await revoke(uow, 2)
+    late = uuid4()
+    iter_active_jtis = uow.revoked_token_repo.iter_active_jtis
+
+    async def slow_iter(now):
+        async for jti in iter_active_jtis(now):
+            yield jti
+            await asyncio.sleep(0)
+
+    monkeypatch.setattr(uow.revoked_token_repo, "iter_active_jtis", slow_iter)
+
+    async def revoke_late():
+        await asyncio.sleep(0)
+        revocations.add(late)
+
+    async with uow:
+        await asyncio.gather(revocations.rebuild(uow.revoked_token_repo), revoke_late())
+
+    assert str(late) in revocations.filter
+    assert len(revocations.filter) == 3
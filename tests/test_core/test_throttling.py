@@ -0,0 +1,83 @@
+import pytest
+
+from app.core.throttling import InMemoryTokenBucketBackend, LoginThrottle
+from app.errors.exceptions import TooManyRequestsError
+
+
+class FakeClock:
+    def __init__(self):
+        self.now = 0.0
+
+    def __call__(self):
+        return self.now
+
+
+@pytest.fixture
+def clock():
+    return FakeClock()
+
+
+def make_backend(clock, capacity=2, per_second=1.0, maxsize=100):
+    return InMemoryTokenBucketBackend(capacity, per_second, maxsize, clock=clock)
+
+
+class TestTokenBucket:
+    def test_allows_burst_then_limits(self, clock):
+        backend = make_backend(clock)
+
+        assert backend.hit("a") == 0
+        assert backend.hit("a") == 0
+        assert backend.hit("a") == pytest.approx(1.0)
+
+    def test_refills_over_time(self, clock):
+        backend = make_backend(clock)
+        backend.hit("a")
+        backend.hit("a")
+
+        clock.now = 0.5
+        assert backend.hit("a") == pytest.approx(0.5)
+        clock.now = 1.0
+        assert backend.hit("a") == 0
+
+    def test_evicts_least_recently_used_keys(self, clock):
+        backend = make_backend(clock, capacity=1, maxsize=2)
+        backend.hit("a")
+        backend.hit("b")
+        backend.hit("a")
+        backend.hit("c")
+
+        assert backend.stats() == {"keys": 2, "maxsize": 2, "evictions": 1}
+        assert backend.hit("b") == 0
+
+
+class TestLoginThrottle:
+    def test_limits_by_email_case_insensitively(self, clock):
+        throttle = LoginThrottle(
+            make_backend(clock, capacity=1), make_backend(clock, capacity=10)
+        )
+        throttle.check("user@example.com", "10.0.0.1")
+
+        with pytest.raises(TooManyRequestsError) as exc_info:
+            throttle.check("USER@example.com", "10.0.0.2")
+
+        assert exc_info.value.status_code == 429
+        assert exc_info.value.headers == {"Retry-After": "1"}
+        assert throttle.stats()["throttled_email"] == 1
+
+    def test_limits_by_ip_across_emails(self, clock):
+        throttle = LoginThrottle(
+            make_backend(clock, capacity=10), make_backend(clock, capacity=2)
+        )
+        throttle.check("a@example.com", "10.0.0.1")
+        throttle.check("b@example.com", "10.0.0.1")
+
+        with pytest.raises(TooManyRequestsError):
+            throttle.check("c@example.com", "10.0.0.1")
+        assert throttle.stats()["throttled_ip"] == 1
+        assert throttle.stats()["allowed"] == 2
+
+    def test_disabled(self, clock):
+        throttle = LoginThrottle(
+            make_backend(clock, capacity=0), make_backend(clock, capacity=0), enabled=False
+        )
+        throttle.check("user@example.com", "10.0.0.1")
@@ -0,0 +1,62 @@
+from datetime import timedelta
+
+import pytest
+
+from app.core.security import create_token, token_cache, verify_token
+from app.errors.exceptions import InvalidTokenError
+from app.utils.cache import TTLCache
+
+
+class FakeClock:
+    def __init__(self):
+        self.now = 1000.0
+
+    def __call__(self):
+        return self.now
+
+
+class TestTTLCache:
+    def test_evicts_least_recently_used(self):
+        cache = TTLCache(maxsize=2, clock=FakeClock())
+        cache.set("a", 1, expires_at=2000)
+        cache.set("b", 2, expires_at=2000)
+        cache.get("a")
+        cache.set("c", 3, expires_at=2000)
+
+        assert cache.get("a") == 1
+        assert cache.get("b") is None
+        assert cache.evictions == 1
+
+    def test_entry_expires_at_deadline(self):
+        clock = FakeClock()
+        cache = TTLCache(maxsize=10, clock=clock)
+        cache.set("a", 1, expires_at=1010)
+
+        clock.now = 1009.9
+        assert cache.get("a") == 1
+        clock.now = 1010
+        assert cache.get("a") is None
+        assert cache.expirations == 1
+        assert len(cache) == 0
+
+    def test_zero_maxsize_disables_cache(self):
+        cache = TTLCache(maxsize=0)
+        cache.set("a", 1, expires_at=float("inf"))
+        assert cache.get("a") is None
+
+
+class TestVerifyTokenCache:
+    def test_repeated_verification_hits_cache(self):
+        token = create_token({"sub": "user-1", "type": "access"}, timedelta(minutes=5))
+        hits = token_cache.hits
+
+        assert verify_token(token, "access") == "user-1"
+        assert verify_token(token, "access") == "user-1"
+        assert token_cache.hits == hits + 1
+
+    def test_cached_token_still_checks_type(self):
+        token = create_token({"sub": "user-1", "type": "access"}, timedelta(minutes=5))
+        verify_token(token, "access")
+
+        with pytest.raises(InvalidTokenError):
+            verify_token(token, "refresh")
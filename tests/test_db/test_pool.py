@@ -0,0 +1,64 @@
+import pytest
+from sqlalchemy import exc
+from sqlalchemy.ext.asyncio import create_async_engine
+
+from app.core.config import settings
+from app.db.database import engine
+from app.db.pool import AdaptivePoolSizer, InstrumentedAsyncPool, instrument_pool, pool_stats
+
+
+@pytest.fixture
+async def small_engine():
+    engine = create_async_engine(
+        settings.ASYNC_DATABASE_URL,
+        poolclass=InstrumentedAsyncPool,
+        pool_size=1,
+        max_overflow=0,
+        pool_timeout=0.1,
+    )
+    instrument_pool(engine)
+    yield engine
+    await engine.dispose()
+
+
+class FakePool:
+    _max_overflow = 4
+
+
+@pytest.mark.asyncio
+class TestInstrumentedPool:
+    async def test_engine_uses_instrumented_pool(self):
+        assert isinstance(engine.sync_engine.pool, InstrumentedAsyncPool)
+        assert pool_stats(engine)["max_overflow"] == settings.DB_MAX_OVERFLOW
+
+    async def test_counts_checkouts_and_timeouts(self, small_engine):
+        async with small_engine.connect():
+            with pytest.raises(exc.TimeoutError):
+                async with small_engine.connect():
+                    pass
+
+        stats = pool_stats(small_engine)
+        assert stats["checkouts"] == 1
+        assert stats["timeouts"] == 1
+        assert stats["wait"]["count"] == 1
+
+
+class TestAdaptivePoolSizer:
+    def test_grows_when_waits_exceed_target(self):
+        pool = FakePool()
+        sizer = AdaptivePoolSizer(min_overflow=0, max_overflow=6, target_wait_ms=5, window=2)
+
+        for _ in range(4):
+            sizer.observe(pool, 50)
+
+        assert pool._max_overflow == 6
+        assert sizer.adjustments == 1
+
+    def test_shrinks_when_pool_is_idle(self):
+        pool = FakePool()
+        sizer = AdaptivePoolSizer(min_overflow=0, max_overflow=6, target_wait_ms=5, window=2)
+
+        for _ in range(2):
+            sizer.observe(pool, 0.1)
+
+        assert pool._max_overflow == 2
@@ -0,0 +1,82 @@
+import pytest
+from sqlalchemy.ext.asyncio import create_async_engine
+
+from app.core.config import settings
+from app.db.database import autocommit_engine
+from app.db.models import User
+from app.db.routing import ReplicaRouter
+from app.utils.unitofwork import UnitOfWork
+
+
+@pytest.fixture
+async def replica_engines():
+    engines = [create_async_engine(settings.ASYNC_DATABASE_URL) for _ in range(2)]
+    yield engines
+    for engine in engines:
+        await engine.dispose()
+
+
+@pytest.fixture
+def router(replica_engines):
+    return ReplicaRouter(replica_engines, read_your_writes_seconds=60)
+
+
+@pytest.fixture
+def uow(router):
+    uow = UnitOfWork()
+    uow.router = router
+    return uow
+
+
+class TestReplicaRouter:
+    def test_round_robin(self, router, replica_engines):
+        assert [router.choose() for _ in range(4)] == replica_engines * 2
+
+    def test_least_connections(self, replica_engines):
+        router = ReplicaRouter(replica_engines, strategy="least_connections")
+        assert router.choose() is replica_engines[0]
+
+    def test_recent_write_pins_reads_to_primary(self, router):
+        router.mark_written("user-1")
+
+        assert router.choose("user-1") is None
+        assert router.choose("user-2") is not None
+        assert router.stats()["pinned_reads"] == 1
+
+    def test_no_replicas_means_primary(self):
+        router = ReplicaRouter([])
+        router.mark_written("user-1")
+        assert router.choose() is None
+
+
+@pytest.mark.asyncio
+class TestUnitOfWorkRouting:
+    async def test_read_only_block_uses_replica(self, uow, replica_engines, session):
+        user = User(email="replica@example.com", hashed_password="hashed")
+        session.add(user)
+        await session.commit()
+
+        async with uow.read_only() as read_uow:
+            assert read_uow.session.bind is autocommit_engine(replica_engines[0])
+            found = await read_uow.user_repo.find_by_email("replica@example.com")
+            assert found is not None
+
+    async def test_write_block_uses_primary(self, uow, replica_engines):
+        async with uow as write_uow:
+            assert write_uow.session.bind not in replica_engines
+
+    async def test_pinned_key_reads_from_primary(self, uow, router, replica_engines):
+        router.mark_written("user-1")
+
+        async with uow.read_only(consistency_key="user-1") as read_uow:
+            assert read_uow.session.bind not in replica_engines
+
+    async def test_request_scoped_write_leaves_replica(self, uow, replica_engines):
+        uow.request_scoped = True
+
+        async with uow.read_only():
+            assert uow.session.bind in map(autocommit_engine, replica_engines)
+        async with uow:
+            assert uow.session.bind not in map(autocommit_engine, replica_engines)
+
+        await uow.close()
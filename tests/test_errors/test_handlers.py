@@ -0,0 +1,146 @@
+import json
+import logging
+
+import pytest
+from fastapi import FastAPI
+from httpx import ASGITransport, AsyncClient
+
+from app.errors import handlers
+from app.errors.exceptions import (
+    BaseHTTPException,
+    DatabaseError,
+    InvalidCredentialsError,
+    PasswordHasherBusyError,
+    UserNotFoundError,
+)
+from app.errors.handlers import LogRateLimiter, http_exception_handler
+
+
+class FakeClock:
+    def __init__(self):
+        self.now = 0.0
+
+    def __call__(self):
+        return self.now
+
+
+@pytest.fixture
+def app():
+    app = FastAPI()
+    app.add_exception_handler(BaseHTTPException, http_exception_handler)
+
+    @app.get("/login")
+    async def login():
+        raise InvalidCredentialsError()
+
+    @app.get("/user")
+    async def user():
+        raise UserNotFoundError(detail="Пользователь не найден")
+
+    @app.get("/db")
+    async def db():
+        raise DatabaseError()
+
+    @app.get("/busy")
+    async def busy():
+        raise PasswordHasherBusyError(retry_after=1)
+
+    return app
+
+
+@pytest.fixture(autouse=True)
+def limiter(monkeypatch):
+    limiter = LogRateLimiter(burst=2, interval=60, clock=FakeClock())
+    monkeypatch.setattr(handlers, "client_error_log_limiter", limiter)
+    return limiter
+
+
+async def get(app, path):
+    async with AsyncClient(
+        transport=ASGITransport(app=app), base_url="http://test"
+    ) as client:
+        return await client.get(path)
+
+
+async def test_error_body_format(app):
+    response = await get(app, "/user")
+
+    assert response.status_code == 404
+    assert response.headers["content-type"] == "application/json"
+    assert response.json() == {
+        "error": {
+            "type": "UserNotFoundError",
+            "message": "Пользователь не найден",
+            "code": 404,
+        }
+    }
+
+
+async def test_error_body_is_cached_per_class_status_and_detail(app):
+    first = await get(app, "/login")
+    second = await get(app, "/login")
+
+    assert first.content == second.content
+    assert handlers._error_bodies[
+        (InvalidCredentialsError, 401, "Invalid credentials")
+    ] == first.content
+    assert json.loads(first.content)["error"]["code"] == 401
+
+
+async def test_error_body_cache_respects_status_code(app):
+    @app.get("/teapot")
+    async def teapot():
+        exc = InvalidCredentialsError()
+        exc.status_code = 418
+        raise exc
+
+    await get(app, "/login")
+    response = await get(app, "/teapot")
+
+    assert response.status_code == 418
+    assert response.json()["error"]["code"] == 418
+
+
+async def test_client_errors_are_rate_limited(app, caplog):
+    with caplog.at_level(logging.WARNING, logger="app.errors.handlers"):
+        for _ in range(5):
+            await get(app, "/login")
+
+    assert len(caplog.records) == 2
+
+
+async def test_server_errors_are_always_logged(app, caplog):
+    with caplog.at_level(logging.WARNING, logger="app.errors.handlers"):
+        for _ in range(5):
+            await get(app, "/db")
+
+    assert [record.levelno for record in caplog.records] == [logging.ERROR] * 5
+
+
+async def test_hasher_busy_is_rate_limited_warning(app, caplog):
+    with caplog.at_level(logging.WARNING, logger="app.errors.handlers"):
+        for _ in range(5):
+            response = await get(app, "/busy")
+
+    assert response.status_code == 503
+    assert response.headers["retry-after"] == "1"
+    assert [record.levelno for record in caplog.records] == [logging.WARNING] * 2
+
+
+class TestLogRateLimiter:
+    def test_reports_suppressed_after_window(self):
+        clock = FakeClock()
+        limiter = LogRateLimiter(burst=1, interval=10, clock=clock)
+
+        assert limiter.acquire("key") == 0
+        assert limiter.acquire("key") is None
+        assert limiter.acquire("key") is None
+
+        clock.now = 10
+        assert limiter.acquire("key") == 2
+
+    def test_keys_are_independent(self):
+        limiter = LogRateLimiter(burst=1, interval=10, clock=FakeClock())
+
+        assert limiter.acquire("a") == 0
+        assert limiter.acquire("b") == 0
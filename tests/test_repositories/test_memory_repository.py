@@ -0,0 +1,179 @@
+import time
+from datetime import datetime, timedelta
+from uuid import uuid4
+
+import pytest
+from httpx import ASGITransport, AsyncClient
+
+from app.core.cache import principal_cache
+from app.db.models import UserRole
+from app.errors.exceptions import DatabaseError, InvalidCursorError
+from app.main import app
+from app.repositories.memory_repository import InMemoryStore
+from app.utils.unitofwork import InMemoryUnitOfWork, create_unit_of_work
+
+
+@pytest.fixture
+def store():
+    return InMemoryStore()
+
+
+@pytest.fixture
+def uow(store):
+    return InMemoryUnitOfWork(store)
+
+
+async def create_users(uow, count):
+    async with uow:
+        users = await uow.user_repo.create_many(
+            [{"email": f"user{i}@example.com", "hashed_password": "hashed"} for i in range(count)]
+        )
+        await uow.commit()
+    return users
+
+
+@pytest.mark.asyncio
+class TestInMemoryUserRepository:
+    async def test_create_applies_defaults_and_indexes(self, uow):
+        async with uow:
+            user = await uow.user_repo.create(
+                {"email": "user@example.com", "hashed_password": "hashed"}
+            )
+
+            assert user.id is not None
+            assert user.role == UserRole.USER
+            by_id = await uow.user_repo.find_by_id(str(user.id), columns=("email",))
+            assert by_id.email == "user@example.com"
+            by_email = await uow.user_repo.find_by_email("user@example.com")
+            assert by_email.id == user.id
+
+    async def test_create_rejects_duplicate_email(self, uow):
+        async with uow:
+            await uow.user_repo.create({"email": "user@example.com", "hashed_password": "a"})
+            with pytest.raises(DatabaseError):
+                await uow.user_repo.create(
+                    {"email": "user@example.com", "hashed_password": "b"}
+                )
+
+    async def test_create_many_skips_conflicts(self, uow):
+        await create_users(uow, 1)
+        async with uow:
+            created = await uow.user_repo.create_many(
+                [
+                    {"email": "user0@example.com", "hashed_password": "hashed"},
+                    {"email": "new@example.com", "hashed_password": "hashed"},
+                    {"email": "new@example.com", "hashed_password": "hashed"},
+                ]
+            )
+
+        assert [user.email for user in created] == ["new@example.com"]
+
+    async def test_find_page_walks_all_rows(self, uow):
+        users = await create_users(uow, 7)
+
+        seen, cursor = [], None
+        async with uow.read_only():
+            while True:
+                rows, cursor = await uow.user_repo.find_page(
+                    3, cursor=cursor, order_by="email", columns=("email",)
+                )
+                seen += [row.email for row in rows]
+                if cursor is None:
+                    break
+
+        assert seen == sorted(user.email for user in users)
+
+    @pytest.mark.parametrize("cursor", ["garbage", "WzEyM10", "W1sxXV0"])
+    async def test_find_page_rejects_bad_cursor(self, uow, cursor):
+        async with uow:
+            with pytest.raises(InvalidCursorError):
+                await uow.user_repo.find_page(3, cursor=cursor)
+
+    async def test_update_password_hash_is_conditional(self, uow):
+        [user] = await create_users(uow, 1)
+        async with uow:
+            assert await uow.user_repo.update_password_hash(user.id, "hashed", "new")
+            assert not await uow.user_repo.update_password_hash(user.id, "hashed", "other")
+            stored = await uow.user_repo.find_by_id(user.id)
+
+        assert stored.hashed_password == "new"
+
+    async def test_unknown_column(self, uow):
+        async with uow:
+            with pytest.raises(ValueError):
+                await uow.user_repo.find_by_id(uuid4(), columns=("nope",))
+
+
+@pytest.mark.asyncio
+class TestInMemoryUnitOfWork:
+    async def test_exit_without_commit_rolls_back(self, uow):
+        async with uow:
+            user = await uow.user_repo.create(
+                {"email": "user@example.com", "hashed_password": "hashed"}
+            )
+            await uow.user_repo.update(user.id, {"email": "renamed@example.com"})
+
+        async with uow:
+            assert await uow.user_repo.find_all() == []
+            assert await uow.user_repo.find_by_email("renamed@example.com") is None
+
+    async def test_rollback_restores_committed_state(self, uow):
+        [user] = await create_users(uow, 1)
+        async with uow:
+            await uow.user_repo.update(user.id, {"email": "renamed@example.com"})
+            await uow.user_repo.delete(user.id)
+            await uow.rollback()
+
+            restored = await uow.user_repo.find_by_email("user0@example.com")
+            assert restored.id == user.id
+            assert await uow.user_repo.find_by_email("renamed@example.com") is None
+
+    async def test_rollback_drops_cached_principal(self, uow):
+        [user] = await create_users(uow, 1)
+        async with uow:
+            await uow.user_repo.update(user.id, {"email": "renamed@example.com"})
+            principal_cache.set(str(user.id), "renamed", time.time() + 60)
+            await uow.rollback()
+
+        assert principal_cache.get(str(user.id)) is None
+
+    async def test_writes_are_shared_between_units(self, store, uow):
+        await create_users(uow, 2)
+
+        async with InMemoryUnitOfWork(store) as other:
+            assert len(await other.user_repo.find_all()) == 2
+
+    async def test_revoked_tokens(self, uow):
+        jti, now = uuid4(), datetime.now()
+        async with uow:
+            assert await uow.revoked_token_repo.revoke(jti, uuid4(), now + timedelta(hours=1))
+            assert not await uow.revoked_token_repo.revoke(jti, uuid4(), now)
+            await uow.revoked_token_repo.revoke(uuid4(), uuid4(), now - timedelta(hours=1))
+            await uow.commit()
+
+            assert await uow.revoked_token_repo.is_revoked(str(jti))
+            assert [j async for j in uow.revoked_token_repo.iter_active_jtis(now)] == [jti]
+
+            assert await uow.revoked_token_repo.purge_expired(now) == 1
+            assert await uow.revoked_token_repo.is_revoked(str(jti))
+
+
+@pytest.mark.asyncio
+async def test_auth_flow_without_database(store):
+    app.dependency_overrides[create_unit_of_work] = lambda: InMemoryUnitOfWork(store)
+    credentials = {"email": "memory@example.com", "password": "Strong_p@ss123"}
+    try:
+        async with AsyncClient(
+            transport=ASGITransport(app=app), base_url="http://test"
+        ) as client:
+            assert (await client.post("/api/auth/register", json=credentials)).status_code == 200
+            tokens = (await client.post("/api/auth/login", json=credentials)).json()
+            me = await client.get(
+                "/api/users/me",
+                headers={"Authorization": f"Bearer {tokens['access_token']}"},
+            )
+    finally:
+        app.dependency_overrides.clear()
+
+    assert me.status_code == 200
+    assert credentials["email"] in me.json()["message"]
@@ -0,0 +1,28 @@
+from datetime import datetime, timedelta
+from uuid import uuid4
+
+import pytest
+from sqlalchemy import text
+
+from app.repositories.revoked_token_repository import RevokedTokenRepository
+
+
+@pytest.fixture
+async def repo(session):
+    await session.execute(text("TRUNCATE TABLE revoked_tokens"))
+    await session.commit()
+    yield RevokedTokenRepository(session)
+    await session.rollback()
+
+
+@pytest.mark.asyncio
+async def test_purge_expired_keeps_active(repo):
+    now = datetime.utcnow()
+    active = uuid4()
+    await repo.revoke(active, uuid4(), now + timedelta(hours=1))
+    for _ in range(2):
+        await repo.revoke(uuid4(), uuid4(), now - timedelta(hours=1))
+
+    assert await repo.purge_expired(now) == 2
+    assert [jti async for jti in repo.iter_active_jtis(now)] == [active]
+    assert await repo.purge_expired(now) == 0
@@ -0,0 +1,84 @@
+import pytest
+from sqlalchemy import text
+
+from app.db.models import UserRole
+from app.repositories.user_repository import UserRepository
+
+
+@pytest.fixture
+async def repo(session):
+    await session.execute(text("TRUNCATE TABLE users CASCADE"))
+    await session.commit()
+    yield UserRepository(session)
+    await session.rollback()
+
+
+@pytest.mark.asyncio
+class TestCreateMany:
+    @pytest.mark.parametrize("use_copy", [False, True])
+    async def test_skips_conflicts(self, repo, use_copy):
+        await repo.create({"email": "taken@example.com", "hashed_password": "hashed"})
+        rows = [
+            {"email": "taken@example.com", "hashed_password": "hashed", "role": UserRole.USER},
+            {"email": "new@example.com", "hashed_password": "hashed", "role": UserRole.USER},
+            {"email": "admin@example.com", "hashed_password": "hashed", "role": UserRole.ADMIN},
+        ]
+
+        created = await repo.create_many(rows, use_copy=use_copy)
+
+        assert sorted(user.email for user in created) == [
+            "admin@example.com",
+            "new@example.com",
+        ]
+        assert all(user.id is not None for user in created)
+        admin = await repo.find_by_email("admin@example.com")
+        assert admin.role == UserRole.ADMIN
+
+    async def test_empty_input(self, repo):
+        assert await repo.create_many([]) == []
+
+    async def test_rejects_mixed_fields(self, repo):
+        with pytest.raises(ValueError):
+            await repo.create_many(
+                [
+                    {"email": "a@example.com", "hashed_password": "hashed"},
+                    {"email": "b@example.com", "hashed_password": "hashed", "role": UserRole.ADMIN},
+                ]
+            )
+
+
+@pytest.mark.asyncio
+class TestCachedStatements:
+    async def test_hot_queries_reuse_statement(self, repo):
+        user = await repo.create({"email": "cached@example.com", "hashed_password": "hashed"})
+
+        assert (await repo.find_by_id(user.id)).email == "cached@example.com"
+        assert (await repo.find_by_email("cached@example.com")).id == user.id
+        assert await repo.find_by_email("missing@example.com") is None
+
+        build = lambda: pytest.fail("statement rebuilt")
+        assert UserRepository.cached_statement(("find_by_id", None), build) is not None
+        assert UserRepository.cached_statement(("find_by_email", None), build) is not None
+
+
+@pytest.mark.asyncio
+class TestProjections:
+    async def test_find_by_email_returns_row(self, repo, session):
+        await repo.create({"email": "row@example.com", "hashed_password": "hashed"})
+        session.expunge_all()
+
+        row = await repo.find_by_email("row@example.com", columns=("id", "role"))
+
+        assert row._fields == ("id", "role")
+        assert row.role == UserRole.USER
+        assert len(session.identity_map) == 0
+
+    async def test_find_by_id_projection(self, repo):
+        user = await repo.create({"email": "row@example.com", "hashed_password": "hashed"})
+
+        row = await repo.find_by_id(user.id, columns=repo.principal_columns)
+        assert row.email == "row@example.com"
+
+    async def test_unknown_column(self, repo):
+        with pytest.raises(ValueError):
+            await repo.find_all(columns=("password",))
@@ -1,5 +1,10 @@
 import pytest
 from fastapi import status
+from passlib.context import CryptContext
+from sqlalchemy import select
+
+from app.core.config import settings
+from app.db.models import User
 
 from tests.test_routers.auth.conftest import (
     get_invalid_emails,
@@ -82,3 +87,37 @@ class TestUserLogin:
         payload["email"] = payload["email"].upper()
         response = await client.post("/api/auth/login", json=payload)
         assert response.status_code == status.HTTP_200_OK
+
+    async def test_login_throttled_by_email(
+        self, client, valid_login_payload, existing_user
+    ):
+        payload = valid_login_payload.copy()
+        payload["password"] = "Wrong_password123"
+        for _ in range(settings.LOGIN_THROTTLE_EMAIL_BURST):
+            response = await client.post("/api/auth/login", json=payload)
+            assert response.status_code == status.HTTP_401_UNAUTHORIZED
+
+        response = await client.post("/api/auth/login", json=valid_login_payload)
+        assert response.status_code == status.HTTP_429_TOO_MANY_REQUESTS
+        assert int(response.headers["retry-after"]) > 0
+
+    async def test_outdated_hash_rehashed_on_login(
+        self, client, session, valid_user_data, valid_login_payload
+    ):
+        weak_hash = CryptContext(schemes=["bcrypt"], bcrypt__rounds=4).hash(
+            valid_user_data["password"]
+        )
+        session.add(User(email=valid_user_data["email"], hashed_password=weak_hash))
+        await session.commit()
+
+        response = await client.post("/api/auth/login", json=valid_login_payload)
+        assert response.status_code == status.HTTP_200_OK
+
+        new_hash = await session.scalar(
+            select(User.hashed_password).where(User.email == valid_user_data["email"])
+        )
+        assert new_hash != weak_hash
+        assert new_hash.startswith(f"$2b${settings.BCRYPT_ROUNDS:02d}$")
+
+        response = await client.post("/api/auth/login", json=valid_login_payload)
+        assert response.status_code == status.HTTP_200_OK
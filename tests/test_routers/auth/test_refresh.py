@@ -1,6 +1,11 @@
+from datetime import timedelta
+
 import pytest
 from fastapi import status
 
+from app.core.revocation import revocation_list
+from app.core.security import create_token
+
 from tests.test_routers.auth.conftest import (
     get_invalid_refresh_payload_cases,
     get_invalid_refresh_tokens,
@@ -35,3 +40,81 @@ class TestRefreshToken:
     async def test_invalid_payload_structure(self, client, payload, desc):
         response = await client.post("/api/auth/refresh", json=payload)
         assert response.status_code == status.HTTP_422_UNPROCESSABLE_ENTITY
+
+    async def test_refresh_rotates_token(self, client, user_with_refresh_token):
+        _, refresh_token = user_with_refresh_token
+        response = await client.post(
+            "/api/auth/refresh", json={"refresh_token": refresh_token}
+        )
+
+        assert response.status_code == status.HTTP_200_OK
+        new_refresh_token = response.json()["refresh_token"]
+        assert new_refresh_token != refresh_token
+
+        response = await client.post(
+            "/api/auth/refresh", json={"refresh_token": new_refresh_token}
+        )
+        assert response.status_code == status.HTTP_200_OK
+
+    async def test_reused_refresh_token_rejected(self, client, user_with_refresh_token):
+        _, refresh_token = user_with_refresh_token
+        payload = {"refresh_token": refresh_token}
+        await client.post("/api/auth/refresh", json=payload)
+
+        response = await client.post("/api/auth/refresh", json=payload)
+        assert response.status_code == status.HTTP_401_UNAUTHORIZED
+        assert response.json()["error"]["type"] == "RevokedTokenError"
+
+    async def test_reuse_detected_without_filter(self, client, user_with_refresh_token):
+        _, refresh_token = user_with_refresh_token
+        payload = {"refresh_token": refresh_token}
+        await client.post("/api/auth/refresh", json=payload)
+        revocation_list.filter.clear()
+
+        response = await client.post("/api/auth/refresh", json=payload)
+        assert response.status_code == status.HTTP_401_UNAUTHORIZED
+
+    async def test_fresh_token_checked_without_db(self, client, user_with_refresh_token):
+        _, refresh_token = user_with_refresh_token
+        await client.post("/api/auth/refresh", json={"refresh_token": refresh_token})
+
+        assert revocation_list.stats()["checks"] == 1
+        assert revocation_list.stats()["db_checks"] == 0
+
+    async def test_refresh_token_without_jti(self, client, user_with_refresh_token):
+        user, _ = user_with_refresh_token
+        token = create_token(
+            {"sub": str(user.id), "type": "refresh"}, timedelta(minutes=5)
+        )
+
+        response = await client.post("/api/auth/refresh", json={"refresh_token": token})
+        assert response.status_code == status.HTTP_401_UNAUTHORIZED
+
+
+@pytest.mark.asyncio
+class TestLogout:
+    async def test_logout_revokes_refresh_token(self, client, user_with_refresh_token):
+        _, refresh_token = user_with_refresh_token
+        payload = {"refresh_token": refresh_token}
+
+        response = await client.post("/api/auth/logout", json=payload)
+        assert response.status_code == status.HTTP_204_NO_CONTENT
+        assert response.content == b""
+
+        response = await client.post("/api/auth/refresh", json=payload)
+        assert response.status_code == status.HTTP_401_UNAUTHORIZED
+
+    async def test_logout_is_idempotent(self, client, user_with_refresh_token):
+        _, refresh_token = user_with_refresh_token
+        payload = {"refresh_token": refresh_token}
+        await client.post("/api/auth/logout", json=payload)
+
+        response = await client.post("/api/auth/logout", json=payload)
+        assert response.status_code == status.HTTP_204_NO_CONTENT
+
+    @pytest.mark.parametrize("refresh_token, desc", get_invalid_refresh_tokens())
+    async def test_invalid_refresh_tokens(self, client, refresh_token, desc):
+        response = await client.post(
+            "/api/auth/logout", json={"refresh_token": refresh_token}
+        )
+        assert response.status_code == status.HTTP_401_UNAUTHORIZED
@@ -0,0 +1,45 @@
+import pytest
+from passlib.context import CryptContext
+
+from app.api.schemas.user import UserResponse
+from app.db.models import User, UserRole
+from app.services.auth_service import AuthService
+
+pwd_context = CryptContext(schemes=["bcrypt"], deprecated="auto")
+
+
+@pytest.fixture
+async def user(session):
+    user = User(
+        email="user@example.com",
+        hashed_password=pwd_context.hash("Strong_p@ss123"),
+    )
+    session.add(user)
+    await session.commit()
+    await session.refresh(user)
+    return UserResponse.model_validate(user)
+
+
+@pytest.fixture
+async def admin(session):
+    admin = User(
+        email="admin@example.com",
+        hashed_password=pwd_context.hash("Strong_p@ss123"),
+        role=UserRole.ADMIN,
+    )
+    session.add(admin)
+    await session.commit()
+    await session.refresh(admin)
+    return UserResponse.model_validate(admin)
+
+
+@pytest.fixture
+def user_headers(user):
+    token = AuthService.create_access_token(user.id)
+    return {"Authorization": f"Bearer {token}"}
+
+
+@pytest.fixture
+def admin_headers(admin):
+    token = AuthService.create_access_token(admin.id)
+    return {"Authorization": f"Bearer {token}"}
@@ -0,0 +1,71 @@
+import jwt
+import pytest
+from fastapi import status
+from sqlalchemy import delete
+
+from app.core.config import settings
+from app.db.models import User
+
+
+@pytest.fixture
+def claims_mode(monkeypatch):
+    monkeypatch.setattr(settings, "ACCESS_TOKEN_CLAIMS_MODE", True)
+
+
+@pytest.mark.asyncio
+class TestClaimsMode:
+    async def test_login_embeds_role_and_email(self, client, admin, claims_mode):
+        response = await client.post(
+            "/api/auth/login",
+            json={"email": admin.email, "password": "Strong_p@ss123"},
+        )
+        assert response.status_code == status.HTTP_200_OK
+
+        payload = jwt.decode(
+            response.json()["access_token"],
+            settings.SECRET_KEY,
+            algorithms=[settings.ALGORITHM],
+        )
+        assert payload["role"] == "ADMIN"
+        assert payload["email"] == admin.email
+
+    async def test_authorizes_without_database(
+        self, client, session, admin, claims_mode
+    ):
+        response = await client.post(
+            "/api/auth/login",
+            json={"email": admin.email, "password": "Strong_p@ss123"},
+        )
+        headers = {"Authorization": f"Bearer {response.json()['access_token']}"}
+
+        await session.execute(delete(User))
+        await session.commit()
+
+        response = await client.get("/api/users/admin", headers=headers)
+        assert response.status_code == status.HTTP_200_OK
+
+    async def test_token_without_claims_falls_back_to_database(
+        self, client, admin_headers, claims_mode
+    ):
+        response = await client.get("/api/users/admin", headers=admin_headers)
+        assert response.status_code == status.HTTP_200_OK
+
+    async def test_refresh_issues_token_with_claims(
+        self, client, user, claims_mode
+    ):
+        response = await client.post(
+            "/api/auth/login",
+            json={"email": user.email, "password": "Strong_p@ss123"},
+        )
+        response = await client.post(
+            "/api/auth/refresh",
+            json={"refresh_token": response.json()["refresh_token"]},
+        )
+        assert response.status_code == status.HTTP_200_OK
+
+        payload = jwt.decode(
+            response.json()["access_token"],
+            settings.SECRET_KEY,
+            algorithms=[settings.ALGORITHM],
+        )
+        assert payload["role"] == "USER"
@@ -0,0 +1,99 @@
+import pytest
+from fastapi import status
+
+from app.repositories.user_repository import UserRepository
+from app.utils.http_cache import etag_matches, weak_etag
+
+
+@pytest.mark.parametrize(
+    "if_none_match, matches",
+    [
+        (None, False),
+        ("", False),
+        ("*", True),
+        ('W/"abc"', True),
+        ('"abc"', True),
+        ('W/"other", W/"abc"', True),
+        ('W/"other"', False),
+    ],
+)
+def test_etag_matches(if_none_match, matches):
+    assert etag_matches(if_none_match, 'W/"abc"') is matches
+
+
+def test_weak_etag_depends_on_every_part():
+    assert weak_etag("me:1", "id", "a@example.com").startswith('W/"')
+    assert weak_etag("me:1", "id", "a@example.com") != weak_etag("me:2", "id", "a@example.com")
+    assert weak_etag("me:1", "id", "a@example.com") != weak_etag("me:1", "id", "b@example.com")
+
+
+@pytest.mark.asyncio
+class TestConditionalGet:
+    async def test_me_sets_validators(self, client, user_headers):
+        response = await client.get("/api/users/me", headers=user_headers)
+
+        assert response.status_code == status.HTTP_200_OK
+        assert response.headers["etag"].startswith('W/"')
+        assert response.headers["cache-control"] == "private, no-cache"
+        assert response.headers["vary"] == "Authorization"
+
+    async def test_matching_etag_returns_304(self, client, user_headers):
+        etag = (await client.get("/api/users/me", headers=user_headers)).headers["etag"]
+
+        response = await client.get(
+            "/api/users/me", headers={**user_headers, "If-None-Match": etag}
+        )
+
+        assert response.status_code == status.HTTP_304_NOT_MODIFIED
+        assert response.content == b""
+        assert response.headers["etag"] == etag
+        assert response.headers["vary"] == "Authorization"
+
+    async def test_stale_etag_returns_body(self, client, user_headers):
+        response = await client.get(
+            "/api/users/me", headers={**user_headers, "If-None-Match": 'W/"stale"'}
+        )
+
+        assert response.status_code == status.HTTP_200_OK
+        assert "message" in response.json()
+
+    async def test_etag_changes_with_principal(self, client, session, user, user_headers):
+        etag = (await client.get("/api/users/me", headers=user_headers)).headers["etag"]
+
+        await UserRepository(session).update(user.id, {"email": "new@example.com"})
+        await session.commit()
+
+        response = await client.get(
+            "/api/users/me", headers={**user_headers, "If-None-Match": etag}
+        )
+        assert response.status_code == status.HTTP_200_OK
+        assert response.headers["etag"] != etag
+
+    async def test_etag_is_per_route(self, client, admin_headers):
+        me = await client.get("/api/users/me", headers=admin_headers)
+        admin = await client.get(
+            "/api/users/admin",
+            headers={**admin_headers, "If-None-Match": me.headers["etag"]},
+        )
+
+        assert admin.status_code == status.HTTP_200_OK
+        assert admin.headers["etag"] != me.headers["etag"]
+
+    async def test_public_anonymous_revalidates(self, client, user_headers):
+        anonymous = await client.get("/api/users/public")
+        response = await client.get(
+            "/api/users/public", headers={"If-None-Match": anonymous.headers["etag"]}
+        )
+        assert response.status_code == status.HTTP_304_NOT_MODIFIED
+
+        user = await client.get(
+            "/api/users/public",
+            headers={**user_headers, "If-None-Match": anonymous.headers["etag"]},
+        )
+        assert user.status_code == status.HTTP_200_OK
+
+    async def test_list_users_not_stored(self, client, admin_headers):
+        response = await client.get("/api/users", headers=admin_headers)
+
+        assert response.headers["cache-control"] == "no-store"
+        assert response.headers["vary"] == "Authorization"
@@ -0,0 +1,86 @@
+import json
+
+import pytest
+from fastapi import status
+
+from app.core.config import settings
+
+
+def ndjson(*rows):
+    return "\n".join(row if isinstance(row, str) else json.dumps(row) for row in rows)
+
+
+@pytest.mark.asyncio
+class TestImportUsers:
+    async def test_imports_and_reports_rows(self, client, admin, admin_headers):
+        body = ndjson(
+            {"email": "first@example.com", "password": "Strong_p@ss1"},
+            {"email": "second@example.com", "password": "Strong_p@ss2", "role": "ADMIN"},
+            "",
+            {"email": admin.email, "password": "Strong_p@ss3"},
+            {"email": "first@example.com", "password": "Strong_p@ss4"},
+            {"email": "bad-email", "password": "Strong_p@ss5"},
+            "{not json",
+        )
+
+        response = await client.post(
+            "/api/users/import", content=body, headers=admin_headers
+        )
+        assert response.status_code == status.HTTP_200_OK
+
+        result = response.json()
+        assert result["created"] == 2
+        assert [row["line"] for row in result["conflicts"]] == [4, 5]
+        assert [row["line"] for row in result["errors"]] == [6, 7]
+
+        response = await client.post(
+            "/api/auth/login",
+            json={"email": "second@example.com", "password": "Strong_p@ss2"},
+        )
+        assert response.status_code == status.HTTP_200_OK
+
+    async def test_imports_in_batches(
+        self, client, admin_headers, monkeypatch
+    ):
+        monkeypatch.setattr(settings, "BULK_IMPORT_BATCH_SIZE", 2)
+        body = ndjson(
+            *({"email": f"user{i}@example.com", "password": "Strong_p@ss1"} for i in range(5))
+        )
+
+        response = await client.post(
+            "/api/users/import", content=body, headers=admin_headers
+        )
+        assert response.json()["created"] == 5
+
+    async def test_duplicates_detected_across_batches(
+        self, client, admin_headers, monkeypatch
+    ):
+        monkeypatch.setattr(settings, "BULK_IMPORT_BATCH_SIZE", 2)
+        body = ndjson(
+            {"email": "first@example.com", "password": "Strong_p@ss1"},
+            {"email": "second@example.com", "password": "Strong_p@ss2"},
+            {"email": "first@example.com", "password": "Strong_p@ss3"},
+        )
+
+        response = await client.post(
+            "/api/users/import", content=body, headers=admin_headers
+        )
+        assert response.json()["conflicts"] == [
+            {"line": 3, "email": "first@example.com", "error": "Duplicate email in import"}
+        ]
+
+    async def test_rejects_oversized_lines(self, client, admin_headers):
+        body = ndjson("x" * (settings.BULK_IMPORT_MAX_LINE_BYTES + 1))
+
+        response = await client.post(
+            "/api/users/import", content=body, headers=admin_headers
+        )
+        assert response.json()["errors"] == [
+            {"line": 1, "email": None, "error": "Line is too long"}
+        ]
+
+    async def test_forbidden_for_user(self, client, user_headers):
+        response = await client.post(
+            "/api/users/import", content="", headers=user_headers
+        )
+        assert response.status_code == status.HTTP_403_FORBIDDEN
@@ -0,0 +1,80 @@
+import pytest
+from fastapi import status
+
+from app.db.models import User
+
+
+@pytest.fixture
+async def many_users(session, admin):
+    emails = [f"user{i:02d}@example.com" for i in range(7)]
+    session.add_all(User(email=email, hashed_password="hashed") for email in emails)
+    await session.commit()
+    return sorted(emails + [admin.email])
+
+
+async def collect_pages(client, headers, **params):
+    pages = []
+    cursor = None
+    while True:
+        query = {**params, **({"cursor": cursor} if cursor else {})}
+        response = await client.get("/api/users", params=query, headers=headers)
+        assert response.status_code == status.HTTP_200_OK
+        page = response.json()
+        pages.append(page["items"])
+        cursor = page["next_cursor"]
+        if cursor is None:
+            return pages
+
+
+@pytest.mark.asyncio
+class TestListUsers:
+    async def test_pages_by_email(self, client, admin_headers, many_users):
+        pages = await collect_pages(client, admin_headers, limit=3, order_by="email")
+
+        assert [len(page) for page in pages] == [3, 3, 2]
+        assert [user["email"] for page in pages for user in page] == many_users
+
+    async def test_pages_by_id(self, client, admin_headers, many_users):
+        pages = await collect_pages(client, admin_headers, limit=5)
+
+        ids = [user["id"] for page in pages for user in page]
+        assert ids == sorted(ids)
+        assert len(set(ids)) == len(many_users)
+
+    async def test_forbidden_for_user(self, client, user_headers):
+        response = await client.get("/api/users", headers=user_headers)
+        assert response.status_code == status.HTTP_403_FORBIDDEN
+
+    @pytest.mark.parametrize(
+        "cursor", ["garbage", "W10", "WyJ4Il0", "WzEyM10", "W1sxXV0", "W251bGxd"]
+    )
+    async def test_invalid_cursor(self, client, admin_headers, cursor):
+        response = await client.get(
+            "/api/users", params={"cursor": cursor}, headers=admin_headers
+        )
+        assert response.status_code == status.HTTP_400_BAD_REQUEST
+
+    @pytest.mark.parametrize("limit", [0, 501])
+    async def test_invalid_limit(self, client, admin_headers, limit):
+        response = await client.get(
+            "/api/users", params={"limit": limit}, headers=admin_headers
+        )
+        assert response.status_code == status.HTTP_422_UNPROCESSABLE_ENTITY
+
+    async def test_fields_are_pushed_down(self, client, admin_headers, many_users):
+        response = await client.get(
+            "/api/users",
+            params={"fields": "email", "order_by": "email", "limit": 2},
+            headers=admin_headers,
+        )
+        assert response.status_code == status.HTTP_200_OK
+
+        page = response.json()
+        assert page["items"] == [{"email": email} for email in many_users[:2]]
+        assert page["next_cursor"] is not None
+
+    async def test_unknown_fields(self, client, admin_headers):
+        response = await client.get(
+            "/api/users", params={"fields": "email,password"}, headers=admin_headers
+        )
+        assert response.status_code == status.HTTP_422_UNPROCESSABLE_ENTITY
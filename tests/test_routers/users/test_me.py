@@ -0,0 +1,68 @@
+import time
+
+import pytest
+from fastapi import status
+
+from app.core.cache import principal_cache
+from app.repositories.user_repository import UserRepository
+
+
+@pytest.mark.asyncio
+class TestGetMe:
+    async def test_get_me(self, client, user, user_headers):
+        response = await client.get("/api/users/me", headers=user_headers)
+        assert response.status_code == status.HTTP_200_OK
+        assert str(user.id) in response.json()["message"]
+
+    async def test_get_me_without_token(self, client):
+        response = await client.get("/api/users/me")
+        assert response.status_code == status.HTTP_401_UNAUTHORIZED
+
+    async def test_get_me_with_invalid_token(self, client):
+        response = await client.get(
+            "/api/users/me", headers={"Authorization": "Bearer garbage"}
+        )
+        assert response.status_code == status.HTTP_401_UNAUTHORIZED
+
+    async def test_admin_route_forbidden_for_user(self, client, user_headers):
+        response = await client.get("/api/users/admin", headers=user_headers)
+        assert response.status_code == status.HTTP_403_FORBIDDEN
+
+    async def test_admin_route(self, client, admin_headers):
+        response = await client.get("/api/users/admin", headers=admin_headers)
+        assert response.status_code == status.HTTP_200_OK
+
+    async def test_public_route_without_token(self, client):
+        response = await client.get("/api/users/public")
+        assert response.status_code == status.HTTP_200_OK
+        assert response.json() == {"message": "no user"}
+
+
+@pytest.mark.asyncio
+class TestPrincipalCache:
+    async def test_second_request_served_from_cache(self, client, user, user_headers):
+        await client.get("/api/users/me", headers=user_headers)
+        hits = principal_cache.hits
+
+        response = await client.get("/api/users/me", headers=user_headers)
+        assert response.status_code == status.HTTP_200_OK
+        assert principal_cache.hits == hits + 1
+
+    async def test_update_invalidates_cache(self, client, session, user, user_headers):
+        await client.get("/api/users/me", headers=user_headers)
+        assert principal_cache.get(str(user.id)) is not None
+
+        await UserRepository(session).update(user.id, {"email": "new@example.com"})
+        await session.commit()
+        assert principal_cache.get(str(user.id)) is None
+
+        response = await client.get("/api/users/me", headers=user_headers)
+        assert "new@example.com" in response.json()["message"]
+
+    async def test_stale_principal_cached_before_commit_is_dropped(self, session, user):
+        await UserRepository(session).update(user.id, {"email": "renamed@example.com"})
+        # Параллельный запрос успел закешировать строку до коммита.
+        principal_cache.set(str(user.id), "stale", time.time() + 60)
+
+        await session.commit()
+        assert principal_cache.get(str(user.id)) is None
@@ -0,0 +1,78 @@
+import os
+
+import pytest
+
+from app import server
+from app.core.config import settings
+
+
+@pytest.fixture
+def cgroup(tmp_path):
+    def write(content):
+        path = tmp_path / "cpu.max"
+        path.write_text(content)
+        return str(path)
+
+    return write
+
+
+def test_available_cpus_respects_cgroup_quota(cgroup, monkeypatch):
+    monkeypatch.setattr(os, "sched_getaffinity", lambda pid: set(range(16)))
+
+    assert server.available_cpus(cgroup("250000 100000\n")) == 3
+    assert server.available_cpus(cgroup("max 100000\n")) == 16
+    assert server.available_cpus(cgroup("50000 100000\n")) == 1
+    assert server.available_cpus("/nonexistent/cpu.max") == 16
+
+
+@pytest.mark.parametrize(
+    "workers, pool_size, max_overflow",
+    [(1, 5, 10), (6, 5, 10), (9, 5, 5), (16, 5, 0), (30, 3, 0)],
+)
+def test_worker_limits_fit_connection_budget(monkeypatch, workers, pool_size, max_overflow):
+    monkeypatch.setattr(settings, "DB_MAX_CONNECTIONS", 100)
+    monkeypatch.setattr(settings, "DB_RESERVED_CONNECTIONS", 10)
+    monkeypatch.setattr(settings, "DB_POOL_SIZE", 5)
+    monkeypatch.setattr(settings, "DB_MAX_OVERFLOW", 10)
+
+    limits = server.worker_limits(workers)
+
+    assert limits["DB_POOL_SIZE"] == pool_size
+    assert limits["DB_MAX_OVERFLOW"] == max_overflow
+    assert workers * (pool_size + max_overflow) <= 90
+
+
+def test_hasher_workers_split_cpus(monkeypatch):
+    monkeypatch.setattr(settings, "PASSWORD_HASHER_WORKERS", 0)
+    monkeypatch.setattr(server, "available_cpus", lambda: 16)
+
+    assert server.worker_limits(4)["PASSWORD_HASHER_WORKERS"] == 4
+    assert server.worker_limits(32)["PASSWORD_HASHER_WORKERS"] == 1
+
+
+def test_max_requests_jitter_applied_per_load(monkeypatch):
+    monkeypatch.setattr(server.uvicorn.Config, "load", lambda self: None)
+    limits = set()
+    for _ in range(50):
+        config = server.ServerConfig(
+            "app.main:app", limit_max_requests=1000, max_requests_jitter=100
+        )
+        config.load()
+        limits.add(config.limit_max_requests)
+
+    assert min(limits) >= 1000
+    assert max(limits) <= 1100
+    assert len(limits) > 1
+
+
+def test_build_config_from_settings(monkeypatch):
+    monkeypatch.setattr(settings, "SERVER_LIMIT_CONCURRENCY", 0)
+    monkeypatch.setattr(settings, "SERVER_MAX_REQUESTS", 5000)
+
+    config = server.build_config(4)
+
+    assert config.workers == 4
+    assert config.loop == settings.SERVER_LOOP
+    assert config.http == settings.SERVER_HTTP
+    assert config.limit_concurrency is None
+    assert config.limit_max_requests == 5000
@@ -0,0 +1,72 @@
+import logging
+
+import pytest
+from sqlalchemy.exc import OperationalError
+
+from app.core.config import settings
+from app.errors.exceptions import DatabaseError
+from app.utils.logging_decorators import (
+    db_operation_metrics,
+    last_statement,
+    log_db_operation,
+)
+
+
+class FakeRepository:
+    @log_db_operation("Поиск")
+    async def find(self, value, statement="SELECT 1"):
+        last_statement.set(statement)
+        return value
+
+    @log_db_operation("Сбой")
+    async def fail(self):
+        raise OperationalError("SELECT 1", {}, Exception("boom"))
+
+
+@pytest.fixture(autouse=True)
+def reset_metrics():
+    db_operation_metrics.reset()
+    yield
+    db_operation_metrics.reset()
+
+
+async def test_records_latency_per_operation():
+    repo = FakeRepository()
+    assert await repo.find(1) == 1
+    assert await repo.find(2) == 2
+
+    snapshot = db_operation_metrics.snapshot()["FakeRepository.find"]
+    assert snapshot["count"] == 2
+    assert snapshot["errors"] == 0
+
+
+async def test_preserves_function_metadata():
+    assert FakeRepository.find.__name__ == "find"
+
+
+async def test_translates_errors_and_counts_them():
+    with pytest.raises(DatabaseError):
+        await FakeRepository().fail()
+
+    snapshot = db_operation_metrics.snapshot()["FakeRepository.fail"]
+    assert snapshot["count"] == 1
+    assert snapshot["errors"] == 1
+
+
+async def test_logs_slow_operation_with_sql(monkeypatch, caplog):
+    monkeypatch.setattr(settings, "DB_SLOW_OPERATION_MS", 0)
+
+    with caplog.at_level(logging.WARNING, logger="app.utils.logging_decorators"):
+        await FakeRepository().find(1, statement="SELECT * FROM users")
+
+    (record,) = caplog.records
+    assert record.db_operation == "FakeRepository.find"
+    assert record.sql == "SELECT * FROM users"
+    assert record.duration_ms >= 0
+
+
+async def test_fast_operation_is_not_logged(caplog):
+    with caplog.at_level(logging.WARNING, logger="app.utils.logging_decorators"):
+        await FakeRepository().find(1)
+
+    assert caplog.records == []
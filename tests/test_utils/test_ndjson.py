@@ -0,0 +1,26 @@
+import pytest
+
+from app.utils.ndjson import iter_ndjson_lines
+
+
+async def collect(chunks, max_line_bytes=16):
+    async def stream():
+        for chunk in chunks:
+            yield chunk
+
+    return [item async for item in iter_ndjson_lines(stream(), max_line_bytes)]
+
+
+@pytest.mark.asyncio
+async def test_many_lines_in_one_chunk():
+    assert await collect([b"a\n\nb\nc"]) == [(1, b"a"), (3, b"b"), (4, b"c")]
+
+
+@pytest.mark.asyncio
+async def test_line_split_across_chunks():
+    assert await collect([b"ab", b"c\nd", b"e\n"]) == [(1, b"abc"), (2, b"de")]
+
+
+@pytest.mark.asyncio
+async def test_oversized_line_across_chunks():
+    assert await collect([b"x" * 10, b"x" * 10, b"x\nok\n"]) == [(1, None), (2, b"ok")]
@@ -0,0 +1,65 @@
+import logging
+
+from fastapi import FastAPI
+from httpx import ASGITransport, AsyncClient
+
+from app.utils.timing import ServerTimingMiddleware, format_server_timing, span
+
+
+def build_app() -> FastAPI:
+    app = FastAPI()
+    app.add_middleware(ServerTimingMiddleware)
+
+    @app.get("/work")
+    async def work():
+        with span("db"):
+            pass
+        with span("db"):
+            pass
+        with span("hash"):
+            pass
+        return {"ok": True}
+
+    return app
+
+
+async def request(app: FastAPI, path: str):
+    async with AsyncClient(
+        transport=ASGITransport(app=app), base_url="http://test"
+    ) as client:
+        return await client.get(path)
+
+
+def test_span_outside_request_is_noop():
+    with span("db"):
+        pass
+
+
+def test_format_server_timing():
+    header = format_server_timing({"db": [1.234, 2], "hash": [250.0, 1]}, 260.5)
+    assert header == "db;dur=1.23, hash;dur=250.00, total;dur=260.50"
+
+
+async def test_adds_server_timing_header():
+    response = await request(build_app(), "/work")
+
+    metrics = [item.split(";")[0] for item in response.headers["server-timing"].split(", ")]
+    assert metrics == ["db", "hash", "total"]
+
+
+async def test_header_present_on_error_responses():
+    response = await request(build_app(), "/missing")
+
+    assert response.status_code == 404
+    assert response.headers["server-timing"].startswith("total;dur=")
+
+
+async def test_writes_access_log_with_phases(caplog):
+    with caplog.at_level(logging.INFO, logger="app.access"):
+        await request(build_app(), "/work")
+
+    (record,) = caplog.records
+    assert record.path == "/work"
+    assert record.status_code == 200
+    assert record.phases["db"]["count"] == 2
+    assert record.phases["hash"]["count"] == 1
@@ -0,0 +1,157 @@
+import asyncpg
+import pytest
+from sqlalchemy.ext.asyncio import async_sessionmaker
+
+from app.core.config import settings
+from app.db.database import build_engine
+from app.utils.unitofwork import UnitOfWork
+
+
+class FakeSession:
+    def __init__(self):
+        self.transaction = False
+        self.commits = 0
+        self.rollbacks = 0
+        self.closed = False
+
+    def in_transaction(self):
+        return self.transaction
+
+    async def commit(self):
+        self.commits += 1
+        self.transaction = False
+
+    async def rollback(self):
+        self.rollbacks += 1
+        self.transaction = False
+
+    async def close(self):
+        self.closed = True
+
+
+@pytest.fixture
+def sessions():
+    return []
+
+
+@pytest.fixture
+def uow(sessions):
+    def session_factory(**kwargs):
+        sessions.append(FakeSession())
+        return sessions[-1]
+
+    uow = UnitOfWork()
+    uow.session_factory = session_factory
+    return uow
+
+
+@pytest.mark.asyncio
+class TestUnitOfWork:
+    async def test_write_block_rolls_back_and_closes(self, uow, sessions):
+        async with uow:
+            pass
+
+        assert len(sessions) == 1
+        assert sessions[0].rollbacks == 1
+        assert sessions[0].closed
+        assert uow.session is None
+
+    async def test_write_after_read_only_gets_new_session(self, uow, sessions):
+        uow.request_scoped = True
+
+        async with uow.read_only():
+            pass
+        async with uow:
+            pass
+
+        assert len(sessions) == 2
+        assert sessions[0].rollbacks == 0
+        assert sessions[0].closed
+
+    async def test_nested_blocks_share_session(self, uow, sessions):
+        async with uow:
+            async with uow.read_only():
+                pass
+            assert not sessions[0].closed
+
+        assert len(sessions) == 1
+        assert sessions[0].rollbacks == 1
+
+    async def test_request_scoped_reuses_session(self, uow, sessions):
+        uow.request_scoped = True
+
+        async with uow as write_uow:
+            sessions[0].transaction = True
+            await write_uow.commit()
+        async with uow.read_only():
+            sessions[0].transaction = True
+        async with uow.read_only():
+            pass
+
+        assert len(sessions) == 1
+        assert not sessions[0].closed
+        assert sessions[0].rollbacks == 0
+
+        await uow.close()
+        assert sessions[0].closed
+
+    async def test_request_scoped_discards_uncommitted_writes(self, uow, sessions):
+        uow.request_scoped = True
+
+        async with uow:
+            sessions[0].transaction = True
+
+        assert sessions[0].rollbacks == 1
+        assert sessions[0].closed
+
+    async def test_request_scoped_tears_down_on_error(self, uow, sessions):
+        uow.request_scoped = True
+
+        with pytest.raises(RuntimeError):
+            async with uow.read_only():
+                raise RuntimeError()
+
+        assert sessions[0].closed
+        assert uow.session is None
+
+
+@pytest.fixture
+async def pg_uow():
+    engine = build_engine(settings.ASYNC_DATABASE_URL)
+    uow = UnitOfWork()
+    uow.engine = engine
+    uow.session_factory = async_sessionmaker(engine)
+    # Первое подключение диалект инициализирует в своей транзакции.
+    async with engine.connect():
+        pass
+    yield uow
+    await engine.dispose()
+
+
+@pytest.fixture
+def transactions(monkeypatch):
+    counts = {"begin": 0, "rollback": 0}
+
+    def counting(name, method):
+        async def wrapper(self, *args, **kwargs):
+            counts[name] += 1
+            return await method(self, *args, **kwargs)
+
+        return wrapper
+
+    Transaction = asyncpg.transaction.Transaction
+    monkeypatch.setattr(Transaction, "start", counting("begin", Transaction.start))
+    monkeypatch.setattr(Transaction, "rollback", counting("rollback", Transaction.rollback))
+    return counts
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize("read_only, expected", [(False, 5), (True, 0)])
+async def test_read_only_blocks_open_no_transaction(
+    pg_uow, transactions, read_only, expected
+):
+    for _ in range(5):
+        async with pg_uow.read_only() if read_only else pg_uow as uow:
+            assert await uow.user_repo.find_by_email("nobody@example.com") is None
+
+    assert transactions == {"begin": expected, "rollback": expected}